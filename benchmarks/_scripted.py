@@ -0,0 +1,142 @@
+"""Scripted in-process model shared by the benchmarks.
+
+Everything here runs offline: responses and stream events are real
+``openai`` objects built once up front, so the benchmarks measure
+literun's own overhead and not the network.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from itertools import cycle
+from typing import Any
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, SRC)
+
+from pydantic import PrivateAttr
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseTextDeltaEvent,
+    ResponseOutputItemDoneEvent,
+)
+
+from literun import ChatOpenAI
+
+USAGE = {
+    "input_tokens": 10,
+    "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+    "output_tokens": 2,
+    "output_tokens_details": {"reasoning_tokens": 0},
+    "total_tokens": 12,
+}
+
+
+def message_item(text: str) -> dict[str, Any]:
+    """Build an assistant message output item."""
+    return {
+        "type": "message",
+        "id": "msg_1",
+        "role": "assistant",
+        "status": "completed",
+        "content": [{"type": "output_text", "text": text, "annotations": []}],
+    }
+
+
+def tool_call_item(name: str, arguments: str, index: int = 0) -> dict[str, Any]:
+    """Build a function call output item."""
+    return {
+        "type": "function_call",
+        "id": f"fc_{index}",
+        "call_id": f"call_{index}",
+        "name": name,
+        "arguments": arguments,
+        "status": "completed",
+    }
+
+
+def make_response(output: list[dict[str, Any]], response_id: str = "resp_1") -> Response:
+    """Build a completed response with the given output items."""
+    return Response.model_validate(
+        {
+            "id": response_id,
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": USAGE,
+        }
+    )
+
+
+def make_events(deltas: int) -> list:
+    """Build the event sequence of a streamed answer with `deltas` tokens."""
+    response = make_response([message_item("tok " * deltas)])
+    events = [
+        ResponseTextDeltaEvent(
+            type="response.output_text.delta",
+            delta="tok ",
+            item_id="msg_1",
+            output_index=0,
+            content_index=0,
+            logprobs=[],
+            sequence_number=index,
+        )
+        for index in range(deltas)
+    ]
+    events.append(
+        ResponseOutputItemDoneEvent(
+            type="response.output_item.done",
+            item=response.output[0],
+            output_index=0,
+            sequence_number=deltas,
+        )
+    )
+    events.append(
+        ResponseCompletedEvent(
+            type="response.completed", response=response, sequence_number=deltas + 1
+        )
+    )
+    return events
+
+
+class ScriptedLLM(ChatOpenAI):
+    """Replays a script of responses in a loop instead of calling the API.
+
+    Each script entry is a ``Response`` for non-streaming calls or a list
+    of stream events for streaming calls. Only the network call is
+    replaced: request preparation, caching, limits and tracing still run.
+    """
+
+    script: list = []
+
+    _replay: Any = PrivateAttr(default=None)
+
+    def _next(self) -> Any:
+        if self._replay is None:
+            self._replay = cycle(self.script)
+        return next(self._replay)
+
+    def reset(self) -> None:
+        """Restart the script from its first entry."""
+        self._replay = None
+
+    def _create(self, params: dict[str, Any]) -> Any:
+        entry = self._next()
+        return iter(entry) if params.get("stream") else entry
+
+    async def _acreate(self, params: dict[str, Any]) -> Any:
+        entry = self._next()
+        if params.get("stream"):
+            return _aiter(entry)
+        return entry
+
+
+async def _aiter(events: list):
+    for event in events:
+        yield event
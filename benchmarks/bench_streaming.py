@@ -0,0 +1,52 @@
+"""Benchmark streaming throughput of the runner, in events per second per core.
+
+Streams a long scripted answer through ``Agent.stream`` offline and
+compares the default (validated) mode with ``fast=True``. CPU time is
+measured with ``time.process_time``, so the figures are per core.
+
+Usage:
+    python benchmarks/bench_streaming.py [--deltas 5000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+
+from _scripted import ScriptedLLM, make_events
+
+from literun import Agent
+
+
+def measure(agent: Agent, fast: bool, repeat: int) -> float:
+    """Return the best events/second (CPU time) over `repeat` runs."""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.process_time()
+        count = 0
+        for _ in agent.stream(user_input="Hi", fast=fast):
+            count += 1
+        elapsed = time.process_time() - start
+        best = max(best, count / elapsed)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deltas", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    agent = Agent(llm=ScriptedLLM(api_key="bench", script=[make_events(args.deltas)]))
+
+    validated = measure(agent, fast=False, repeat=args.repeat)
+    fast = measure(agent, fast=True, repeat=args.repeat)
+
+    print(f"events per stream: {args.deltas + 2}")
+    print(f"validated (RunResultStreaming): {validated:>12,.0f} events/s/core")
+    print(f"fast (StreamChunk):             {fast:>12,.0f} events/s/core")
+    print(f"speedup:                        {fast / validated:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""A local HTTP server emulating the OpenAI ``/v1/responses`` endpoint.
+
+Used by ``loadgen.py`` to exercise the full client stack (``openai`` SDK,
+``httpx`` connection pool, SSE parsing) without a real backend. Only the
+standard library is used, so the server can also be run on its own:
+
+    python benchmarks/fake_server.py --port 8000 --latency 0.2 --tps 50
+
+Behaviour per request:
+    - Waits ``latency`` seconds before the first byte (time to first token).
+    - Emits ``output_tokens`` tokens at ``tokens_per_second`` (0 = instant),
+      either as SSE ``response.output_text.delta`` events when ``stream`` is
+      set, or as a single JSON body after the same total delay.
+    - Follows the tool-call script: round ``i`` returns the function calls
+      listed in ``tool_rounds[i]``. The round is derived from the number of
+      ``function_call`` items already present in the input, so the server is
+      stateless and any number of sessions can run concurrently. Once all
+      rounds are done, the final text answer is returned.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+import threading
+from itertools import count
+from typing import Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeResponsesServer:
+    """Threaded fake Responses API server.
+
+    Example:
+        with FakeResponsesServer(latency=0.1, tool_rounds=[["search"]]) as server:
+            llm = ChatOpenAI(api_key="fake", base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        tokens_per_second: float = 0.0,
+        output_tokens: int = 20,
+        tool_rounds: list[list[str]] | None = None,
+    ) -> None:
+        """Configure the server. Call ``start`` or use it as a context manager.
+
+        Args:
+            host: The interface to bind.
+            port: The port to bind. 0 picks a free port.
+            latency: Seconds before the first byte of every response.
+            tokens_per_second: Output token rate. 0 sends all tokens at once.
+            output_tokens: Number of tokens in the final answer.
+            tool_rounds: Tool names to call, one list per model turn.
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.tool_rounds = tool_rounds or []
+        self.requests = 0
+        self._ids = count()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.request_queue_size = 1024
+        self._httpd.fake = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """The URL to use as ``ChatOpenAI.base_url``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> FakeResponsesServer:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-responses", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeResponsesServer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # Response construction
+
+    def next_id(self) -> int:
+        with self._lock:
+            self.requests += 1
+            return next(self._ids)
+
+    def output_for(self, input_: Any, request_id: int) -> tuple[list[dict[str, Any]], int]:
+        """Return the output items for a request, and the number of output tokens."""
+        done = 0
+        if isinstance(input_, list):
+            done = sum(1 for item in input_ if item.get("type") == "function_call")
+
+        for names in self.tool_rounds:
+            if done < len(names):
+                calls = [
+                    {
+                        "type": "function_call",
+                        "id": f"fc_{request_id}_{index}",
+                        "call_id": f"call_{request_id}_{index}",
+                        "name": name,
+                        "arguments": '{"query": "load"}',
+                        "status": "completed",
+                    }
+                    for index, name in enumerate(names)
+                ]
+                return calls, 8 * len(calls)
+            done -= len(names)
+
+        message = {
+            "type": "message",
+            "id": f"msg_{request_id}",
+            "role": "assistant",
+            "status": "completed",
+            "content": [
+                {"type": "output_text", "text": "tok " * self.output_tokens, "annotations": []}
+            ],
+        }
+        return [message], self.output_tokens
+
+    @staticmethod
+    def response(
+        request_id: int, body: dict[str, Any], output: list[dict[str, Any]], tokens: int
+    ) -> dict[str, Any]:
+        """Build a completed response object."""
+        input_tokens = len(json.dumps(body.get("input", ""))) // 4
+        return {
+            "id": f"resp_{request_id}",
+            "created_at": int(time.time()),
+            "model": body.get("model", "gpt-4o"),
+            "object": "response",
+            "status": "completed",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+                "output_tokens": tokens,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + tokens,
+            },
+        }
+
+    def token_delay(self) -> float:
+        return 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/v1/responses":
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        fake: FakeResponsesServer = self.server.fake
+        request_id = fake.next_id()
+        output, tokens = fake.output_for(body.get("input"), request_id)
+        response = fake.response(request_id, body, output, tokens)
+
+        time.sleep(fake.latency)
+        if body.get("stream"):
+            self._stream(fake, response, output, tokens)
+        else:
+            time.sleep(fake.token_delay() * tokens)
+            self._send_json(200, response)
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(
+        self,
+        fake: FakeResponsesServer,
+        response: dict[str, Any],
+        output: list[dict[str, Any]],
+        tokens: int,
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        sequence = count()
+        created = dict(response, status="in_progress", output=[], usage=None)
+        self._event({"type": "response.created", "response": created}, sequence)
+
+        delay = fake.token_delay()
+        for index, item in enumerate(output):
+            if item["type"] == "message":
+                for _ in range(tokens):
+                    if delay:
+                        time.sleep(delay)
+                    self._event(
+                        {
+                            "type": "response.output_text.delta",
+                            "delta": "tok ",
+                            "item_id": item["id"],
+                            "output_index": index,
+                            "content_index": 0,
+                            "logprobs": [],
+                        },
+                        sequence,
+                    )
+            elif delay:
+                time.sleep(delay * tokens / len(output))
+            self._event(
+                {"type": "response.output_item.done", "item": item, "output_index": index},
+                sequence,
+            )
+
+        self._event({"type": "response.completed", "response": response}, sequence)
+        self._chunk(b"")
+
+    def _event(self, event: dict[str, Any], sequence: count) -> None:
+        event["sequence_number"] = next(sequence)
+        self._chunk(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode())
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def parse_tool_rounds(spec: str) -> list[list[str]]:
+    """Parse a tool-call script like ``"search,lookup;search"``.
+
+    Rounds are separated by ``;`` and the tools of a round by ``,``.
+    """
+    return [
+        [name.strip() for name in round_.split(",") if name.strip()]
+        for round_ in spec.split(";")
+        if round_.strip()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--tps", type=float, default=0.0, help="Output tokens per second.")
+    parser.add_argument("--output-tokens", type=int, default=20)
+    parser.add_argument("--tools", default="", help='Tool-call script, e.g. "search;lookup".')
+    args = parser.parse_args()
+
+    server = FakeResponsesServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        tokens_per_second=args.tps,
+        output_tokens=args.output_tokens,
+        tool_rounds=parse_tool_rounds(args.tools),
+    )
+    print(f"Serving on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
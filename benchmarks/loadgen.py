@@ -0,0 +1,357 @@
+"""End-to-end load generator against a local fake Responses API server.
+
+Starts ``fake_server.py`` (in a subprocess by default, so it does not compete
+for the GIL), points ``ChatOpenAI.base_url`` at it and runs closed-loop agent
+sessions at increasing concurrency. Each worker starts a new session as soon
+as its previous one finishes, for ``--duration`` seconds per level.
+
+For every runner mode and concurrency level it reports throughput, latency
+percentiles and a latency histogram, plus where the tail comes from: the
+model time, tool time and remaining runner overhead of the slowest 1% of
+sessions, and event loop lag for the async runners.
+
+Usage:
+    python benchmarks/loadgen.py [--modes ainvoke,astream,invoke,stream]
+        [--concurrency 1,8,32,128] [--duration 10] [--latency 0.2] [--tps 50]
+        [--output-tokens 20] [--tools "search;search,lookup"] [--tool-delay 0.05]
+        [--in-process | --base-url URL] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+import platform
+import threading
+import statistics
+import subprocess
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+
+from _scripted import SRC  # noqa: F401  (puts src/ on sys.path)
+from fake_server import FakeResponsesServer, parse_tool_rounds
+
+from literun import Agent, ChatOpenAI, Tool, ArgsSchema, RunTimings
+
+MODES = ("ainvoke", "astream", "invoke", "stream")
+
+LAG_INTERVAL = 0.01
+"""Interval of the event loop lag probe, in seconds."""
+
+
+class Session:
+    """Measurements of one agent session."""
+
+    __slots__ = ("latency", "ttft", "llm_time", "tool_time", "tool_queue_time", "error")
+
+    def __init__(
+        self,
+        latency: float,
+        ttft: float | None = None,
+        timings: RunTimings | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.latency = latency
+        self.ttft = ttft
+        self.llm_time = timings.llm_time if timings else 0.0
+        self.tool_time = timings.tool_time if timings else 0.0
+        self.tool_queue_time = timings.tool_queue_time if timings else 0.0
+        self.error = error
+
+    @property
+    def overhead(self) -> float:
+        """Session time not spent waiting for the model or tools."""
+        return max(self.latency - self.llm_time - self.tool_time - self.tool_queue_time, 0.0)
+
+
+def make_tools(names: set[str], delay: float) -> list[Tool]:
+    def build(name: str) -> Tool:
+        def func(query: str) -> str:
+            time.sleep(delay)
+            return f"{name} result for {query}"
+
+        async def coroutine(query: str) -> str:
+            await asyncio.sleep(delay)
+            return f"{name} result for {query}"
+
+        return Tool(
+            name=name,
+            description=f"The {name} tool",
+            func=func,
+            coroutine=coroutine,
+            args_schema=[ArgsSchema(name="query", type=str)],
+        )
+
+    return [build(name) for name in sorted(names)]
+
+
+# Sessions
+
+
+def run_sync(agent: Agent, mode: str) -> Session:
+    start = time.perf_counter()
+    try:
+        if mode == "invoke":
+            result = agent.invoke(user_input="Hi")
+            return Session(time.perf_counter() - start, timings=result.timings)
+        ttft = timings = None
+        for chunk in agent.stream(user_input="Hi", fast=True):
+            if ttft is None and chunk.event.type == "response.output_text.delta":
+                ttft = time.perf_counter() - start
+            if chunk.event.type == "run.completed":
+                timings = chunk.event.timings
+        return Session(time.perf_counter() - start, ttft, timings)
+    except Exception as e:
+        return Session(time.perf_counter() - start, error=type(e).__name__)
+
+
+async def run_async(agent: Agent, mode: str) -> Session:
+    start = time.perf_counter()
+    try:
+        if mode == "ainvoke":
+            result = await agent.ainvoke(user_input="Hi")
+            return Session(time.perf_counter() - start, timings=result.timings)
+        ttft = timings = None
+        async for chunk in agent.astream(user_input="Hi", fast=True):
+            if ttft is None and chunk.event.type == "response.output_text.delta":
+                ttft = time.perf_counter() - start
+            if chunk.event.type == "run.completed":
+                timings = chunk.event.timings
+        return Session(time.perf_counter() - start, ttft, timings)
+    except Exception as e:
+        return Session(time.perf_counter() - start, error=type(e).__name__)
+
+
+def level_sync(agent: Agent, mode: str, concurrency: int, duration: float) -> tuple[list[Session], list[float]]:
+    sessions: list[Session] = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker() -> None:
+        while time.perf_counter() < deadline:
+            session = run_sync(agent, mode)
+            with lock:
+                sessions.append(session)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    return sessions, []
+
+
+async def level_async(agent: Agent, mode: str, concurrency: int, duration: float) -> tuple[list[Session], list[float]]:
+    sessions: list[Session] = []
+    lags: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            sessions.append(await run_async(agent, mode))
+
+    async def probe() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_INTERVAL)
+            lags.append(time.perf_counter() - start - LAG_INTERVAL)
+
+    prober = asyncio.create_task(probe())
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        prober.cancel()
+    return sessions, lags
+
+
+# Reporting
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+def histogram(values: list[float]) -> list[dict[str, Any]]:
+    """Bucket latencies into power-of-two millisecond buckets."""
+    buckets: dict[int, int] = {}
+    for value in values:
+        upper = 2 ** max(0, math.ceil(math.log2(max(value * 1000, 1))))
+        buckets[upper] = buckets.get(upper, 0) + 1
+    return [{"le_ms": upper, "count": buckets[upper]} for upper in sorted(buckets)]
+
+
+def summarize(sessions: list[Session], lags: list[float], elapsed: float) -> dict[str, Any]:
+    ok = [s for s in sessions if s.error is None]
+    latencies = [s.latency for s in ok]
+    p99 = percentile(latencies, 99)
+    tail = [s for s in ok if p99 is not None and s.latency >= p99]
+    errors: dict[str, int] = {}
+    for s in sessions:
+        if s.error is not None:
+            errors[s.error] = errors.get(s.error, 0) + 1
+
+    ttfts = [s.ttft for s in ok if s.ttft is not None]
+    return {
+        "sessions": len(sessions),
+        "errors": errors,
+        "throughput": len(ok) / elapsed,
+        "latency": {q: percentile(latencies, float(q[1:])) for q in ("p50", "p90", "p99")}
+        | {"max": max(latencies, default=None), "mean": statistics.fmean(latencies) if latencies else None},
+        "ttft": {q: percentile(ttfts, float(q[1:])) for q in ("p50", "p99")} if ttfts else None,
+        "tail": {
+            "llm_time": statistics.fmean(s.llm_time for s in tail) if tail else None,
+            "tool_time": statistics.fmean(s.tool_time for s in tail) if tail else None,
+            "tool_queue_time": statistics.fmean(s.tool_queue_time for s in tail) if tail else None,
+            "overhead": statistics.fmean(s.overhead for s in tail) if tail else None,
+        },
+        "loop_lag": {q: percentile(lags, float(q[1:])) for q in ("p50", "p99")} | {"max": max(lags)} if lags else None,
+        "histogram": histogram(latencies),
+    }
+
+
+def ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+def print_level(mode: str, concurrency: int, summary: dict[str, Any]) -> None:
+    latency, tail = summary["latency"], summary["tail"]
+    print(
+        f"{mode:<8} c={concurrency:<5} {summary['throughput']:>8.1f}/s  "
+        f"p50 {ms(latency['p50']):>8}  p90 {ms(latency['p90']):>8}  p99 {ms(latency['p99']):>8}  "
+        f"max {ms(latency['max']):>8} ms"
+        + (f"  errors {summary['errors']}" if summary["errors"] else "")
+    )
+    detail = (
+        f"{'':<16}p99 tail: llm {ms(tail['llm_time'])} ms, tools {ms(tail['tool_time'])} ms, "
+        f"tool queue {ms(tail['tool_queue_time'])} ms, runner {ms(tail['overhead'])} ms"
+    )
+    if summary["ttft"]:
+        detail += f" | ttft p50 {ms(summary['ttft']['p50'])} p99 {ms(summary['ttft']['p99'])} ms"
+    if summary["loop_lag"]:
+        detail += f" | loop lag p99 {ms(summary['loop_lag']['p99'])} max {ms(summary['loop_lag']['max'])} ms"
+    print(detail)
+
+    total = sum(bucket["count"] for bucket in summary["histogram"]) or 1
+    for bucket in summary["histogram"]:
+        bar = "#" * max(1, round(40 * bucket["count"] / total))
+        print(f"{'':<16}<= {bucket['le_ms']:>6} ms {bucket['count']:>7}  {bar}")
+
+
+# Server
+
+
+def start_server(args: argparse.Namespace) -> tuple[str, Any]:
+    """Start the fake server and return its base URL and a stop function."""
+    if args.base_url:
+        return args.base_url, lambda: None
+
+    if args.in_process:
+        server = FakeResponsesServer(
+            latency=args.latency,
+            tokens_per_second=args.tps,
+            output_tokens=args.output_tokens,
+            tool_rounds=parse_tool_rounds(args.tools),
+        ).start()
+        return server.base_url, server.stop
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-u",
+            __file__.replace("loadgen.py", "fake_server.py"),
+            "--port", "0",
+            "--latency", str(args.latency),
+            "--tps", str(args.tps),
+            "--output-tokens", str(args.output_tokens),
+            "--tools", args.tools,
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline().strip()
+    if not line.startswith("Serving on "):
+        process.kill()
+        raise RuntimeError(f"Fake server failed to start: {line!r}")
+
+    def stop() -> None:
+        process.terminate()
+        process.wait()
+
+    return line.removeprefix("Serving on "), stop
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level.")
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tps", type=float, default=50.0, help="Output tokens per second.")
+    parser.add_argument("--output-tokens", type=int, default=20)
+    parser.add_argument("--tools", default="search", help='Tool-call script, e.g. "search;search,lookup".')
+    parser.add_argument("--tool-delay", type=float, default=0.05)
+    parser.add_argument("--in-process", action="store_true", help="Run the server on a thread of this process.")
+    parser.add_argument("--base-url", help="Use an already running server.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+    names = {name for round_ in parse_tool_rounds(args.tools) for name in round_}
+
+    base_url, stop = start_server(args)
+    results = []
+
+    def report(mode: str, concurrency: int, sessions: list[Session], lags: list[float], elapsed: float) -> None:
+        summary = summarize(sessions, lags, elapsed)
+        print_level(mode, concurrency, summary)
+        results.append({"mode": mode, "concurrency": concurrency, **summary})
+
+    def make_agent() -> Agent:
+        llm = ChatOpenAI(api_key="loadgen", base_url=base_url, max_retries=0)
+        return Agent(llm=llm, tools=make_tools(names, args.tool_delay))
+
+    async def run_async_levels(mode: str) -> None:
+        # All levels share one event loop, as the async client is bound to it
+        agent = make_agent()
+        async with agent.llm:
+            for concurrency in levels:
+                start = time.perf_counter()
+                sessions, lags = await level_async(agent, mode, concurrency, args.duration)
+                report(mode, concurrency, sessions, lags, time.perf_counter() - start)
+
+    try:
+        for mode in modes:
+            if mode.startswith("a"):
+                asyncio.run(run_async_levels(mode))
+                continue
+            agent = make_agent()
+            with agent.llm:
+                for concurrency in levels:
+                    start = time.perf_counter()
+                    sessions, lags = level_sync(agent, mode, concurrency, args.duration)
+                    report(mode, concurrency, sessions, lags, time.perf_counter() - start)
+    finally:
+        stop()
+
+    if args.output:
+        output = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {key: value for key, value in vars(args).items() if key != "output"},
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""Microbenchmarks of literun's own overhead, separate from the network.
+
+Every case runs offline. The runner cases use a scripted in-process model
+(see ``_scripted.py``), so the figures cover request preparation, prompt
+serialization, tool dispatch and result wrapping only.
+
+Results are printed as a table and can be written as JSON. Pass a previous
+JSON file with ``--compare`` to fail (exit code 1) when any case got slower
+than ``--threshold`` times its baseline median, e.g. in CI:
+
+    python benchmarks/microbench.py --output baseline.json
+    python benchmarks/microbench.py --compare baseline.json --threshold 1.25
+
+Usage:
+    python benchmarks/microbench.py [--filter NAME] [--quick]
+        [--output FILE] [--compare FILE] [--threshold 1.25]
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+from typing import Any, Callable
+
+from _scripted import SRC, ScriptedLLM, make_events, make_response, message_item, tool_call_item
+
+from literun import (
+    Agent,
+    Tool,
+    ToolSet,
+    ToolRuntime,
+    ArgsSchema,
+    PromptMessage,
+    PromptTemplate,
+    ChatOpenAI,
+    RunResultStreaming,
+    StreamChunk,
+)
+from literun.events import ResponseTextDeltaEvent
+
+SCHEMA_VERSION = 1
+
+MIN_REPEAT_TIME = 0.05
+"""Target duration of one timed repeat, in seconds."""
+
+
+class Suite:
+    """Collects and times benchmark cases."""
+
+    def __init__(self, repeat: int, pattern: str | None) -> None:
+        self.repeat = repeat
+        self.pattern = pattern
+        self.results: list[dict[str, Any]] = []
+
+    def wants(self, name: str) -> bool:
+        return self.pattern is None or self.pattern in name
+
+    def bench(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        setup: Callable[[], Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Time `func`, calibrating the number of calls per repeat.
+
+        Args:
+            name: The case name.
+            func: The operation to time. Called with the result of `setup`
+                if given.
+            setup: Builds fresh, untimed state for every single call.
+            params: Case parameters recorded in the output.
+        """
+        if not self.wants(name):
+            return
+
+        def run(number: int) -> float:
+            if setup is None:
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                return time.perf_counter() - start
+            total = 0.0
+            for _ in range(number):
+                state = setup()
+                start = time.perf_counter()
+                func(state)
+                total += time.perf_counter() - start
+            return total
+
+        number = 1
+        while True:
+            elapsed = run(number)
+            if elapsed >= MIN_REPEAT_TIME or number >= 1_000_000:
+                break
+            number *= 10 if elapsed < MIN_REPEAT_TIME / 10 else 2
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            samples = [run(number) / number for _ in range(self.repeat)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.record(name, samples, number, params)
+
+    def record(
+        self,
+        name: str,
+        samples: list[float],
+        number: int,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        median = statistics.median(samples)
+        result = {
+            "name": name,
+            "params": params or {},
+            "unit": "s",
+            "number": number,
+            "repeat": len(samples),
+            "min": min(samples),
+            "median": median,
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "ops_per_sec": 1 / median if median else None,
+        }
+        self.results.append(result)
+        print(f"{name:<48} {format_time(median):>10}   {format_time(min(samples)):>10}")
+
+
+# Fixtures
+
+
+def make_messages(count: int) -> list[PromptMessage]:
+    """Build a realistic history: system prompt, then user/tool/assistant turns."""
+    messages = [PromptMessage(role="system", text="You are helpful.", content_type="text")]
+    while len(messages) < count:
+        turn = len(messages)
+        messages.append(PromptMessage(role="user", text=f"question {turn}", content_type="text"))
+        messages.append(
+            PromptMessage(
+                name="search",
+                arguments='{"query": "q"}',
+                call_id=f"call_{turn}",
+                content_type="tool_call",
+            )
+        )
+        messages.append(
+            PromptMessage(
+                call_id=f"call_{turn}", output="result " * 20, content_type="tool_call_output"
+            )
+        )
+        messages.append(PromptMessage(role="assistant", text="answer", content_type="text"))
+    return messages[:count]
+
+
+def make_template(messages: list[PromptMessage]) -> PromptTemplate:
+    return PromptTemplate().add_messages(messages)
+
+
+def make_tools(count: int) -> list[Tool]:
+    return [
+        Tool(
+            name=f"tool_{index}",
+            description=f"Tool number {index}",
+            func=lambda query, limit=10: query,
+            args_schema=[
+                ArgsSchema(name="query", type=str, description="The query"),
+                ArgsSchema(name="limit", type=int, description="Max results"),
+                ArgsSchema(name="mode", type=str, enum=["fast", "full"]),
+            ],
+        )
+        for index in range(count)
+    ]
+
+
+def lookup(query: str, runtime: ToolRuntime) -> str:
+    """Look something up for the current user."""
+    return f"{runtime.user_id}: {query}"
+
+
+# Cases
+
+
+def bench_messages(suite: Suite) -> None:
+    suite.bench(
+        "message.construct.text",
+        lambda: PromptMessage(role="user", text="Hello there", content_type="text"),
+    )
+    suite.bench(
+        "message.construct.tool_call",
+        lambda: PromptMessage(
+            name="search", arguments='{"query": "q"}', call_id="call_1", content_type="tool_call"
+        ),
+    )
+    suite.bench(
+        "message.convert_to_openai_message",
+        lambda message: message.convert_to_openai_message(),
+        setup=lambda: PromptMessage(role="user", text="Hello there", content_type="text"),
+    )
+
+
+def bench_prompt(suite: Suite, sizes: list[int]) -> None:
+    for size in sizes:
+        messages = make_messages(size)
+        # Serializing a history for the first time, e.g. a restored session
+        suite.bench(
+            f"prompt.convert_to_openai_input.cold[{size}]",
+            lambda template: template.convert_to_openai_input(),
+            setup=lambda size=size: make_template(make_messages(size)),
+            params={"messages": size},
+        )
+        # One agent turn: a new message is appended, then the input is rebuilt
+        extra = PromptMessage(role="user", text="next", content_type="text")
+        template = make_template(messages)
+        template.convert_to_openai_input()
+
+        def turn(template=template, extra=extra):
+            template.add_message(extra)
+            template.convert_to_openai_input()
+            template._messages.pop()
+            template._serialized.pop()
+
+        suite.bench(
+            f"prompt.convert_to_openai_input.append[{size}]",
+            turn,
+            params={"messages": size},
+        )
+
+
+def bench_tools(suite: Suite, sizes: list[int]) -> None:
+    for size in sizes:
+        tools = make_tools(size)
+        suite.bench(
+            f"tool.convert_to_openai_tool.cold[{size}]",
+            lambda: [tool.refresh_openai_tool() for tool in tools],
+            params={"tools": size},
+        )
+        tool_set = ToolSet(tools)
+        suite.bench(
+            f"tool.convert_to_openai_tool.cached[{size}]",
+            lambda: ChatOpenAI._convert_to_openai_tools(tool_set),
+            params={"tools": size},
+        )
+
+    tool = Tool(
+        name="lookup",
+        description="Look something up",
+        func=lookup,
+        args_schema=[ArgsSchema(name="query", type=str)],
+    )
+    plain = make_tools(1)[0]
+    context = {"user_id": "u1", "session": "s1"}
+    suite.bench(
+        "tool._inject_runtime.with_runtime",
+        lambda: tool._inject_runtime({"query": "q"}, context, tool.func),
+    )
+    suite.bench(
+        "tool._inject_runtime.without_runtime",
+        lambda: plain._inject_runtime({"query": "q"}, context, plain.func),
+    )
+    suite.bench(
+        "tool._resolve_arguments",
+        lambda: plain._resolve_arguments({"query": "q", "limit": "5", "mode": "fast"}),
+    )
+
+    schema = ArgsSchema(name="limit", type=int)
+    suite.bench("args_schema.validate_and_cast", lambda: schema.validate_and_cast("42"))
+
+
+def bench_results(suite: Suite) -> None:
+    event = ResponseTextDeltaEvent(
+        type="response.output_text.delta",
+        delta="tok ",
+        item_id="msg_1",
+        output_index=0,
+        content_index=0,
+        logprobs=[],
+        sequence_number=0,
+    )
+    suite.bench(
+        "result.run_result_streaming",
+        lambda: RunResultStreaming(input="Hi", event=event, final_output=None),
+    )
+    suite.bench(
+        "result.stream_chunk",
+        lambda: StreamChunk(input="Hi", event=event, final_output=None),
+    )
+
+
+def bench_runner(suite: Suite, deltas: int) -> None:
+    tool = make_tools(1)[0]
+    llm = ScriptedLLM(
+        api_key="bench",
+        script=[
+            make_response([tool_call_item(tool.name, '{"query": "q", "limit": "3"}')]),
+            make_response([message_item("done")], "resp_2"),
+        ],
+    )
+    agent = Agent(llm=llm, tools=[tool])
+    suite.bench(
+        "runner.invoke.tool_round_trip",
+        lambda: agent.invoke(user_input="Hi"),
+    )
+    suite.bench(
+        "runner.ainvoke.tool_round_trip",
+        lambda: asyncio.run(agent.ainvoke(user_input="Hi")),
+    )
+
+    events = make_events(deltas)
+    stream_agent = Agent(llm=ScriptedLLM(api_key="bench", script=[events]))
+    for fast in (False, True):
+        name = "runner.stream.per_event" + (".fast" if fast else "")
+        if not suite.wants(name):
+            continue
+
+        def consume(fast=fast) -> int:
+            count = 0
+            for _ in stream_agent.stream(user_input="Hi", fast=fast):
+                count += 1
+            return count
+
+        count = consume()
+        samples = []
+        for _ in range(suite.repeat):
+            start = time.perf_counter()
+            consume()
+            samples.append((time.perf_counter() - start) / count)
+        suite.record(name, samples, count, {"events": count})
+
+
+IMPORT_CASES = {
+    "import.literun": "import literun",
+    "import.literun.agent": "from literun import Agent, ChatOpenAI, Tool",
+    "import.literun.full": "from literun import Agent, RunResult; import literun.runner",
+}
+"""Import statements timed in fresh interpreters. Only the last one loads ``openai``."""
+
+
+def bench_import(suite: Suite) -> None:
+    """Time imports of the package in fresh interpreters."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    for name, statement in IMPORT_CASES.items():
+        if not suite.wants(name):
+            continue
+        code = f"import time; s = time.perf_counter(); {statement}; print(time.perf_counter() - s)"
+        samples = [
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+                ).stdout
+            )
+            for _ in range(suite.repeat)
+        ]
+        suite.record(name, samples, 1, {"statement": statement})
+
+
+# Reporting
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds >= 1 / scale:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def compare(results: list[dict[str, Any]], path: str, threshold: float) -> list[str]:
+    """Return the cases whose median regressed beyond `threshold` times the baseline."""
+    with open(path, encoding="utf-8") as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+
+    regressions = []
+    print(f"\n{'case':<48} {'baseline':>10}   {'current':>10}   ratio")
+    for result in results:
+        base = baseline.get(result["name"])
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(
+            f"{result['name']:<48} {format_time(base['median']):>10}   "
+            f"{format_time(result['median']):>10}   {ratio:.2f}x{flag}"
+        )
+        if flag:
+            regressions.append(result["name"])
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="Only run cases whose name contains this text.")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed repeats per case.")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer repeats.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Allowed slowdown ratio of a case median before it counts as a regression.",
+    )
+    args = parser.parse_args()
+
+    repeat = 3 if args.quick else args.repeat
+    suite = Suite(repeat=repeat, pattern=args.filter)
+    print(f"{'case':<48} {'median':>10}   {'min':>10}")
+
+    bench_messages(suite)
+    bench_prompt(suite, [10, 100] if args.quick else [10, 100, 1000])
+    bench_tools(suite, [10, 100] if args.quick else [10, 100, 500])
+    bench_results(suite)
+    bench_runner(suite, deltas=500 if args.quick else 2000)
+    bench_import(suite)
+
+    if args.output:
+        report = {
+            "schema_version": SCHEMA_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": time.time(),
+            "results": suite.results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        regressions = compare(suite.results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
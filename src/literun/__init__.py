@@ -2,23 +2,118 @@
 
 from __future__ import annotations
 
-from .agent import Agent
-from .llm import ChatOpenAI
-from .tool import Tool, ToolRuntime
-from .args_schema import ArgsSchema
-from .prompt import PromptTemplate
-from .message import PromptMessage
-from .constants import Role, ContentType
-from .items import RunItem
-from .events import StreamEvent
-from .results import RunResult, RunResultStreaming
+import importlib
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import Agent
+    from .llm import ChatOpenAI
+    from .backend import ModelBackend, ScriptedBackend
+    from .context import ContextPolicy, HistoryCompactor
+    from .tool import Tool, ToolSet, ToolRuntime, ToolCachePolicy, ToolOutputPolicy
+    from .blobs import BlobStore
+    from .executors import (
+        ToolExecutor,
+        ToolExecutorFullError,
+        register_tool_executor,
+        shutdown_tool_executors,
+        configure_process_pool,
+        shutdown_process_pool,
+    )
+    from .args_schema import ArgsSchema
+    from .prompt import PromptTemplate
+    from .message import PromptMessage
+    from .constants import Role, ContentType
+    from .items import RunItem
+    from .events import StreamEvent
+    from .results import RunResult, RunResultStreaming, StreamChunk, BatchItem
+    from .usage import RunUsage, RunTimings
+    from .cache import ResponseCache
+    from .tracing import Tracer, ChromeTraceExporter, OpenTelemetryTracer, set_tracer
+    from .ratelimit import RateLimiter
+    from .concurrency import AdaptiveConcurrencyLimiter
+    from .batch_api import LocalBatchClient, BatchRequestError
+
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "Agent": ".agent",
+    "ChatOpenAI": ".llm",
+    "ModelBackend": ".backend",
+    "ScriptedBackend": ".backend",
+    "ContextPolicy": ".context",
+    "HistoryCompactor": ".context",
+    "Tool": ".tool",
+    "ToolSet": ".tool",
+    "ToolRuntime": ".tool",
+    "ToolCachePolicy": ".tool",
+    "ToolOutputPolicy": ".tool",
+    "BlobStore": ".blobs",
+    "ToolExecutor": ".executors",
+    "ToolExecutorFullError": ".executors",
+    "register_tool_executor": ".executors",
+    "shutdown_tool_executors": ".executors",
+    "configure_process_pool": ".executors",
+    "shutdown_process_pool": ".executors",
+    "ArgsSchema": ".args_schema",
+    "PromptTemplate": ".prompt",
+    "PromptMessage": ".message",
+    "Role": ".constants",
+    "ContentType": ".constants",
+    "RunItem": ".items",
+    "StreamEvent": ".events",
+    "RunResult": ".results",
+    "RunResultStreaming": ".results",
+    "StreamChunk": ".results",
+    "BatchItem": ".results",
+    "RunUsage": ".usage",
+    "RunTimings": ".usage",
+    "ResponseCache": ".cache",
+    "Tracer": ".tracing",
+    "ChromeTraceExporter": ".tracing",
+    "OpenTelemetryTracer": ".tracing",
+    "set_tracer": ".tracing",
+    "RateLimiter": ".ratelimit",
+    "AdaptiveConcurrencyLimiter": ".concurrency",
+    "LocalBatchClient": ".batch_api",
+    "BatchRequestError": ".batch_api",
+}
+"""Public names and the submodules defining them. Submodules are only
+imported when one of their names is first accessed, so ``import literun``
+does not load ``openai`` or build any pydantic models."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
 
 
 __all__ = [
     "Agent",
     "ChatOpenAI",
+    "ModelBackend",
+    "ScriptedBackend",
+    "ContextPolicy",
+    "HistoryCompactor",
     "Tool",
+    "ToolSet",
     "ToolRuntime",
+    "ToolCachePolicy",
+    "ToolOutputPolicy",
+    "BlobStore",
+    "ToolExecutor",
+    "ToolExecutorFullError",
+    "register_tool_executor",
+    "shutdown_tool_executors",
+    "configure_process_pool",
+    "shutdown_process_pool",
     "ArgsSchema",
     "PromptTemplate",
     "PromptMessage",
@@ -28,6 +123,19 @@ __all__ = [
     "StreamEvent",
     "RunResult",
     "RunResultStreaming",
+    "StreamChunk",
+    "BatchItem",
+    "RunUsage",
+    "RunTimings",
+    "ResponseCache",
+    "Tracer",
+    "ChromeTraceExporter",
+    "OpenTelemetryTracer",
+    "set_tracer",
+    "RateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "LocalBatchClient",
+    "BatchRequestError",
 ]
 
 __version__ = "0.2.0"
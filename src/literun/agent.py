@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator, AsyncIterator
-from pydantic import BaseModel, PrivateAttr, model_validator
-
-from .tool import Tool
-from .llm import ChatOpenAI
-from .prompt import PromptTemplate
-from .results import RunResult, RunResultStreaming
-from .runner import Runner
+import threading
+from typing import Any, Iterable, Iterator, AsyncIterator, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
+
+from .tool import Tool, ToolSet, ToolOutputPolicy
+from .backend import ModelBackend
+from .context import ContextPolicy, HistoryCompactor
+from .executors import ToolExecutor, get_tool_executor
 from .constants import (
     ToolChoice,
+    ToolExecution,
     DEFAULT_MAX_TOOL_CALLS_LIMIT,
     DEFAULT_MAX_ITERATIONS_LIMIT,
+    DEFAULT_MAX_CONCURRENT_TOOL_CALLS,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_POLL_INTERVAL,
 )
 
+if TYPE_CHECKING:
+    from .prompt import PromptTemplate
+    from .results import BatchItem, RunResult, RunResultStreaming, StreamChunk
+    from .batch import BatchInput
+
 
 class Agent(BaseModel):
     """A minimal agent runtime built on OpenAI Responses API.
@@ -24,8 +34,14 @@ class Agent(BaseModel):
     Execution logic is delegated to the `Runner` class.
     """
 
-    llm: ChatOpenAI
-    """The language model used by the agent."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    llm: ModelBackend
+    """The language model used by the agent.
+
+    Usually a ``ChatOpenAI``. Any ``ModelBackend`` is accepted, e.g. a
+    ``ScriptedBackend`` to run without network access.
+    """
     
     system_prompt: str | None = None
     """The system prompt to initialize the agent's behavior."""
@@ -48,20 +64,132 @@ class Agent(BaseModel):
     max_iterations: int = DEFAULT_MAX_ITERATIONS_LIMIT
     """Maximum number of iterations for the agent loop."""
 
+    max_concurrent_tool_calls: int = DEFAULT_MAX_CONCURRENT_TOOL_CALLS
+    """Maximum number of tool calls executed concurrently within a single turn.
+
+    Only applies when `parallel_tool_calls` is enabled.
+    """
+
+    tool_execution: ToolExecution = "sequential"
+    """How the synchronous runner executes a turn's tool calls.
+
+    Options: `sequential`, `thread`. With `thread`, the calls of tools not in
+    `inline` mode are dispatched to `tool_executor` when
+    `parallel_tool_calls` is enabled.
+    """
+
+    tool_executor: ThreadPoolExecutor | None = None
+    """Executor used by the synchronous runner in `thread` mode.
+
+    Pass an executor to share it between agents. If None, the agent creates
+    its own pool with `max_concurrent_tool_calls` workers on first use.
+    """
+
+    tool_executors: list[ToolExecutor] | None = None
+    """Named executors for this agent's tools.
+
+    Tools refer to them by name through their `executor` field; names not
+    found here are looked up in the process-wide registry (see
+    ``register_tool_executor``), and must be registered before the agent is
+    built. The executors are shut down by ``close``.
+    """
+
+    chain_responses: bool = False
+    """Whether to chain loop iterations server-side with `previous_response_id`.
+
+    When enabled, responses are stored (`store=True`) and each iteration only
+    sends the new tool outputs instead of the whole conversation. If the chain
+    is rejected (e.g. the stored response expired), the run falls back to
+    replaying the full history. The local prompt stays authoritative.
+    """
+
+    eager_tool_execution: bool = False
+    """Whether async streaming runs start each tool as soon as its call is complete.
+
+    When enabled, `astream` launches a tool when its `function_call` item is
+    done, while the model keeps streaming the rest of the response. Tool
+    outputs are still added to the conversation in call order.
+    """
+
+    context_policy: ContextPolicy | None = None
+    """Token budget applied to the history before each model call.
+
+    When set, the oldest items are left out of requests that would exceed
+    the budget. The tokens saved are reported in `RunUsage.context_tokens_saved`.
+    If None, the full history is always sent.
+    """
+
+    tool_output_policy: ToolOutputPolicy | None = None
+    """Default policy for offloading large tool outputs.
+
+    Applies to tools without their own `output_policy`. When any policy is
+    set, a `read_tool_output` tool is registered so the model can page
+    through offloaded outputs.
+    """
+
+    compaction: HistoryCompactor | None = None
+    """Summarizes the older history when it grows past a token threshold.
+
+    Unlike `context_policy`, compaction rewrites the run's history: older
+    turns, tool calls and outputs are replaced by a summary written by the
+    compactor's model. Applied before each model call.
+    """
+
     _tools: dict[str, Tool] = PrivateAttr(default_factory=dict)
     """Internal mapping of tool names to Tool instances."""
 
+    _tool_set: ToolSet = PrivateAttr(default_factory=ToolSet)
+    """The tools sent to the model, with their compiled definitions."""
+
+    _owned_executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+    """Executor created by the agent when no `tool_executor` is given."""
+
+    _executor_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    """Guards the lazy creation of the owned executor."""
+
+    _tool_executors: dict[str, ToolExecutor] = PrivateAttr(default_factory=dict)
+    """Internal mapping of executor names to the agent's tool executors."""
+
     @model_validator(mode="after")
     def _validate_config(self) -> Agent:
         """Validate configuration and initialize tools."""
         if self.max_iterations < 1:
             raise ValueError("max_iterations must be >= 1")
+        if self.max_concurrent_tool_calls < 1:
+            raise ValueError("max_concurrent_tool_calls must be >= 1")
+
+        self._tool_executors = {}
+        for executor in self.tool_executors or []:
+            if executor.name in self._tool_executors:
+                raise ValueError(f"Duplicate tool executor name: {executor.name}")
+            self._tool_executors[executor.name] = executor
         return self
 
     @model_validator(mode="after")
     def _initialize_tools(self) -> Agent:
         self._tools = self.add_tools(self.tools)
         # Convert a list of tools to internal dictionary
+
+        retrieval = self._output_retrieval_tool()
+        if retrieval is not None and retrieval.name not in self._tools:
+            self.tools = [*(self.tools or []), retrieval]
+            self._tools[retrieval.name] = retrieval
+
+        # Compile the tool definitions once, so runs reuse the same list
+        self._tool_set = ToolSet(self.tools)
+
+        # Fail on misspelled or unregistered executor names now, not mid-run
+        for tool in self._tools.values():
+            name = tool.executor
+            if isinstance(name, str) and name not in self._tool_executors:
+                try:
+                    get_tool_executor(name)
+                except KeyError:
+                    raise ValueError(
+                        f"Tool '{tool.name}' uses unknown tool executor '{name}'. "
+                        "Pass it in `tool_executors` or register it with "
+                        "`register_tool_executor` before building the agent."
+                    ) from None
         return self
 
     def add_tools(
@@ -86,6 +214,48 @@ class Agent(BaseModel):
             tool_map[tool.name] = tool
         return tool_map
 
+    def _output_retrieval_tool(self) -> Tool | None:
+        """Build the `read_tool_output` tool if any output policy is enabled."""
+        policies = [self.tool_output_policy] + [
+            tool.output_policy for tool in self.tools or []
+        ]
+        policies = [policy for policy in policies if policy is not None and policy.enabled]
+        if not policies:
+            return None
+        return ToolOutputPolicy.retrieval_tool(policies)
+
+    def get_tool_executor(self) -> ThreadPoolExecutor:
+        """Return the executor used for `thread` tool execution.
+
+        Returns:
+            ``ThreadPoolExecutor``: The shared `tool_executor` if provided,
+            otherwise a pool owned by this agent, created on first use.
+        """
+        if self.tool_executor is not None:
+            return self.tool_executor
+        with self._executor_lock:
+            if self._owned_executor is None:
+                self._owned_executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_tool_calls,
+                    thread_name_prefix="literun-tool",
+                )
+            return self._owned_executor
+
+    def close(self) -> None:
+        """Shut down the executors owned by the agent.
+
+        This covers the pool created when no `tool_executor` is given and
+        the `tool_executors`. A shared `tool_executor` and process-wide
+        executors are left untouched; their owner is responsible for
+        shutting them down.
+        """
+        with self._executor_lock:
+            if self._owned_executor is not None:
+                self._owned_executor.shutdown(wait=True)
+                self._owned_executor = None
+        for executor in self._tool_executors.values():
+            executor.shutdown(wait=True)
+
     def invoke(
         self,
         *,
@@ -106,6 +276,8 @@ class Agent(BaseModel):
         Returns:
             ``RunResult``: The result of the agent run.
         """
+        from .runner import Runner
+
         return Runner.run(
             agent=self,
             user_input=user_input,
@@ -133,6 +305,8 @@ class Agent(BaseModel):
         Returns:
             ``RunResult``: The result of the agent run.
         """
+        from .runner import Runner
+
         return await Runner.arun(
             agent=self,
             user_input=user_input,
@@ -146,7 +320,8 @@ class Agent(BaseModel):
         user_input: str,
         prompt_template: PromptTemplate | None = None,
         runtime_context: dict[str, Any] | None = None,
-    ) -> Iterator[RunResultStreaming]:
+        fast: bool = False,
+    ) -> Iterator[RunResultStreaming | StreamChunk]:
         """Run the agent synchronously with streaming output.
 
         Streams events as they occur (tokens, tool calls, tool results).
@@ -156,15 +331,20 @@ class Agent(BaseModel):
             user_input: The input text from the user.
             prompt_template: Optional template to initialize conversation history.
             runtime_context: Optional runtime context dictionary to pass to tools.
+            fast: Whether to yield lightweight ``StreamChunk`` objects instead
+                of validated ``RunResultStreaming`` models.
 
         Yields:
-            ``RunResultStreaming``: Individual streaming events from the agent execution.
+            ``RunResultStreaming | StreamChunk``: Individual streaming events from the agent execution.
         """
+        from .runner import Runner
+
         return Runner.run_stream(
             agent=self,
             user_input=user_input,
             prompt_template=prompt_template,
             runtime_context=runtime_context,
+            fast=fast,
         )
 
     async def astream(
@@ -173,7 +353,8 @@ class Agent(BaseModel):
         user_input: str,
         prompt_template: PromptTemplate | None = None,
         runtime_context: dict[str, Any] | None = None,
-    ) -> AsyncIterator[RunResultStreaming]:
+        fast: bool = False,
+    ) -> AsyncIterator[RunResultStreaming | StreamChunk]:
         """Run the agent asynchronously with streaming output.
 
         Streams events asynchronously as they occur (tokens, tool calls, tool results).
@@ -183,14 +364,145 @@ class Agent(BaseModel):
             user_input: The input text from the user.
             prompt_template: Optional template to initialize conversation history.
             runtime_context: Optional runtime context dictionary to pass to tools.
+            fast: Whether to yield lightweight ``StreamChunk`` objects instead
+                of validated ``RunResultStreaming`` models.
 
         Yields:
-            ``RunResultStreaming``: Individual streaming events from the agent execution.
+            ``RunResultStreaming | StreamChunk``: Individual streaming events from the agent execution.
         """
-        async for event in Runner.arun_stream(
+        from .runner import Runner
+
+        stream = Runner.arun_stream(
             agent=self,
             user_input=user_input,
             prompt_template=prompt_template,
             runtime_context=runtime_context,
+            fast=fast,
+        )
+        try:
+            async for event in stream:
+                yield event
+        finally:
+            # End the run, and its span, as soon as the caller stops iterating
+            await stream.aclose()
+
+    def batch(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> list[BatchItem]:
+        """Run the agent synchronously over many inputs.
+
+        Runs are executed on a thread pool. Errors are captured per item
+        instead of failing the whole batch.
+
+        Args:
+            inputs: User input strings, or dictionaries with a `user_input` key
+                and optional `prompt_template` and `runtime_context` keys.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to return items in input order. Otherwise they
+                are returned in completion order.
+
+        Returns:
+            list[BatchItem]: One item per input.
+        """
+        from .batch import BatchRunner
+
+        return BatchRunner.run(
+            self, inputs, max_concurrency=max_concurrency, ordered=ordered
+        )
+
+    async def abatch(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> list[BatchItem]:
+        """Run the agent asynchronously over many inputs.
+
+        Errors are captured per item instead of failing the whole batch.
+
+        Args:
+            inputs: User input strings, or dictionaries with a `user_input` key
+                and optional `prompt_template` and `runtime_context` keys.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to return items in input order. Otherwise they
+                are returned in completion order.
+
+        Returns:
+            list[BatchItem]: One item per input.
+        """
+        from .batch import BatchRunner
+
+        return await BatchRunner.arun(
+            self, inputs, max_concurrency=max_concurrency, ordered=ordered
+        )
+
+    async def abatch_iter(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchItem]:
+        """Run the agent asynchronously over many inputs, yielding items as they finish.
+
+        Inputs are consumed lazily and only `max_concurrency` runs are kept
+        in flight, so memory stays flat on very large inputs.
+
+        Args:
+            inputs: User input strings, or dictionaries with a `user_input` key
+                and optional `prompt_template` and `runtime_context` keys.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to yield items in input order. Otherwise they
+                are yielded as they complete.
+
+        Yields:
+            ``BatchItem``: One item per input.
+        """
+        from .batch import BatchRunner
+
+        async for item in BatchRunner.astream(
+            self, inputs, max_concurrency=max_concurrency, ordered=ordered
         ):
-            yield event
+            yield item
+
+    def batch_offline(
+        self,
+        inputs: Iterable[BatchInput],
+        *,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> list[BatchItem]:
+        """Run the agent over many inputs through the OpenAI Batch API.
+
+        Intended for non-interactive workloads that trade latency for
+        throughput and cost. Each loop iteration submits the model requests
+        of all unfinished runs as one batch, then executes their tool calls.
+
+        Args:
+            inputs: User input strings, or dictionaries with a `user_input` key
+                and optional `prompt_template` and `runtime_context` keys.
+            poll_interval: Seconds to wait between batch status checks.
+            timeout: Optional maximum number of seconds to wait for each batch.
+
+        Returns:
+            list[BatchItem]: One item per input, in input order.
+
+        Raises:
+            TypeError: If the model backend does not support the Batch API.
+        """
+        from .batch_api import OfflineBatchRunner
+
+        if not hasattr(self.llm, "batch_chat"):
+            raise TypeError(
+                f"{type(self.llm).__name__} does not support the Batch API; "
+                "use ChatOpenAI for batch_offline"
+            )
+
+        return OfflineBatchRunner.run(
+            self, inputs, poll_interval=poll_interval, timeout=timeout
+        )
@@ -0,0 +1,387 @@
+"""Model backends: the interface the runner uses to call a model."""
+
+from __future__ import annotations
+
+import json
+import threading
+from itertools import count
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Protocol,
+    Sequence,
+    runtime_checkable,
+    TYPE_CHECKING,
+)
+
+from .prompt import PromptTemplate
+from .constants import DEFAULT_CHARS_PER_TOKEN
+
+if TYPE_CHECKING:
+    from openai.types.responses import Response
+    from .tool import Tool
+    from .events import ResponseStreamEvent
+
+
+@runtime_checkable
+class ModelBackend(Protocol):
+    """Interface of the model used by an ``Agent``.
+
+    The runner only calls ``Agent.llm`` through this protocol, so any object
+    implementing it can replace ``ChatOpenAI``, e.g. ``ScriptedBackend`` for
+    offline tests, benchmarks and profiling.
+
+    Non-streaming calls return a ``Response``. Streaming calls return an
+    iterator of Responses API stream events that ends with
+    ``response.completed``.
+    """
+
+    model: str
+    """The model name, reported in traces."""
+
+    def chat(
+        self,
+        *,
+        messages: PromptTemplate | list[dict[str, Any]],
+        stream: bool = False,
+        tools: Sequence[Tool] | None = None,
+        tool_choice: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
+    ) -> Response | Iterator[ResponseStreamEvent]:
+        """Call the model synchronously."""
+        ...
+
+    async def achat(
+        self,
+        *,
+        messages: PromptTemplate | list[dict[str, Any]],
+        stream: bool = False,
+        tools: Sequence[Tool] | None = None,
+        tool_choice: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
+    ) -> Response | AsyncIterator[ResponseStreamEvent]:
+        """Call the model asynchronously."""
+        ...
+
+
+ScriptEntry = Any
+"""A scripted model turn. One of:
+
+- ``str``: an assistant message with this text.
+- ``list[dict]``: output items in the Responses API format, e.g. from
+  ``ScriptedBackend.tool_call``. Missing ids are filled in.
+- ``Response``: returned as-is.
+- ``list`` of stream events: replayed as-is when streaming. Non-streaming
+  calls return the response of its ``response.completed`` event.
+- ``BaseException``: raised by the call.
+- A callable taking the recorded request and returning one of the above.
+"""
+
+
+class ScriptedBackend:
+    """In-process model backend that replays a script of responses.
+
+    Returns real ``Response`` and stream event objects without any client or
+    network access, so runs are fast and deterministic. Stream events are
+    derived from each response: text is split into deltas of about one
+    token. Usage is estimated from the request and output sizes.
+
+    Example:
+        backend = ScriptedBackend([
+            [ScriptedBackend.tool_call("get_weather", {"city": "Paris"})],
+            "It is sunny in Paris.",
+        ])
+        agent = Agent(llm=backend, tools=[weather_tool])
+        agent.invoke(user_input="Weather in Paris?")
+        backend.requests[1]["input"]  # the input of the second model call
+    """
+
+    def __init__(
+        self,
+        script: Iterable[ScriptEntry],
+        *,
+        model: str = "scripted",
+        loop: bool = False,
+        chars_per_delta: int = int(DEFAULT_CHARS_PER_TOKEN),
+    ) -> None:
+        """Create the backend.
+
+        Args:
+            script: The model turns to replay, in call order.
+            model: The model name reported in responses and traces.
+            loop: Whether to restart the script when it is exhausted.
+                Otherwise further calls raise ``RuntimeError``.
+            chars_per_delta: Number of characters per streamed text delta.
+        """
+        if chars_per_delta < 1:
+            raise ValueError("chars_per_delta must be >= 1")
+        self.model = model
+        self.script = list(script)
+        self.loop = loop
+        self.chars_per_delta = chars_per_delta
+        # The requests received so far, in call order
+        self.requests: list[dict[str, Any]] = []
+
+        self._position = 0
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tool_call(name: str, arguments: dict[str, Any] | str = "{}") -> dict[str, Any]:
+        """Build a function call output item for a script entry.
+
+        Args:
+            name: The name of the tool to call.
+            arguments: The call arguments, as a dictionary or JSON string.
+
+        Returns:
+            dict[str, Any]: The output item.
+        """
+        if not isinstance(arguments, str):
+            arguments = json.dumps(arguments)
+        return {"type": "function_call", "name": name, "arguments": arguments}
+
+    def reset(self) -> None:
+        """Restart the script and forget the recorded requests."""
+        with self._lock:
+            self._position = 0
+            self.requests.clear()
+
+    def chat(
+        self,
+        *,
+        messages: PromptTemplate | list[dict[str, Any]],
+        stream: bool = False,
+        tools: Sequence[Tool] | None = None,
+        tool_choice: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
+    ) -> Response | Iterator[ResponseStreamEvent]:
+        """Return the next scripted response, or its stream events.
+
+        Args:
+            messages: PromptTemplate or list of messages in OpenAI format.
+            stream: Whether to return stream events.
+            tools: Optional list of Tool instances. Recorded by name.
+            tool_choice: Recorded only.
+            parallel_tool_calls: Recorded only.
+            store: Recorded only.
+            previous_response_id: Recorded only.
+
+        Returns:
+            Response | Iterator[ResponseStreamEvent]: The response or stream.
+
+        Raises:
+            RuntimeError: If the script is exhausted.
+        """
+        request = {
+            "input": (
+                messages.convert_to_openai_input()
+                if isinstance(messages, PromptTemplate)
+                else messages
+            ),
+            "stream": stream,
+            "tools": [tool.name for tool in tools or ()],
+            "tool_choice": tool_choice,
+            "parallel_tool_calls": parallel_tool_calls,
+            "store": store,
+            "previous_response_id": previous_response_id,
+        }
+        entry, response_id = self._next(request)
+        if isinstance(entry, list) and entry and not isinstance(entry[0], dict):
+            if stream:
+                return iter(entry)
+            return self._completed_response(entry)
+
+        response = self._build_response(entry, request, response_id)
+        if stream:
+            return iter(self.stream_events(response, self.chars_per_delta))
+        return response
+
+    async def achat(
+        self,
+        *,
+        messages: PromptTemplate | list[dict[str, Any]],
+        stream: bool = False,
+        tools: Sequence[Tool] | None = None,
+        tool_choice: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
+    ) -> Response | AsyncIterator[ResponseStreamEvent]:
+        """Asynchronous counterpart of ``chat``."""
+        result = self.chat(
+            messages=messages,
+            stream=stream,
+            tools=tools,
+            tool_choice=tool_choice,
+            parallel_tool_calls=parallel_tool_calls,
+            store=store,
+            previous_response_id=previous_response_id,
+        )
+        if stream:
+            return _aiter(result)
+        return result
+
+    def _next(self, request: dict[str, Any]) -> tuple[ScriptEntry, str]:
+        """Record `request` and pop the next script entry."""
+        with self._lock:
+            if self._position >= len(self.script):
+                if not self.loop or not self.script:
+                    raise RuntimeError(
+                        f"ScriptedBackend script exhausted after {len(self.requests)} requests"
+                    )
+                self._position = 0
+            entry = self.script[self._position]
+            self._position += 1
+            self.requests.append(request)
+            response_id = f"resp_{next(self._ids)}"
+
+        if callable(entry) and not isinstance(entry, type):
+            entry = entry(request)
+        if isinstance(entry, BaseException):
+            raise entry
+        return entry, response_id
+
+    def _build_response(
+        self, entry: ScriptEntry, request: dict[str, Any], response_id: str
+    ) -> Response:
+        """Turn a script entry into a completed response."""
+        from openai.types.responses import Response
+
+        if isinstance(entry, Response):
+            return entry
+        if isinstance(entry, str):
+            entry = [
+                {
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": entry, "annotations": []}],
+                }
+            ]
+
+        output = []
+        for index, item in enumerate(entry):
+            item = {"status": "completed", **item}
+            item.setdefault("id", f"{response_id}_item_{index}")
+            if item["type"] == "function_call":
+                item.setdefault("call_id", f"call_{response_id}_{index}")
+            output.append(item)
+
+        input_tokens = self._estimate_tokens(json.dumps(request["input"]))
+        output_tokens = self._estimate_tokens(json.dumps(output))
+        return Response.model_validate(
+            {
+                "id": response_id,
+                "created_at": 0,
+                "model": self.model,
+                "object": "response",
+                "status": "completed",
+                "output": output,
+                "parallel_tool_calls": bool(request["parallel_tool_calls"]),
+                "tool_choice": request["tool_choice"] or "auto",
+                "tools": [],
+                "usage": {
+                    "input_tokens": input_tokens,
+                    "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+                    "output_tokens": output_tokens,
+                    "output_tokens_details": {"reasoning_tokens": 0},
+                    "total_tokens": input_tokens + output_tokens,
+                },
+            }
+        )
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return max(1, round(len(text) / DEFAULT_CHARS_PER_TOKEN))
+
+    @staticmethod
+    def _completed_response(events: list[Any]) -> Response:
+        for event in reversed(events):
+            if getattr(event, "type", None) == "response.completed":
+                return event.response
+        raise ValueError("Scripted event list has no response.completed event")
+
+    @staticmethod
+    def stream_events(
+        response: Response, chars_per_delta: int = int(DEFAULT_CHARS_PER_TOKEN)
+    ) -> list[ResponseStreamEvent]:
+        """Build the stream events the Responses API would emit for `response`.
+
+        Args:
+            response: A completed response.
+            chars_per_delta: Number of characters per text delta.
+
+        Returns:
+            list[ResponseStreamEvent]: ``response.created``, the text and
+            argument deltas and ``response.output_item.done`` of each output
+            item, then ``response.completed``.
+        """
+        from openai.types.responses import (
+            ResponseCreatedEvent,
+            ResponseCompletedEvent,
+            ResponseTextDeltaEvent,
+            ResponseOutputItemDoneEvent,
+            ResponseFunctionCallArgumentsDeltaEvent,
+        )
+
+        sequence = count()
+        created = response.model_copy(update={"status": "in_progress", "output": []})
+        events: list[ResponseStreamEvent] = [
+            ResponseCreatedEvent(
+                type="response.created", response=created, sequence_number=next(sequence)
+            )
+        ]
+        for index, item in enumerate(response.output):
+            if item.type == "message":
+                for content_index, part in enumerate(item.content):
+                    if part.type != "output_text":
+                        continue
+                    for start in range(0, len(part.text), chars_per_delta):
+                        events.append(
+                            ResponseTextDeltaEvent(
+                                type="response.output_text.delta",
+                                delta=part.text[start : start + chars_per_delta],
+                                item_id=item.id,
+                                output_index=index,
+                                content_index=content_index,
+                                logprobs=[],
+                                sequence_number=next(sequence),
+                            )
+                        )
+            elif item.type == "function_call":
+                events.append(
+                    ResponseFunctionCallArgumentsDeltaEvent(
+                        type="response.function_call_arguments.delta",
+                        delta=item.arguments,
+                        item_id=item.id,
+                        output_index=index,
+                        sequence_number=next(sequence),
+                    )
+                )
+            events.append(
+                ResponseOutputItemDoneEvent(
+                    type="response.output_item.done",
+                    item=item,
+                    output_index=index,
+                    sequence_number=next(sequence),
+                )
+            )
+        events.append(
+            ResponseCompletedEvent(
+                type="response.completed", response=response, sequence_number=next(sequence)
+            )
+        )
+        return events
+
+
+async def _aiter(events: Iterable[ResponseStreamEvent]) -> AsyncIterator[ResponseStreamEvent]:
+    for event in events:
+        yield event
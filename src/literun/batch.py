@@ -0,0 +1,226 @@
+"""Bulk execution of agent runs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import Agent
+
+from .runner import Runner
+from .results import BatchItem
+
+
+BatchInput = str | dict[str, Any]
+"""A batch input: either the user input text, or a dictionary with a
+`user_input` key and optional `prompt_template` and `runtime_context` keys."""
+
+_BATCH_INPUT_KEYS = frozenset({"user_input", "prompt_template", "runtime_context"})
+
+
+class BatchRunner:
+    """Executes an agent over many inputs with bounded concurrency.
+
+    Each input is an independent agent run. Failures are captured per item
+    in ``BatchItem.error`` instead of failing the whole batch.
+    """
+
+    @classmethod
+    def run(
+        cls,
+        agent: Agent,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int,
+        ordered: bool = True,
+    ) -> list[BatchItem]:
+        """Run the agent over all inputs on a thread pool.
+
+        Args:
+            inputs: The batch inputs.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to return items in input order. Otherwise they
+                are returned in completion order.
+
+        Returns:
+            list[BatchItem]: One item per input.
+
+        Raises:
+            ValueError: If `max_concurrency` is less than 1.
+        """
+        cls._validate_concurrency(max_concurrency)
+        iterator = enumerate(inputs)
+        items: list[BatchItem] = []
+
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="literun-batch"
+        ) as executor:
+            pending: set[Future[BatchItem]] = set()
+
+            def submit() -> bool:
+                entry = next(iterator, None)
+                if entry is None:
+                    return False
+                pending.add(executor.submit(cls._run_one, agent, *entry))
+                return True
+
+            for _ in range(max_concurrency):
+                if not submit():
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    items.append(future.result())
+                    submit()
+
+        if ordered:
+            items.sort(key=lambda item: item.index)
+        return items
+
+    @classmethod
+    async def arun(
+        cls,
+        agent: Agent,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int,
+        ordered: bool = True,
+    ) -> list[BatchItem]:
+        """Run the agent over all inputs asynchronously.
+
+        Args:
+            inputs: The batch inputs.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to return items in input order. Otherwise they
+                are returned in completion order.
+
+        Returns:
+            list[BatchItem]: One item per input.
+
+        Raises:
+            ValueError: If `max_concurrency` is less than 1.
+        """
+        items = [
+            item
+            async for item in cls.astream(
+                agent, inputs, max_concurrency=max_concurrency, ordered=False
+            )
+        ]
+        if ordered:
+            items.sort(key=lambda item: item.index)
+        return items
+
+    @classmethod
+    async def astream(
+        cls,
+        agent: Agent,
+        inputs: Iterable[BatchInput],
+        *,
+        max_concurrency: int,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchItem]:
+        """Run the agent over all inputs, yielding items as they are ready.
+
+        Inputs are consumed lazily and at most `max_concurrency` runs are in
+        flight, so memory stays flat regardless of the number of inputs. In
+        ordered mode, a slow item holds back the items after it.
+
+        Args:
+            inputs: The batch inputs.
+            max_concurrency: Maximum number of agent runs in flight.
+            ordered: Whether to yield items in input order. Otherwise they
+                are yielded in completion order.
+
+        Yields:
+            ``BatchItem``: One item per input.
+
+        Raises:
+            ValueError: If `max_concurrency` is less than 1.
+        """
+        cls._validate_concurrency(max_concurrency)
+        iterator = enumerate(inputs)
+        in_flight: deque[asyncio.Task[BatchItem]] = deque()
+
+        def submit() -> bool:
+            entry = next(iterator, None)
+            if entry is None:
+                return False
+            in_flight.append(asyncio.create_task(cls._arun_one(agent, *entry)))
+            return True
+
+        try:
+            for _ in range(max_concurrency):
+                if not submit():
+                    break
+
+            while in_flight:
+                if ordered:
+                    task = in_flight.popleft()
+                    item = await task
+                else:
+                    done, _ = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    in_flight.remove(task)
+                    item = task.result()
+                submit()
+                yield item
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    @staticmethod
+    def _validate_concurrency(max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+    @staticmethod
+    def _normalize(raw: BatchInput) -> dict[str, Any]:
+        """Convert a batch input into keyword arguments for the runner.
+
+        Raises:
+            TypeError: If the input is neither a string nor a dictionary.
+            ValueError: If a dictionary input has unknown keys.
+        """
+        if isinstance(raw, str):
+            return {"user_input": raw}
+        if not isinstance(raw, dict):
+            raise TypeError("Batch inputs must be strings or dictionaries")
+        unknown = set(raw) - _BATCH_INPUT_KEYS
+        if unknown:
+            raise ValueError(f"Unknown batch input keys: {sorted(unknown)}")
+        return raw
+
+    @staticmethod
+    def _input_text(raw: BatchInput) -> str:
+        """Extract the user input text of a batch input for reporting."""
+        if isinstance(raw, dict):
+            return str(raw.get("user_input", ""))
+        return str(raw)
+
+    @classmethod
+    def _run_one(cls, agent: Agent, index: int, raw: BatchInput) -> BatchItem:
+        """Run a single batch input, capturing any error."""
+        user_input = cls._input_text(raw)
+        try:
+            result = Runner.run(agent=agent, **cls._normalize(raw))
+        except Exception as e:
+            return BatchItem(index=index, input=user_input, error=e)
+        return BatchItem(index=index, input=user_input, result=result)
+
+    @classmethod
+    async def _arun_one(cls, agent: Agent, index: int, raw: BatchInput) -> BatchItem:
+        """Run a single batch input asynchronously, capturing any error."""
+        user_input = cls._input_text(raw)
+        try:
+            result = await Runner.arun(agent=agent, **cls._normalize(raw))
+        except Exception as e:
+            return BatchItem(index=index, input=user_input, error=e)
+        return BatchItem(index=index, input=user_input, result=result)
@@ -0,0 +1,474 @@
+"""Offline bulk execution backed by the OpenAI Batch API."""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+import itertools
+import threading
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
+
+from openai.types import Batch, FileObject
+from openai.types.responses import Response
+
+if TYPE_CHECKING:
+    from .agent import Agent
+
+from .runner import Runner
+from .items import RunItem
+from .results import BatchItem, RunResult
+from .usage import RunUsage, RunTimings
+from .prompt import PromptTemplate
+from .batch import BatchInput, BatchRunner
+from .constants import DEFAULT_BATCH_POLL_INTERVAL
+
+
+BATCH_ENDPOINT = "/v1/responses"
+
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchRequestError(RuntimeError):
+    """Raised for a request that did not produce a response in a batch."""
+
+
+class BatchSubmitter:
+    """Submits Responses API requests in bulk through the Batch API.
+
+    The requests are written to a JSONL file, uploaded, and submitted as one
+    batch. The submitter then polls until the batch finishes and maps each
+    result back to its request.
+
+    The client only needs the `files` and `batches` resources of an
+    ``OpenAI`` client, so ``LocalBatchClient`` can be used in its place.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        completion_window: str = "24h",
+        timeout: float | None = None,
+    ) -> None:
+        """Create a batch submitter.
+
+        Args:
+            client: An ``OpenAI`` client, or a compatible stand-in.
+            poll_interval: Seconds to wait between status checks.
+            completion_window: The completion window requested for each batch.
+            timeout: Optional maximum number of seconds to wait for a batch.
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+        self.timeout = timeout
+
+    @staticmethod
+    def build_jsonl(requests: Sequence[dict[str, Any]]) -> bytes:
+        """Encode request parameters as a Batch API input file.
+
+        Args:
+            requests: Responses API request parameters, one per request.
+
+        Returns:
+            bytes: The JSONL file content. Each line's `custom_id` is the
+            index of its request.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": {**params, "stream": False},
+                },
+                default=str,
+            )
+            for index, params in enumerate(requests)
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def submit(
+        self, requests: Sequence[dict[str, Any]]
+    ) -> list[Response | BatchRequestError]:
+        """Submit requests as one batch and wait for the results.
+
+        Args:
+            requests: Responses API request parameters, one per request.
+
+        Returns:
+            list[Response | BatchRequestError]: One entry per request, in
+            order. Failed requests are returned as ``BatchRequestError``.
+
+        Raises:
+            TimeoutError: If the batch does not finish within `timeout`.
+        """
+        if not requests:
+            return []
+
+        input_file = self.client.files.create(
+            file=("batch.jsonl", self.build_jsonl(requests)), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while batch.status not in _TERMINAL_STATUSES:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch.id} did not finish in time")
+            time.sleep(self.poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        results: list[Response | BatchRequestError] = [
+            BatchRequestError(f"Batch {batch.id} ended with status '{batch.status}'")
+            for _ in requests
+        ]
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                self._parse_results(self.client.files.content(file_id).text, results)
+        return results
+
+    @staticmethod
+    def _parse_results(
+        text: str, results: list[Response | BatchRequestError]
+    ) -> None:
+        """Fill `results` from the lines of a batch output or error file."""
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"])
+            response = record.get("response") or {}
+            error = record.get("error")
+
+            if error is None and response.get("status_code") == 200:
+                results[index] = Response.model_validate(response["body"])
+                continue
+
+            if error is None:
+                body_error = (response.get("body") or {}).get("error") or {}
+                error = {
+                    "code": response.get("status_code"),
+                    "message": body_error.get("message", "request failed"),
+                }
+            results[index] = BatchRequestError(
+                f"{error.get('code')}: {error.get('message')}"
+            )
+
+
+class OfflineBatchRunner:
+    """Drives agent tool loops for many inputs through the Batch API.
+
+    Each round sends the pending model requests of all unfinished runs as a
+    single batch, executes the returned tool calls, and resubmits the next
+    round until every run has a final answer or fails.
+    """
+
+    @classmethod
+    def run(
+        cls,
+        agent: Agent,
+        inputs: Iterable[BatchInput],
+        *,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> list[BatchItem]:
+        """Run the agent over all inputs using batched model requests.
+
+        Args:
+            inputs: The batch inputs.
+            poll_interval: Seconds to wait between batch status checks.
+            timeout: Optional maximum number of seconds to wait for each round.
+
+        Returns:
+            list[BatchItem]: One item per input, in input order.
+        """
+        items: list[BatchItem | None] = []
+        sessions: dict[int, dict[str, Any]] = {}
+
+        for index, raw in enumerate(inputs):
+            items.append(None)
+            try:
+                kwargs = BatchRunner._normalize(raw)
+                if not kwargs.get("user_input"):
+                    raise ValueError("user_input cannot be empty")
+                prompt = Runner._build_prompt(
+                    agent, kwargs["user_input"], kwargs.get("prompt_template")
+                )
+            except Exception as e:
+                items[index] = BatchItem(
+                    index=index, input=BatchRunner._input_text(raw), error=e
+                )
+                continue
+            sessions[index] = {
+                "input": kwargs["user_input"],
+                "prompt": prompt,
+                "runtime_context": kwargs.get("runtime_context"),
+                "items": [],
+                "usage": RunUsage(),
+                "timings": RunTimings(),
+            }
+
+        for _ in range(agent.max_iterations):
+            if not sessions:
+                break
+
+            indices = list(sessions)
+            responses = agent.llm.batch_chat(
+                [sessions[index]["prompt"] for index in indices],
+                tools=agent._tool_set,
+                tool_choice=agent.tool_choice,
+                parallel_tool_calls=agent.parallel_tool_calls,
+                poll_interval=poll_interval,
+                timeout=timeout,
+            )
+
+            for index, response in zip(indices, responses):
+                session = sessions[index]
+                try:
+                    result = cls._advance(agent, session, response)
+                except Exception as e:
+                    items[index] = BatchItem(index=index, input=session["input"], error=e)
+                    del sessions[index]
+                    continue
+                if result is not None:
+                    items[index] = BatchItem(
+                        index=index, input=session["input"], result=result
+                    )
+                    del sessions[index]
+
+        for index, session in sessions.items():
+            items[index] = BatchItem(
+                index=index,
+                input=session["input"],
+                error=RuntimeError(
+                    f"Agent exceeded max iterations ({agent.max_iterations})"
+                ),
+            )
+        return items
+
+    @staticmethod
+    def _advance(
+        agent: Agent,
+        session: dict[str, Any],
+        response: Response | BatchRequestError,
+    ) -> RunResult | None:
+        """Apply one round's response to a run.
+
+        Returns:
+            RunResult | None: The final result, or None if the run continues.
+
+        Raises:
+            BatchRequestError: If the model request of the run failed.
+        """
+        if isinstance(response, BatchRequestError):
+            raise response
+
+        prompt: PromptTemplate = session["prompt"]
+        all_items: list[RunItem] = session["items"]
+        session["usage"].add(response)
+        tool_calls, final_output_text = Runner._collect_output(response, all_items)
+
+        if not tool_calls:
+            return RunResult(
+                input=session["input"],
+                new_items=all_items,
+                final_output=final_output_text,
+                usage=session["usage"],
+                timings=session["timings"],
+            )
+
+        if final_output_text:
+            prompt.add_assistant(final_output_text)
+
+        calls = list(tool_calls.values())
+        tool_outputs = Runner._run_tools(
+            agent, calls, session["runtime_context"], session["timings"]
+        )
+        Runner._add_tool_outputs(prompt, all_items, calls, tool_outputs)
+        return None
+
+
+class _FileContent:
+    """Minimal stand-in for the binary content returned by `files.content`."""
+
+    def __init__(self, data: bytes) -> None:
+        self.content = data
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def read(self) -> bytes:
+        return self.content
+
+
+class LocalBatchClient:
+    """In-process stand-in for the Files and Batches endpoints.
+
+    Implements the subset of the ``OpenAI`` client used by
+    ``BatchSubmitter`` and answers each request with `handler`, so batch
+    workloads can be exercised without network access. A batch reports
+    `in_progress` for `polls_until_complete` status checks before completing.
+
+    Example:
+        llm = ChatOpenAI(batch_client=LocalBatchClient(handler))
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[dict[str, Any]], Response],
+        *,
+        polls_until_complete: int = 1,
+    ) -> None:
+        """Create a local batch endpoint.
+
+        Args:
+            handler: Produces the response for the parameters of one request.
+                Exceptions are reported as failed requests.
+            polls_until_complete: Number of status checks before a batch completes.
+        """
+        self.handler = handler
+        self.polls_until_complete = polls_until_complete
+        self.files = _LocalFiles(self)
+        self.batches = _LocalBatches(self)
+        self._files: dict[str, bytes] = {}
+        self._batches: dict[str, Batch] = {}
+        self._remaining_polls: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._ids)}_{uuid.uuid4().hex[:8]}"
+
+    def _store_file(self, data: bytes, filename: str, purpose: str) -> FileObject:
+        file_id = self._new_id("file")
+        with self._lock:
+            self._files[file_id] = data
+        return FileObject(
+            id=file_id,
+            bytes=len(data),
+            created_at=int(time.time()),
+            filename=filename,
+            object="file",
+            purpose=purpose,
+            status="processed",
+        )
+
+    def _process(self, batch: Batch) -> Batch:
+        """Run every request of a batch through the handler."""
+        outputs: list[str] = []
+        errors: list[str] = []
+        for line in self._files[batch.input_file_id].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            custom_id = request["custom_id"]
+            try:
+                response = self.handler(request["body"])
+            except Exception as e:
+                errors.append(
+                    json.dumps(
+                        {
+                            "id": self._new_id("batch_req"),
+                            "custom_id": custom_id,
+                            "response": None,
+                            "error": {"code": type(e).__name__, "message": str(e)},
+                        }
+                    )
+                )
+                continue
+            outputs.append(
+                json.dumps(
+                    {
+                        "id": self._new_id("batch_req"),
+                        "custom_id": custom_id,
+                        "response": {
+                            "status_code": 200,
+                            "request_id": self._new_id("req"),
+                            "body": response.model_dump(mode="json"),
+                        },
+                        "error": None,
+                    }
+                )
+            )
+
+        updates: dict[str, Any] = {"status": "completed"}
+        if outputs:
+            output_file = self._store_file(
+                ("\n".join(outputs) + "\n").encode("utf-8"), "output.jsonl", "batch_output"
+            )
+            updates["output_file_id"] = output_file.id
+        if errors:
+            error_file = self._store_file(
+                ("\n".join(errors) + "\n").encode("utf-8"), "errors.jsonl", "batch_output"
+            )
+            updates["error_file_id"] = error_file.id
+        return batch.model_copy(update=updates)
+
+
+class _LocalFiles:
+    """The `files` resource of ``LocalBatchClient``."""
+
+    def __init__(self, owner: LocalBatchClient) -> None:
+        self._owner = owner
+
+    def create(self, *, file: Any, purpose: str, **_: Any) -> FileObject:
+        filename, data = file if isinstance(file, tuple) else ("upload", file)
+        if hasattr(data, "read"):
+            data = data.read()
+        return self._owner._store_file(bytes(data), filename, purpose)
+
+    def content(self, file_id: str, **_: Any) -> _FileContent:
+        return _FileContent(self._owner._files[file_id])
+
+
+class _LocalBatches:
+    """The `batches` resource of ``LocalBatchClient``."""
+
+    def __init__(self, owner: LocalBatchClient) -> None:
+        self._owner = owner
+
+    def create(
+        self,
+        *,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str,
+        **_: Any,
+    ) -> Batch:
+        owner = self._owner
+        if input_file_id not in owner._files:
+            raise ValueError(f"Unknown input file: {input_file_id}")
+        batch = Batch(
+            id=owner._new_id("batch"),
+            completion_window=completion_window,
+            created_at=int(time.time()),
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            object="batch",
+            status="validating",
+        )
+        with owner._lock:
+            owner._batches[batch.id] = batch
+            owner._remaining_polls[batch.id] = owner.polls_until_complete
+        return batch
+
+    def retrieve(self, batch_id: str, **_: Any) -> Batch:
+        owner = self._owner
+        with owner._lock:
+            batch = owner._batches[batch_id]
+            if batch.status in _TERMINAL_STATUSES:
+                return batch
+            if owner._remaining_polls[batch_id] > 0:
+                owner._remaining_polls[batch_id] -= 1
+                batch = batch.model_copy(update={"status": "in_progress"})
+            else:
+                batch = owner._process(batch)
+            owner._batches[batch_id] = batch
+            return batch
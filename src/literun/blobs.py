@@ -0,0 +1,119 @@
+"""Content-addressed storage for large tool outputs."""
+
+from __future__ import annotations
+
+import os
+import hashlib
+import tempfile
+
+from .cache import LRUCache
+from .constants import DEFAULT_BLOB_STORE_MAX_ENTRIES, BLOB_HANDLE_LENGTH
+
+
+class BlobStore:
+    """Thread-safe content-addressed text store.
+
+    Each blob is stored under a short handle derived from the SHA-256 of its
+    content, so storing the same content twice returns the same handle. Blobs
+    are kept in memory, evicting the least recently used ones beyond
+    `max_entries`, or written to files under `directory` when one is given.
+
+    Example:
+        store = BlobStore()
+        handle = store.put(huge_log)
+        store.read(handle, offset=0, length=4000)
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_entries: int | None = DEFAULT_BLOB_STORE_MAX_ENTRIES,
+    ) -> None:
+        """Create the store.
+
+        Args:
+            directory: Directory holding one file per blob. If None, blobs
+                are kept in memory.
+            max_entries: Maximum number of in-memory blobs. Ignored when
+                `directory` is set.
+        """
+        self.directory = directory
+        self._memory = LRUCache(max_entries=max_entries) if directory is None else None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def handle_for(content: str) -> str:
+        """Return the handle of `content`."""
+        return hashlib.sha256(content.encode()).hexdigest()[:BLOB_HANDLE_LENGTH]
+
+    def put(self, content: str) -> str:
+        """Store `content` and return its handle.
+
+        Args:
+            content: The text to store.
+
+        Returns:
+            str: The handle to retrieve the content with.
+        """
+        handle = self.handle_for(content)
+        if self._memory is not None:
+            self._memory.set(handle, content)
+            return handle
+
+        path = self._path(handle)
+        if not os.path.exists(path):
+            # Write to a temporary file first, so readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return handle
+
+    def get(self, handle: str) -> str | None:
+        """Return the content stored under `handle`, or None if unknown."""
+        if self._memory is not None:
+            return self._memory.get(handle)
+        if not self._is_handle(handle):
+            return None
+        try:
+            with open(self._path(handle), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def read(self, handle: str, offset: int = 0, length: int | None = None) -> str | None:
+        """Return a slice of a stored blob.
+
+        Args:
+            handle: The handle returned by ``put``.
+            offset: Index of the first character to return.
+            length: Maximum number of characters to return. None reads to the end.
+
+        Returns:
+            str | None: The requested characters, or None if the handle is unknown.
+        """
+        content = self.get(handle)
+        if content is None:
+            return None
+        end = None if length is None else offset + length
+        return content[offset:end]
+
+    def __contains__(self, handle: str) -> bool:
+        return self.get(handle) is not None
+
+    def clear(self) -> None:
+        """Remove all stored blobs."""
+        if self._memory is not None:
+            self._memory.clear()
+            return
+        for name in os.listdir(self.directory):
+            if self._is_handle(name):
+                os.remove(os.path.join(self.directory, name))
+
+    def _path(self, handle: str) -> str:
+        return os.path.join(self.directory, handle)
+
+    @staticmethod
+    def _is_handle(name: str) -> bool:
+        return len(name) == BLOB_HANDLE_LENGTH and all(c in "0123456789abcdef" for c in name)
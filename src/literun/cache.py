@@ -0,0 +1,352 @@
+"""Caching primitives and the LLM response cache."""
+
+from __future__ import annotations
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, AsyncIterator, Awaitable, Hashable, TYPE_CHECKING
+
+from .constants import DEFAULT_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from openai.types.responses import Response
+    from .events import ResponseStreamEvent
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU mapping with optional TTL expiry.
+
+    Entries are evicted least-recently-used first once `max_entries` is
+    exceeded, and treated as missing once they are older than `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl: float | None = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value stored for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                stored_at, value = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`, evicting the oldest entries if needed."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._data) > self.max_entries:
+                    self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _SQLiteStore:
+    """On-disk key/value store backed by a single sqlite table."""
+
+    def __init__(self, path: str, ttl: float | None) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            stored_at, value = row
+            if self.ttl is not None and time.time() - stored_at >= self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, value) VALUES (?, ?, ?)",
+                (key, time.time(), value),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Two-tier cache for model responses.
+
+    Requests are keyed on a canonical hash of the parameters sent to the
+    Responses API. The in-memory tier is an LRU with size and TTL eviction;
+    the optional on-disk tier (sqlite) survives restarts and is shared by
+    processes pointing at the same file.
+
+    Both regular ``Response`` objects and streamed event sequences are cached.
+    A stream is only stored once it has completed, and a cached stream replays
+    the same events as the live one.
+
+    Example:
+        cache = ResponseCache(max_entries=512, ttl=3600, path="responses.db")
+        llm = ChatOpenAI(model="gpt-4.1-mini", cache=cache)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl: float | None = None,
+        path: str | None = None,
+    ) -> None:
+        """Create a response cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory.
+            ttl: Optional lifetime of an entry, in seconds, in both tiers.
+            path: Optional sqlite database file for the on-disk tier.
+        """
+        self._memory = LRUCache(max_entries=max_entries, ttl=ttl)
+        self._disk = _SQLiteStore(path, ttl) if path else None
+        self._disk_hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups served from either tier."""
+        return self._memory.hits + self._disk_hits
+
+    @property
+    def memory_hits(self) -> int:
+        """Number of lookups served from the in-memory tier."""
+        return self._memory.hits
+
+    @property
+    def disk_hits(self) -> int:
+        """Number of lookups served from the on-disk tier."""
+        return self._disk_hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups found in neither tier."""
+        return self._misses
+
+    @staticmethod
+    def make_key(params: dict[str, Any]) -> str:
+        """Compute the canonical cache key of a request.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+
+        Returns:
+            str: A SHA-256 hex digest of the canonical JSON encoding.
+        """
+        encoded = json.dumps(
+            params, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Response | tuple[ResponseStreamEvent, ...] | None:
+        """Look up a cached response or event sequence.
+
+        Args:
+            key: The cache key returned by ``make_key``.
+
+        Returns:
+            Response | tuple[ResponseStreamEvent, ...] | None: The cached value, if any.
+        """
+        value = self._memory.get(key)
+        if value is not None:
+            return value
+
+        raw = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if raw is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+        value = _deserialize(raw)
+        self._memory.set(key, value)
+        return value
+
+    def set(
+        self, key: str, value: Response | tuple[ResponseStreamEvent, ...]
+    ) -> None:
+        """Store a response or a completed event sequence.
+
+        Args:
+            key: The cache key returned by ``make_key``.
+            value: The response, or the events of a completed stream.
+        """
+        self._memory.set(key, value)
+        if self._disk is not None:
+            self._disk.set(key, _serialize(value))
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers and reset the counters."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+        with self._lock:
+            self._disk_hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Close the on-disk tier, if any."""
+        if self._disk is not None:
+            self._disk.close()
+
+    def get_or_create(
+        self,
+        params: dict[str, Any],
+        create: Callable[[], Any],
+    ) -> Response | Iterator[ResponseStreamEvent]:
+        """Serve a request from the cache, or send it and cache the result.
+
+        Only completed responses are cached; failed or incomplete ones are
+        returned but sent again on the next request.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            create: Sends the request and returns a response or an event stream.
+
+        Returns:
+            Response | Iterator[ResponseStreamEvent]: The response or stream.
+        """
+        key = self.make_key(params)
+        cached = self.get(key)
+        if cached is not None:
+            return iter(cached) if params.get("stream") else cached
+
+        result = create()
+        if not params.get("stream"):
+            if getattr(result, "status", None) == "completed":
+                self.set(key, result)
+            return result
+        return self._record_stream(key, result)
+
+    async def aget_or_create(
+        self,
+        params: dict[str, Any],
+        acreate: Callable[[], Awaitable[Any]],
+    ) -> Response | AsyncIterator[ResponseStreamEvent]:
+        """Asynchronous counterpart of ``get_or_create``.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            acreate: Sends the request and returns a response or an async event stream.
+
+        Returns:
+            Response | AsyncIterator[ResponseStreamEvent]: The response or async stream.
+        """
+        key = self.make_key(params)
+        cached = self.get(key)
+        if cached is not None:
+            return _areplay(cached) if params.get("stream") else cached
+
+        result = await acreate()
+        if not params.get("stream"):
+            if getattr(result, "status", None) == "completed":
+                self.set(key, result)
+            return result
+        return self._arecord_stream(key, result)
+
+    def _record_stream(
+        self, key: str, stream: Iterator[ResponseStreamEvent]
+    ) -> Iterator[ResponseStreamEvent]:
+        """Yield a live stream, caching its events once it completes."""
+        events: list[ResponseStreamEvent] = []
+        for event in stream:
+            events.append(event)
+            yield event
+        if events and events[-1].type == "response.completed":
+            self.set(key, tuple(events))
+
+    async def _arecord_stream(
+        self, key: str, stream: AsyncIterator[ResponseStreamEvent]
+    ) -> AsyncIterator[ResponseStreamEvent]:
+        """Yield a live async stream, caching its events once it completes."""
+        events: list[ResponseStreamEvent] = []
+        async for event in stream:
+            events.append(event)
+            yield event
+        if events and events[-1].type == "response.completed":
+            self.set(key, tuple(events))
+
+
+async def _areplay(
+    events: tuple[ResponseStreamEvent, ...],
+) -> AsyncIterator[ResponseStreamEvent]:
+    """Replay cached events as an async stream."""
+    for event in events:
+        yield event
+
+
+def _serialize(value: Response | tuple[ResponseStreamEvent, ...]) -> str:
+    """Encode a cached value as JSON for the on-disk tier."""
+    if not isinstance(value, tuple):
+        return json.dumps({"kind": "response", "data": value.model_dump(mode="json")})
+    return json.dumps(
+        {"kind": "stream", "data": [event.model_dump(mode="json") for event in value]}
+    )
+
+
+def _deserialize(raw: str) -> Response | tuple[ResponseStreamEvent, ...]:
+    """Decode a value stored by ``_serialize``."""
+    from pydantic import TypeAdapter
+    from openai.types.responses import Response, ResponseStreamEvent as StreamEventUnion
+
+    payload = json.loads(raw)
+    if payload["kind"] == "response":
+        return Response.model_validate(payload["data"])
+    adapter = TypeAdapter(StreamEventUnion)
+    return tuple(adapter.validate_python(event) for event in payload["data"])
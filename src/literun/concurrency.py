@@ -0,0 +1,437 @@
+"""Adaptive concurrency limiting for requests to the Responses API."""
+
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Iterator, AsyncIterator, Awaitable, TYPE_CHECKING
+
+from .constants import (
+    DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+    DEFAULT_CONCURRENCY_MAX_LIMIT,
+    DEFAULT_CONCURRENCY_LATENCY_WINDOW,
+    DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    DEFAULT_CONCURRENCY_DECREASE_FACTOR,
+)
+
+if TYPE_CHECKING:
+    from .events import ResponseStreamEvent
+
+
+_shared_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+"""Process-wide registry of limiters created with ``AdaptiveConcurrencyLimiter.shared``."""
+
+_shared_limiters_lock = threading.Lock()
+
+_BASELINE_DRIFT = 0.1
+"""How far the latency baseline moves toward a slower window's p95, so a
+lasting shift in latency is eventually accepted as the new normal."""
+
+
+def _is_overload(error: BaseException) -> bool:
+    """Whether `error` signals an overloaded backend: a 429 or a timeout."""
+    if isinstance(error, TimeoutError):
+        return True
+    # An openai error can only be raised once the client library is loaded
+    openai = sys.modules.get("openai")
+    return openai is not None and isinstance(
+        error, (openai.RateLimitError, openai.APITimeoutError)
+    )
+
+
+class _Waiter:
+    """A queued request, woken by a sync event or an async future."""
+
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(
+        self,
+        event: threading.Event | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+        future: asyncio.Future | None = None,
+    ) -> None:
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits in-flight requests with an AIMD (additive increase,
+    multiplicative decrease) policy.
+
+    The limit grows by roughly one for every `limit` successful requests
+    while the limiter is saturated, and is cut by `decrease_factor` on rate
+    limit errors (429), timeouts, or when the p95 latency of the last
+    `latency_window` requests exceeds `latency_tolerance` times the baseline.
+    At most one decrease happens per `limit` completed requests, so a burst
+    of failures from the same window only counts once.
+
+    Requests beyond the limit wait in FIFO order. A limiter is thread-safe
+    and serves sync and async callers alike, so one instance can be shared
+    by every ``ChatOpenAI``, agent and batch run in the process.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter.shared("openai", max_limit=64)
+        llm = ChatOpenAI(model="gpt-4.1-mini", concurrency_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT,
+        decrease_factor: float = DEFAULT_CONCURRENCY_DECREASE_FACTOR,
+        latency_window: int = DEFAULT_CONCURRENCY_LATENCY_WINDOW,
+        latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    ) -> None:
+        """Create an adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at first.
+            min_limit: Lower bound of the limit.
+            max_limit: Upper bound of the limit.
+            decrease_factor: Factor the limit is multiplied by on overload.
+            latency_window: Number of requests per p95 latency sample.
+            latency_tolerance: Ratio of p95 latency to the baseline that
+                counts as overload.
+
+        Raises:
+            ValueError: If the bounds or factors are inconsistent.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if latency_window < 1:
+            raise ValueError("latency_window must be >= 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_window = latency_window
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._latencies: list[float] = []
+        self._baseline: float | None = None
+        self._since_decrease = initial_limit
+        # Re-entrant: stream wrappers may release from __del__ on this thread
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(
+        cls,
+        key: str,
+        *,
+        initial_limit: int = DEFAULT_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_CONCURRENCY_MAX_LIMIT,
+        decrease_factor: float = DEFAULT_CONCURRENCY_DECREASE_FACTOR,
+        latency_window: int = DEFAULT_CONCURRENCY_LATENCY_WINDOW,
+        latency_tolerance: float = DEFAULT_CONCURRENCY_LATENCY_TOLERANCE,
+    ) -> AdaptiveConcurrencyLimiter:
+        """Return the process-wide limiter registered under `key`.
+
+        The limiter is created on first use; later calls with the same key
+        and settings return the same instance.
+
+        Args:
+            key: Name of the shared limiter, e.g. a provider or deployment.
+            initial_limit: Number of requests allowed in flight at first.
+            min_limit: Lower bound of the limit.
+            max_limit: Upper bound of the limit.
+            decrease_factor: Factor the limit is multiplied by on overload.
+            latency_window: Number of requests per p95 latency sample.
+            latency_tolerance: Ratio of p95 latency to the baseline that
+                counts as overload.
+
+        Returns:
+            ``AdaptiveConcurrencyLimiter``: The shared limiter.
+
+        Raises:
+            ValueError: If a limiter with different settings is already
+                registered under `key`.
+        """
+        settings = {
+            "initial_limit": initial_limit,
+            "min_limit": min_limit,
+            "max_limit": max_limit,
+            "decrease_factor": decrease_factor,
+            "latency_window": latency_window,
+            "latency_tolerance": latency_tolerance,
+        }
+        with _shared_limiters_lock:
+            limiter = _shared_limiters.get(key)
+            if limiter is None:
+                limiter = cls(**settings)
+                _shared_limiters[key] = limiter
+            else:
+                registered = {name: getattr(limiter, name) for name in settings}
+                if registered != settings:
+                    described = ", ".join(f"{k}={v}" for k, v in registered.items())
+                    raise ValueError(
+                        f"Concurrency limiter '{key}' already exists with {described}"
+                    )
+            return limiter
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        waiter.event.wait()
+
+    async def aacquire(self) -> None:
+        """Wait until a request slot is available, without blocking the loop."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._release_locked()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(
+        self, latency: float | None = None, *, overloaded: bool = False
+    ) -> None:
+        """Free a request slot and feed the outcome back into the limit.
+
+        Args:
+            latency: Latency of a successful request in seconds, if any.
+            overloaded: Whether the request failed with an overload signal.
+        """
+        with self._lock:
+            self._since_decrease += 1
+            if overloaded:
+                self._decrease()
+            elif latency is not None:
+                self._record_latency(latency)
+            self._release_locked()
+
+    def _release_locked(self) -> None:
+        """Free a slot and hand free slots to waiters in FIFO order."""
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft().wake()
+
+    def _decrease(self) -> None:
+        if self._since_decrease < self.limit:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._since_decrease = 0
+
+    def _record_latency(self, latency: float) -> None:
+        # Only grow while the limit is actually the bottleneck
+        if self._waiters or self._in_flight >= self.limit:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+        self._latencies.append(latency)
+        if len(self._latencies) < self.latency_window:
+            return
+        latencies = sorted(self._latencies)
+        self._latencies.clear()
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        if self._baseline is None or p95 < self._baseline:
+            self._baseline = p95
+            return
+        if p95 > self._baseline * self.latency_tolerance:
+            self._decrease()
+        self._baseline += (p95 - self._baseline) * _BASELINE_DRIFT
+
+    def call(
+        self,
+        params: dict[str, Any],
+        create: Callable[[], Any],
+    ) -> Any:
+        """Send a request within the limit and record its outcome.
+
+        Streams hold their slot until they are exhausted or closed; their
+        latency is the time until the stream is opened.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            create: Sends the request and returns a response or an event stream.
+
+        Returns:
+            Response | Iterator[ResponseStreamEvent]: The response or stream.
+        """
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            result = create()
+        except BaseException as e:
+            self.release(overloaded=_is_overload(e))
+            raise
+        latency = time.perf_counter() - start
+        if params.get("stream"):
+            return _LimitedStream(self, result, latency)
+        self.release(latency)
+        return result
+
+    async def acall(
+        self,
+        params: dict[str, Any],
+        acreate: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Asynchronous counterpart of ``call``.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            acreate: Sends the request and returns a response or an async event stream.
+
+        Returns:
+            Response | AsyncIterator[ResponseStreamEvent]: The response or async stream.
+        """
+        await self.aacquire()
+        start = time.perf_counter()
+        try:
+            result = await acreate()
+        except BaseException as e:
+            self.release(overloaded=_is_overload(e))
+            raise
+        latency = time.perf_counter() - start
+        if params.get("stream"):
+            return _LimitedAsyncStream(self, result, latency)
+        self.release(latency)
+        return result
+
+
+class _LimitedStream:
+    """Iterator that holds a limiter slot until the stream ends."""
+
+    __slots__ = ("_limiter", "_stream", "_latency", "_released")
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        stream: Iterator[ResponseStreamEvent],
+        latency: float,
+    ) -> None:
+        self._limiter = limiter
+        self._stream = iter(stream)
+        self._latency = latency
+        self._released = False
+
+    def _release(self, error: BaseException | None = None) -> None:
+        if self._released:
+            return
+        self._released = True
+        if error is None:
+            self._limiter.release(self._latency)
+        else:
+            self._limiter.release(overloaded=_is_overload(error))
+
+    def __iter__(self) -> _LimitedStream:
+        return self
+
+    def __next__(self) -> ResponseStreamEvent:
+        try:
+            return next(self._stream)
+        except StopIteration:
+            self._release()
+            raise
+        except BaseException as e:
+            self._release(e)
+            raise
+
+    def close(self) -> None:
+        self._release()
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+    def __del__(self) -> None:
+        self._release()
+
+
+class _LimitedAsyncStream:
+    """Async iterator that holds a limiter slot until the stream ends."""
+
+    __slots__ = ("_limiter", "_stream", "_latency", "_released")
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        stream: AsyncIterator[ResponseStreamEvent],
+        latency: float,
+    ) -> None:
+        self._limiter = limiter
+        self._stream = stream.__aiter__()
+        self._latency = latency
+        self._released = False
+
+    _release = _LimitedStream._release
+
+    def __aiter__(self) -> _LimitedAsyncStream:
+        return self
+
+    async def __anext__(self) -> ResponseStreamEvent:
+        try:
+            return await self._stream.__anext__()
+        except StopAsyncIteration:
+            self._release()
+            raise
+        except BaseException as e:
+            self._release(e)
+            raise
+
+    async def aclose(self) -> None:
+        self._release()
+        aclose = getattr(self._stream, "aclose", None) or getattr(
+            self._stream, "close", None
+        )
+        if aclose is not None:
+            await aclose()
+
+    def __del__(self) -> None:
+        self._release()
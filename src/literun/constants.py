@@ -10,6 +10,8 @@ Role = Literal["system", "user", "assistant", "tool"]
 ContentType = Literal["text", "tool_call", "tool_call_output"]
 
 ToolChoice = Literal["auto", "none", "required"]
+ToolExecution = Literal["sequential", "thread"]
+ToolExecutionMode = Literal["inline", "thread", "process"]
 ReasoningEffort = Literal["none", "low", "medium", "high"]
 Verbosity = Literal["low", "medium", "high"]
 TextFormat = Literal["text", "json_object", "json_schema"]
@@ -19,3 +21,32 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_TIMEOUT = 60.0  # seconds
 DEFAULT_MAX_TOOL_CALLS_LIMIT = 10
 DEFAULT_MAX_ITERATIONS_LIMIT = 20
+DEFAULT_MAX_CONCURRENT_TOOL_CALLS = 8
+DEFAULT_BATCH_CONCURRENCY = 16
+DEFAULT_BATCH_POLL_INTERVAL = 30.0  # seconds
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CHARS_PER_TOKEN = 4.0
+DEFAULT_MESSAGE_TOKEN_OVERHEAD = 4
+DEFAULT_COMPACTION_MODEL = "gpt-4.1-nano"
+DEFAULT_COMPACTION_KEEP_RECENT_TOKENS = 2000
+DEFAULT_COMPACTION_INSTRUCTIONS = (
+    "Summarize the conversation transcript below for an assistant that will "
+    "continue it without access to the transcript. Keep the user's goals, "
+    "decisions made, facts and results returned by tools, identifiers, and "
+    "open questions. Be concise and omit pleasantries."
+)
+COMPACTION_SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+DEFAULT_TOOL_OUTPUT_MAX_CHARS = 20_000
+DEFAULT_TOOL_OUTPUT_PREVIEW_CHARS = 2_000
+DEFAULT_TOOL_OUTPUT_PAGE_CHARS = 8_000
+DEFAULT_BLOB_STORE_MAX_ENTRIES = 256
+BLOB_HANDLE_LENGTH = 16
+READ_TOOL_OUTPUT_TOOL_NAME = "read_tool_output"
+PROCESS_POOL_START_METHOD = "spawn"
+DEFAULT_PROCESS_RESULT_SHM_THRESHOLD = 1024 * 1024  # bytes
+DEFAULT_TOOL_EXECUTOR_MAX_WORKERS = 4
+DEFAULT_CONCURRENCY_INITIAL_LIMIT = 4
+DEFAULT_CONCURRENCY_MAX_LIMIT = 64
+DEFAULT_CONCURRENCY_LATENCY_WINDOW = 20
+DEFAULT_CONCURRENCY_LATENCY_TOLERANCE = 2.0
+DEFAULT_CONCURRENCY_DECREASE_FACTOR = 0.5
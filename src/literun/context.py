@@ -0,0 +1,464 @@
+"""Context window management for long agent conversations."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Sequence, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+from .message import PromptMessage
+from .prompt import PromptTemplate
+from .backend import ModelBackend
+from .constants import (
+    DEFAULT_CHARS_PER_TOKEN,
+    DEFAULT_MESSAGE_TOKEN_OVERHEAD,
+    DEFAULT_COMPACTION_MODEL,
+    DEFAULT_COMPACTION_KEEP_RECENT_TOKENS,
+    DEFAULT_COMPACTION_INSTRUCTIONS,
+    COMPACTION_SUMMARY_PREFIX,
+)
+
+if TYPE_CHECKING:
+    from openai.types.responses import Response
+
+
+class _TokenEstimator(BaseModel):
+    """Fast local estimate of the input tokens of prompt messages."""
+
+    chars_per_token: float = DEFAULT_CHARS_PER_TOKEN
+    """Average number of characters per token used by the estimator."""
+
+    message_overhead: int = DEFAULT_MESSAGE_TOKEN_OVERHEAD
+    """Estimated tokens added per message for its role and framing."""
+
+    @model_validator(mode="after")
+    def _validate_estimator(self) -> _TokenEstimator:
+        if self.chars_per_token <= 0:
+            raise ValueError("chars_per_token must be > 0")
+        return self
+
+    def estimate_tokens(self, message: PromptMessage) -> int:
+        """Estimate the number of input tokens of a message.
+
+        Args:
+            message: The message to estimate.
+
+        Returns:
+            int: The estimated number of tokens.
+        """
+        chars = (
+            len(message.text or "")
+            + len(message.name or "")
+            + len(message.arguments or "")
+            + len(message.output or "")
+        )
+        return int(chars / self.chars_per_token) + self.message_overhead
+
+
+class ContextPolicy(_TokenEstimator):
+    """Token budget for the conversation history sent on each model call.
+
+    Before every request, the history is estimated with a fast local
+    character-based estimator. If it exceeds `max_input_tokens`, the oldest
+    items are left out of the request, sliding the window forward. System
+    messages and the latest user turn (its message and everything after it)
+    are always kept, and a tool call is never sent without its output or
+    the other way around. The agent's own
+    prompt is not modified, only the request input.
+
+    Example:
+        Agent(llm=llm, tools=tools, context_policy=ContextPolicy(max_input_tokens=8000))
+    """
+
+    max_input_tokens: int
+    """Maximum estimated number of input tokens per request."""
+
+    @model_validator(mode="after")
+    def _validate_budget(self) -> ContextPolicy:
+        if self.max_input_tokens < 1:
+            raise ValueError("max_input_tokens must be >= 1")
+        return self
+
+    def apply(
+        self, prompt: PromptTemplate
+    ) -> tuple[PromptTemplate | list[dict[str, Any]], int]:
+        """Fit a prompt into the token budget.
+
+        Args:
+            prompt: The full conversation history.
+
+        Returns:
+            tuple[PromptTemplate | list[dict[str, Any]], int]: The request
+            input, i.e. `prompt` itself if it fits or the kept items in
+            OpenAI format, and the estimated number of tokens left out.
+        """
+        messages = prompt.messages
+        costs = [self.estimate_tokens(message) for message in messages]
+        total = sum(costs)
+        if total <= self.max_input_tokens:
+            return prompt, 0
+
+        pinned = _pinned(messages)
+        kept = [True] * len(messages)
+        for start, end in _units(messages):
+            if total <= self.max_input_tokens:
+                break
+            if any(pinned[start:end]):
+                continue
+            for index in range(start, end):
+                kept[index] = False
+            total -= sum(costs[start:end])
+
+        serialized = prompt.convert_to_openai_input()
+        input_ = [item for item, keep in zip(serialized, kept) if keep]
+        saved = sum(cost for cost, keep in zip(costs, kept) if not keep)
+        return input_, saved
+
+
+class Compaction(BaseModel):
+    """A summary of a span of history, ready to replace it in a prompt.
+
+    Built by ``HistoryCompactor``. A compaction can be computed on a snapshot
+    of the history, e.g. in the background, and applied later as long as the
+    summarized span is still unchanged.
+    """
+
+    start: int
+    """Index of the first summarized message."""
+
+    replaced: list[PromptMessage]
+    """The messages of the span, as they were in the history."""
+
+    summary: PromptMessage
+    """The system message holding the summary."""
+
+    kept: list[PromptMessage] = Field(default_factory=list)
+    """Messages of the span kept verbatim after the summary, i.e. the latest user message."""
+
+    tokens_saved: int = 0
+    """Estimated number of tokens removed from the history."""
+
+    def apply(self, prompt: PromptTemplate) -> bool:
+        """Replace the summarized span of `prompt` with the summary.
+
+        Args:
+            prompt: The history to compact, modified in place.
+
+        Returns:
+            bool: True if the compaction was applied, False if the span no
+            longer matches the history.
+        """
+        end = self.start + len(self.replaced)
+        current = prompt.messages[self.start : end]
+        if len(current) != len(self.replaced) or any(
+            message is not replaced for message, replaced in zip(current, self.replaced)
+        ):
+            return False
+        prompt.replace_messages(self.start, end, [self.summary, *self.kept])
+        return True
+
+
+class HistoryCompactor(_TokenEstimator):
+    """Compacts long histories by summarizing their older part.
+
+    When the estimated size of a history exceeds `trigger_tokens`, everything
+    but the leading system messages and the most recent items (about
+    `keep_recent_tokens`) is replaced by a summary written by `llm`, usually
+    a cheaper model than the agent's. Tool calls and their outputs are
+    summarized together. The latest user message is always kept verbatim.
+
+    Set as ``Agent.compaction`` to compact during runs. With `background`,
+    the summary of a turn is written while its tools execute. Multi-turn
+    sessions can also compact their own template between turns with
+    ``compact`` or ``submit``.
+
+    Example:
+        compactor = HistoryCompactor(
+            llm=ChatOpenAI(model="gpt-4.1-nano"), trigger_tokens=50_000
+        )
+        agent = Agent(llm=llm, tools=tools, compaction=compactor)
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    llm: ModelBackend = Field(default_factory=lambda: _default_compaction_llm())
+    """The model that writes the summaries.
+
+    Defaults to a ``ChatOpenAI`` with a small, inexpensive model.
+    """
+
+    trigger_tokens: int
+    """Estimated history size above which the history is compacted."""
+
+    keep_recent_tokens: int = DEFAULT_COMPACTION_KEEP_RECENT_TOKENS
+    """Estimated size of the most recent items kept verbatim."""
+
+    instructions: str = DEFAULT_COMPACTION_INSTRUCTIONS
+    """The system prompt of the summarization request."""
+
+    background: bool = True
+    """Whether agent runs write the summary while a turn's tools execute.
+
+    Otherwise the summary is written right before the next model call.
+    """
+
+    _executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+    """Thread running the summaries submitted with ``submit``."""
+
+    _executor_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    """Guards the lazy creation of the executor."""
+
+    @model_validator(mode="after")
+    def _validate_thresholds(self) -> HistoryCompactor:
+        if self.trigger_tokens < 1:
+            raise ValueError("trigger_tokens must be >= 1")
+        if not 0 <= self.keep_recent_tokens < self.trigger_tokens:
+            raise ValueError("keep_recent_tokens must be >= 0 and < trigger_tokens")
+        return self
+
+    def needs_compaction(self, prompt: PromptTemplate) -> bool:
+        """Check whether a history exceeds `trigger_tokens`.
+
+        Args:
+            prompt: The history to check.
+
+        Returns:
+            bool: True if the history should be compacted.
+        """
+        return sum(map(self.estimate_tokens, prompt.messages)) > self.trigger_tokens
+
+    def compact(self, prompt: PromptTemplate) -> bool:
+        """Compact a history in place if it exceeds `trigger_tokens`.
+
+        Args:
+            prompt: The history to compact.
+
+        Returns:
+            bool: True if the history was compacted.
+        """
+        if not self.needs_compaction(prompt):
+            return False
+        compaction = self.summarize(prompt)
+        return compaction is not None and compaction.apply(prompt)
+
+    async def acompact(self, prompt: PromptTemplate) -> bool:
+        """Asynchronous counterpart of ``compact``."""
+        if not self.needs_compaction(prompt):
+            return False
+        compaction = await self.asummarize(prompt)
+        return compaction is not None and compaction.apply(prompt)
+
+    def summarize(self, prompt: PromptTemplate) -> Compaction | None:
+        """Summarize the older part of a history, regardless of its size.
+
+        Args:
+            prompt: The history to summarize. It is not modified.
+
+        Returns:
+            Compaction | None: The compaction to apply, or None if there is
+            nothing old enough to summarize.
+        """
+        plan = self._plan(prompt)
+        if plan is None:
+            return None
+        response = self.llm.chat(messages=self._request(plan))
+        return self._compaction(plan, response)
+
+    async def asummarize(self, prompt: PromptTemplate) -> Compaction | None:
+        """Asynchronous counterpart of ``summarize``."""
+        plan = self._plan(prompt)
+        if plan is None:
+            return None
+        response = await self.llm.achat(messages=self._request(plan))
+        return self._compaction(plan, response)
+
+    def submit(self, prompt: PromptTemplate) -> Future[Compaction | None]:
+        """Summarize a snapshot of a history on a background thread.
+
+        The history can keep growing meanwhile. Apply the result with
+        ``Compaction.apply`` once it is needed, e.g. before the next turn.
+
+        Args:
+            prompt: The history to summarize.
+
+        Returns:
+            Future[Compaction | None]: The pending result of ``summarize``.
+        """
+        return self._get_executor().submit(self.summarize, prompt.copy())
+
+    def asubmit(self, prompt: PromptTemplate) -> asyncio.Task[Compaction | None]:
+        """Summarize a snapshot of a history in a background task.
+
+        Must be called from a running event loop.
+
+        Args:
+            prompt: The history to summarize.
+
+        Returns:
+            asyncio.Task[Compaction | None]: The pending result of ``asummarize``.
+        """
+        return asyncio.ensure_future(self.asummarize(prompt.copy()))
+
+    def close(self) -> None:
+        """Shut down the background thread, if any."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="literun-compaction"
+                )
+            return self._executor
+
+    def _plan(
+        self, prompt: PromptTemplate
+    ) -> tuple[int, list[PromptMessage], list[PromptMessage]] | None:
+        """Choose the span of history to summarize.
+
+        The span starts after the leading system messages, so a previous
+        summary is summarized again, and ends before the most recent units
+        worth `keep_recent_tokens`. The last unit is always kept.
+
+        Returns:
+            tuple[int, list[PromptMessage], list[PromptMessage]] | None: The
+            span start, its messages and those of them kept verbatim, or None
+            if there is nothing to summarize.
+        """
+        messages = prompt.messages
+        start = 0
+        while start < len(messages) and _is_instruction(messages[start]):
+            start += 1
+
+        end = len(messages)
+        recent = 0
+        for unit_start, unit_end in reversed(_units(messages)):
+            if unit_start < start or (end < len(messages) and recent >= self.keep_recent_tokens):
+                break
+            recent += sum(map(self.estimate_tokens, messages[unit_start:unit_end]))
+            end = unit_start
+
+        span = messages[start:end]
+        latest_user = _latest_user(messages)
+        kept = [messages[latest_user]] if latest_user is not None and start <= latest_user < end else []
+        summarized = len(span) - len(kept)
+        if summarized == 0 or (summarized == 1 and _is_summary(span[0])):
+            return None
+        return start, span, kept
+
+    def _request(
+        self, plan: tuple[int, list[PromptMessage], list[PromptMessage]]
+    ) -> PromptTemplate:
+        """Build the summarization request for a planned span."""
+        _, span, kept = plan
+        messages = [message for message in span if not any(message is k for k in kept)]
+        return PromptTemplate().add_system(self.instructions).add_user(_transcript(messages))
+
+    def _compaction(
+        self,
+        plan: tuple[int, list[PromptMessage], list[PromptMessage]],
+        response: Response,
+    ) -> Compaction:
+        """Build the compaction of a planned span from the summary response."""
+        start, span, kept = plan
+        summary = PromptMessage(
+            role="system",
+            content_type="text",
+            text=COMPACTION_SUMMARY_PREFIX + response.output_text.strip(),
+        )
+        removed = sum(map(self.estimate_tokens, span))
+        added = sum(map(self.estimate_tokens, [summary, *kept]))
+        return Compaction(
+            start=start,
+            replaced=span,
+            summary=summary,
+            kept=kept,
+            tokens_saved=max(0, removed - added),
+        )
+
+
+def _default_compaction_llm() -> ModelBackend:
+    from .llm import ChatOpenAI
+
+    return ChatOpenAI(model=DEFAULT_COMPACTION_MODEL)
+
+
+def _is_summary(message: PromptMessage) -> bool:
+    """Check whether a message is a summary written by ``HistoryCompactor``."""
+    return message.role == "system" and (message.text or "").startswith(COMPACTION_SUMMARY_PREFIX)
+
+
+def _is_instruction(message: PromptMessage) -> bool:
+    """Check whether a message is a system prompt, as opposed to a summary."""
+    return message.role == "system" and not _is_summary(message)
+
+
+def _transcript(messages: list[PromptMessage]) -> str:
+    """Render messages as a plain-text transcript for summarization."""
+    lines = []
+    for message in messages:
+        if message.content_type == "tool_call":
+            lines.append(f"[tool call {message.call_id}] {message.name}({message.arguments})")
+        elif message.content_type == "tool_call_output":
+            lines.append(f"[tool output {message.call_id}] {message.output}")
+        elif _is_summary(message):
+            lines.append(f"[earlier summary] {message.text[len(COMPACTION_SUMMARY_PREFIX):]}")
+        else:
+            lines.append(f"[{message.role}] {message.text}")
+    return "\n\n".join(lines)
+
+
+def _latest_user(messages: Sequence[PromptMessage]) -> int | None:
+    """Return the index of the latest user message, if any."""
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].role == "user":
+            return index
+    return None
+
+
+def _pinned(messages: Sequence[PromptMessage]) -> list[bool]:
+    """Mark the system messages and the latest user turn.
+
+    The turn runs from the latest user message to the end of the history,
+    so the tool calls and outputs the model is working with are never left
+    out.
+    """
+    pinned = [message.role == "system" for message in messages]
+    latest_user = _latest_user(messages)
+    if latest_user is not None:
+        pinned[latest_user:] = [True] * (len(messages) - latest_user)
+    return pinned
+
+
+def _units(messages: Sequence[PromptMessage]) -> list[tuple[int, int]]:
+    """Split the history into evictable units, oldest first.
+
+    A unit is a single message, or a span from a tool call to its output
+    that also holds any calls and outputs interleaved with them.
+
+    Returns:
+        list[tuple[int, int]]: The `[start, end)` index range of each unit.
+    """
+    output_index: dict[str, int] = {}
+    for index, message in enumerate(messages):
+        if message.content_type == "tool_call_output":
+            output_index[message.call_id] = index
+
+    units: list[tuple[int, int]] = []
+    start = 0
+    while start < len(messages):
+        end = start + 1
+        index = start
+        while index < end:
+            message = messages[index]
+            if message.content_type == "tool_call":
+                end = max(end, output_index.get(message.call_id, index) + 1)
+            index += 1
+        units.append((start, end))
+        start = end
+    return units
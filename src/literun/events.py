@@ -6,6 +6,7 @@ from typing import Literal, TypeAlias
 from pydantic import BaseModel
 
 from .items import ResponseFunctionToolCallOutput
+from .usage import RunUsage, RunTimings
 from openai.types.responses import (
     ResponseErrorEvent,
     ResponseFailedEvent,
@@ -101,10 +102,30 @@ class ResponseFunctionCallOutputItemDoneEvent(BaseModel):
     """The type of the event. Always `response.function_call_output_item.done`."""
 
 
+class RunCompletedEvent(BaseModel):
+    """Emitted once at the end of a streamed agent run, with its usage summary."""
+
+    final_output: str
+    """The output produced by the final agent invocation."""
+
+    usage: RunUsage
+    """Token usage aggregated over all model calls of the run."""
+
+    timings: RunTimings
+    """Latency breakdown of the run."""
+
+    sequence_number: None = None
+    """The sequence number of this event. Always `None` for run events."""
+
+    type: Literal["run.completed"] = "run.completed"
+    """The type of the event. Always `run.completed`."""
+
+
 TResponseStreamEvent = ResponseStreamEvent
 
 StreamEvent: TypeAlias = (
     TResponseStreamEvent
     | ResponseFunctionCallOutputItemAddedEvent
     | ResponseFunctionCallOutputItemDoneEvent
+    | RunCompletedEvent
 )
@@ -0,0 +1,400 @@
+"""Managed executors for running tools outside the calling thread."""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+import contextvars
+from typing import Any, Callable, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from .constants import (
+    PROCESS_POOL_START_METHOD,
+    DEFAULT_PROCESS_RESULT_SHM_THRESHOLD,
+    DEFAULT_TOOL_EXECUTOR_MAX_WORKERS,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+_process_pool: ProcessPoolExecutor | None = None
+"""The process-wide pool used by tools with `execution_mode="process"`."""
+
+_process_pool_workers: int | None = None
+"""The configured pool size. None uses the number of CPUs."""
+
+_process_pool_lock = threading.Lock()
+
+_tool_executors: dict[str, ToolExecutor] = {}
+"""Process-wide named tool executors, see ``register_tool_executor``."""
+
+_tool_executors_lock = threading.Lock()
+
+_queue_wait: contextvars.ContextVar[float] = contextvars.ContextVar(
+    "literun_tool_queue_wait", default=0.0
+)
+"""Queue wait of the latest tool call run on a ``ToolExecutor`` in this context."""
+
+
+class ToolExecutorFullError(RuntimeError):
+    """Raised when a call is submitted to a ``ToolExecutor`` whose queue is full."""
+
+
+class ToolExecutor:
+    """A named, bounded thread pool for synchronous tools.
+
+    Without one, async runs execute sync tools on the event loop's default
+    executor, which is shared with the rest of the application (DNS
+    resolution included), and sync runs in the calling thread or on the
+    agent's tool pool. Giving slow tools their own executor keeps them from
+    starving unrelated work. Tools sharing an executor, by instance or by
+    name, form a group that shares its workers and queue.
+
+    At most `max_workers` calls run at once. When `max_queue` is set, calls
+    beyond `max_workers + max_queue` pending ones are rejected with
+    ``ToolExecutorFullError`` instead of queuing without bound.
+
+    Example:
+        pdf_pool = ToolExecutor("pdf", max_workers=2, max_queue=8)
+        Tool(func=parse_pdf, executor=pdf_pool)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_TOOL_EXECUTOR_MAX_WORKERS,
+        max_queue: int | None = None,
+    ) -> None:
+        """Configure the executor. Threads are started on first use.
+
+        Args:
+            name: The executor name, used to refer to it from tools and in
+                thread names.
+            max_workers: Maximum number of calls running at once.
+            max_queue: Maximum number of calls waiting for a worker. None
+                means unbounded.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._slots = (
+            threading.BoundedSemaphore(max_workers + max_queue)
+            if max_queue is not None
+            else None
+        )
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[..., Any], /, **kwargs: Any) -> Future:
+        """Schedule `func(**kwargs)` in the caller's context.
+
+        Args:
+            func: The function to call.
+            **kwargs: The keyword arguments.
+
+        Returns:
+            Future: Resolves to the result and the seconds spent waiting for
+            a worker.
+
+        Raises:
+            ToolExecutorFullError: If the queue is full.
+        """
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            raise ToolExecutorFullError(
+                f"Tool executor '{self.name}' is full "
+                f"({self.max_workers} running, {self.max_queue} queued)"
+            )
+        enqueued = time.perf_counter()
+
+        def call() -> tuple[Any, float]:
+            queue_wait = time.perf_counter() - enqueued
+            try:
+                return func(**kwargs), queue_wait
+            finally:
+                if self._slots is not None:
+                    self._slots.release()
+
+        try:
+            return self._get_pool().submit(contextvars.copy_context().run, call)
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+
+    def run(self, func: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Run `func(**kwargs)` on the executor and wait for its result.
+
+        The time spent waiting for a worker is recorded for the calling
+        run's tool timings.
+
+        Raises:
+            ToolExecutorFullError: If the queue is full.
+        """
+        result, queue_wait = self.submit(func, **kwargs).result()
+        _queue_wait.set(queue_wait)
+        return result
+
+    async def arun(self, func: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Run `func(**kwargs)` on the executor and await its result.
+
+        The time spent waiting for a worker is recorded for the calling
+        run's tool timings.
+
+        Raises:
+            ToolExecutorFullError: If the queue is full.
+        """
+        result, queue_wait = await asyncio.wrap_future(self.submit(func, **kwargs))
+        _queue_wait.set(queue_wait)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads. The executor restarts them if used again."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"literun-{self.name}",
+                )
+            return self._pool
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolExecutor(name={self.name!r}, max_workers={self.max_workers}, "
+            f"max_queue={self.max_queue})"
+        )
+
+
+def register_tool_executor(executor: ToolExecutor) -> ToolExecutor:
+    """Make an executor available by name to every agent in the process.
+
+    Agents resolve a tool's executor name in their own `tool_executors`
+    first, then in this registry. Registering a name again replaces the
+    previous executor, which is shut down once its calls complete.
+
+    Args:
+        executor: The executor to register.
+
+    Returns:
+        ``ToolExecutor``: The registered executor.
+    """
+    with _tool_executors_lock:
+        previous = _tool_executors.get(executor.name)
+        _tool_executors[executor.name] = executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+    return executor
+
+
+def get_tool_executor(name: str) -> ToolExecutor:
+    """Return the process-wide executor registered under `name`.
+
+    Raises:
+        KeyError: If no executor is registered under `name`.
+    """
+    with _tool_executors_lock:
+        executor = _tool_executors.get(name)
+    if executor is None:
+        raise KeyError(f"No tool executor registered under '{name}'")
+    return executor
+
+
+def shutdown_tool_executors(wait: bool = True) -> None:
+    """Shut down and unregister all process-wide tool executors."""
+    with _tool_executors_lock:
+        executors = list(_tool_executors.values())
+        _tool_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+def take_queue_wait() -> float:
+    """Return and reset the queue wait recorded by the latest executor call."""
+    queue_wait = _queue_wait.get()
+    if queue_wait:
+        _queue_wait.set(0.0)
+    return queue_wait
+
+
+class _SharedResult:
+    """A large ``str`` or ``bytes`` result passed back through shared memory.
+
+    Only the segment name travels through the pool's result pipe; the parent
+    copies the payload out once and releases the segment.
+    """
+
+    __slots__ = ("name", "size", "is_text")
+
+    def __init__(self, name: str, size: int, is_text: bool) -> None:
+        self.name = name
+        self.size = size
+        self.is_text = is_text
+
+
+def _warm_up() -> None:
+    """No-op task that forces a worker process to start."""
+
+
+def _call_in_process(func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+    """Run `func` in a worker and prepare its result for the trip back."""
+    result = func(**kwargs)
+    if (
+        isinstance(result, (str, bytes))
+        and len(result) >= DEFAULT_PROCESS_RESULT_SHM_THRESHOLD
+    ):
+        from multiprocessing.shared_memory import SharedMemory
+
+        is_text = isinstance(result, str)
+        payload = result.encode() if is_text else result
+        segment = SharedMemory(create=True, size=len(payload))
+        try:
+            segment.buf[: len(payload)] = payload
+        finally:
+            segment.close()
+        return _SharedResult(segment.name, len(payload), is_text)
+    return result
+
+
+def _unwrap(result: Any) -> Any:
+    """Read back a result returned by ``_call_in_process``."""
+    if not isinstance(result, _SharedResult):
+        return result
+    from multiprocessing.shared_memory import SharedMemory
+
+    segment = SharedMemory(name=result.name)
+    try:
+        payload = bytes(segment.buf[: result.size])
+    finally:
+        segment.close()
+        segment.unlink()
+    return payload.decode() if result.is_text else payload
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool used by tools with `execution_mode="process"`.
+
+    The pool is created on first use with the ``spawn`` start method, and all
+    of its workers are started right away so that the first tool calls do
+    not pay the process start-up cost.
+
+    Returns:
+        ``ProcessPoolExecutor``: The shared pool.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = _create_process_pool(_process_pool_workers)
+        return _process_pool
+
+
+def configure_process_pool(max_workers: int | None = None) -> None:
+    """Set the size of the tool process pool.
+
+    An existing pool is shut down once its pending calls complete, and a new
+    one is created on the next process tool call.
+
+    Args:
+        max_workers: Number of worker processes. None uses the number of CPUs.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+    """
+    global _process_pool_workers
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    with _process_pool_lock:
+        _process_pool_workers = max_workers
+    shutdown_process_pool()
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shut down the tool process pool, if it was created.
+
+    Args:
+        wait: Whether to wait for pending calls to complete.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def run_in_process(func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+    """Call `func(**kwargs)` in the tool process pool and wait for the result.
+
+    Only `func`, pickled by reference, and `kwargs` are sent to the worker.
+
+    Args:
+        func: A picklable, module-level function.
+        kwargs: The keyword arguments. Must be picklable.
+
+    Returns:
+        Any: The function's return value.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool, future = _submit(func, kwargs)
+    try:
+        return _unwrap(future.result())
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
+
+
+async def arun_in_process(func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+    """Asynchronous counterpart of ``run_in_process``."""
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool, future = _submit(func, kwargs)
+    try:
+        return _unwrap(await asyncio.wrap_future(future))
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
+
+
+def _submit(
+    func: Callable[..., Any], kwargs: dict[str, Any]
+) -> tuple[ProcessPoolExecutor, Future]:
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = get_process_pool()
+    try:
+        return pool, pool.submit(_call_in_process, func, kwargs)
+    except BrokenProcessPool:
+        # A worker died; replace the pool so later calls can succeed
+        _discard_process_pool(pool)
+        raise
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def _create_process_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = max_workers or multiprocessing.cpu_count()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD),
+    )
+    wait([pool.submit(_warm_up) for _ in range(workers)])
+    return pool
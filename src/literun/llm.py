@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator, AsyncIterator
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
-from openai import OpenAI, AsyncOpenAI
-from openai.types.responses import Response
-
-from .tool import Tool
+import asyncio
+import threading
+from functools import partial
+from typing import Any, AsyncGenerator, Iterator, AsyncIterator, Sequence, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+if TYPE_CHECKING:
+    from openai import OpenAI, AsyncOpenAI
+    from openai.types.responses import Response
+    from .events import ResponseStreamEvent
+    from .batch_api import BatchRequestError
+
+from .tool import Tool, ToolSet
+from .cache import ResponseCache
+from .ratelimit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
 from .prompt import PromptTemplate
-from .events import ResponseStreamEvent
+from . import tracing
 from .constants import (
     Verbosity,
     TextFormat,
@@ -17,16 +27,118 @@ from .constants import (
     DEFAULT_TIMEOUT,
     DEFAULT_MAX_RETRIES,
     DEFAULT_OPENAI_MODEL,
+    DEFAULT_BATCH_POLL_INTERVAL,
 )
 
+_ClientKey = tuple[Any, ...]
+"""Client configuration: api_key, base_url, organization, project, timeout, max_retries."""
+
+_shared_clients: dict[_ClientKey, OpenAI] = {}
+"""Process-wide synchronous clients, one per client configuration."""
+
+_shared_async_clients: dict[
+    asyncio.AbstractEventLoop | None, dict[_ClientKey, AsyncOpenAI]
+] = {}
+"""Process-wide asynchronous clients, per event loop and client configuration,
+as pooled connections cannot move between loops."""
+
+_loop_guards: dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = {}
+"""Per-loop async generators that close the loop's shared clients when the
+loop shuts down its async generators (as ``asyncio.run`` does)."""
+
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(key: _ClientKey, kwargs: dict[str, Any]) -> OpenAI:
+    """Return the shared synchronous client for a configuration."""
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                from openai import OpenAI
+
+                client = _shared_clients[key] = OpenAI(**kwargs)
+    return client
+
+
+def _pop_loop_clients(
+    loop: asyncio.AbstractEventLoop | None, *, release: bool = False
+) -> list[AsyncOpenAI]:
+    """Remove the shared asynchronous clients of a loop and return them.
+
+    With ``release``, also drop the loop's shutdown guard.
+    """
+    with _shared_clients_lock:
+        if release:
+            _loop_guards.pop(loop, None)
+        return list(_shared_async_clients.pop(loop, {}).values())
+
+
+async def _close_at_shutdown(loop: asyncio.AbstractEventLoop) -> AsyncGenerator[None, None]:
+    """Close the shared clients of ``loop`` when the loop finalizes this generator."""
+    try:
+        yield
+    finally:
+        if not loop.is_closed():
+            for client in _pop_loop_clients(loop, release=True):
+                await client.close()
+
+
+def _guard_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Register ``_close_at_shutdown`` with a running loop. Requires the lock."""
+    guard = _loop_guards[loop] = _close_at_shutdown(loop)
+    # Starting the generator in the loop's thread registers it with the loop,
+    # which closes it (running the finally) in ``shutdown_asyncgens``.
+    try:
+        guard.asend(None).send(None)
+    except StopIteration:
+        pass
+
+
+def _release_closed_loops() -> None:
+    """Drop the clients of loops closed without shutting down their async
+    generators. Their connections cannot be closed anymore. Requires the lock.
+    """
+    for loop in [other for other in _loop_guards if other.is_closed()]:
+        _shared_async_clients.pop(loop, None)
+        try:
+            # Finish the guard so it is not finalized on the closed loop
+            _loop_guards.pop(loop).aclose().send(None)
+        except StopIteration:
+            pass
+
+
+def _shared_async_client(key: _ClientKey, kwargs: dict[str, Any]) -> AsyncOpenAI:
+    """Return the shared asynchronous client for a configuration and the running loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    client = _shared_async_clients.get(loop, {}).get(key)
+    if client is None:
+        with _shared_clients_lock:
+            if loop is not None and loop not in _loop_guards:
+                _release_closed_loops()
+                _guard_loop(loop)
+            clients = _shared_async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                from openai import AsyncOpenAI
+
+                client = clients[key] = AsyncOpenAI(**kwargs)
+    return client
+
 
 class ChatOpenAI(BaseModel):
     """Stateless wrapper for a configured OpenAI model.
 
     Provides a unified interface to call the OpenAI Responses API, optionally
-    binding tools and streaming outputs.
+    binding tools and streaming outputs. Implements ``ModelBackend``.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     model: str = DEFAULT_OPENAI_MODEL
     """The OpenAI model name to use."""
 
@@ -78,14 +190,54 @@ class ChatOpenAI(BaseModel):
     model_kwargs: dict[str, Any] = Field(default_factory=dict)
     """Additional model parameters."""
 
-    _client: OpenAI = PrivateAttr()
-    """Synchronous OpenAI client."""
+    cache: ResponseCache | None = None
+    """Optional cache for responses and streamed events.
+
+    Identical requests are served from the cache instead of the API.
+    """
+
+    rate_limiter: RateLimiter | None = None
+    """Optional limiter for requests and tokens per minute.
 
-    _async_client: AsyncOpenAI = PrivateAttr()
-    """Asynchronous OpenAI client."""
+    Acquired before each request is sent. Share one limiter between
+    instances that draw on the same quota.
+    """
+
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+    """Optional adaptive limit on the number of requests in flight.
+
+    Share one limiter between instances, agents and batch runs that hit the
+    same backend.
+    """
+
+    batch_client: Any | None = None
+    """Client used for Batch API submissions in ``batch_chat``.
+
+    Defaults to the synchronous OpenAI client. Set a ``LocalBatchClient`` to
+    run batch workloads without network access.
+    """
+
+    share_client: bool = False
+    """Whether to use the process-wide clients for this configuration.
+
+    Instances with the same api_key, base_url, organization, project,
+    timeout and max_retries then share connection pools, so short-lived
+    instances reuse warm connections. Shared clients are not closed by an
+    instance; see ``close_shared_clients``. By default the instance owns its
+    clients, closed by ``close``/``aclose``.
+    """
+
+    _client: OpenAI | None = PrivateAttr(default=None)
+    """Synchronous OpenAI client owned by the instance, created on first use."""
+
+    _async_client: AsyncOpenAI | None = PrivateAttr(default=None)
+    """Asynchronous OpenAI client owned by the instance, created on first use."""
 
-    _tools: list[Tool] | None = PrivateAttr(default=None)
-    """List of bound tools."""
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    """Guards the lazy creation of the owned clients."""
+
+    _tools: ToolSet | None = PrivateAttr(default=None)
+    """Bound tools, with their compiled definitions."""
 
     _tool_choice: str | None = PrivateAttr(default=None)
     """Tool selection strategy."""
@@ -132,10 +284,9 @@ class ChatOpenAI(BaseModel):
 
         return self
 
-    @model_validator(mode="after")
-    def _init_client(self) -> ChatOpenAI:
-        """Initialize the OpenAI clients."""
-        client_kwargs = {
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Return the OpenAI client configuration of the instance."""
+        return {
             "api_key": self.api_key,
             "base_url": self.base_url,
             "organization": self.organization,
@@ -143,40 +294,91 @@ class ChatOpenAI(BaseModel):
             "timeout": self.timeout,
             "max_retries": self.max_retries,
         }
-        self._client = OpenAI(**client_kwargs)
-        self._async_client = AsyncOpenAI(**client_kwargs)
-        return self
 
     @property
     def client(self) -> OpenAI:
-        """Access the synchronous OpenAI client."""
+        """Access the synchronous OpenAI client, creating it on first use."""
+        kwargs = self._client_kwargs()
+        if self.share_client:
+            return _shared_client(tuple(kwargs.values()), kwargs)
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+
+                    self._client = OpenAI(**kwargs)
         return self._client
 
     @property
     def async_client(self) -> AsyncOpenAI:
-        """Access the asynchronous OpenAI client."""
+        """Access the asynchronous OpenAI client, creating it on first use.
+
+        Shared asynchronous clients are per event loop.
+        """
+        kwargs = self._client_kwargs()
+        if self.share_client:
+            return _shared_async_client(tuple(kwargs.values()), kwargs)
+        if self._async_client is None:
+            with self._client_lock:
+                if self._async_client is None:
+                    from openai import AsyncOpenAI
+
+                    self._async_client = AsyncOpenAI(**kwargs)
         return self._async_client
 
     @staticmethod
-    def _convert_to_openai_tools(tools: list[Tool]) -> list[dict[str, Any]] | None:
+    def close_shared_clients() -> None:
+        """Close all shared synchronous clients.
+
+        Asynchronous clients outside of a running loop are dropped; those of
+        a loop are closed by ``aclose_shared_clients`` or when the loop shuts
+        down. Later requests create new clients.
+        """
+        with _shared_clients_lock:
+            clients = list(_shared_clients.values())
+            _shared_clients.clear()
+            _shared_async_clients.pop(None, None)
+        for client in clients:
+            client.close()
+
+    @staticmethod
+    async def aclose_shared_clients() -> None:
+        """Close the shared asynchronous clients of the running event loop."""
+        for client in _pop_loop_clients(asyncio.get_running_loop()):
+            await client.close()
+
+    @staticmethod
+    def _convert_to_openai_tools(
+        tools: Sequence[Tool] | None,
+    ) -> list[dict[str, Any]] | None:
         """Convert all registered tools to the OpenAI tool schema format.
 
+        A ``ToolSet`` returns its compiled list without visiting the tools.
+        Other sequences are converted on each call, reusing each tool's
+        cached definition. The returned list may be shared and must not be
+        modified.
+
         Returns:
             List[Dict[str, Any]]: A list of tools in OpenAI-compatible dictionary format.
         """
         if not tools:
             return None
+        if isinstance(tools, ToolSet):
+            return tools.definitions()
         return [tool.convert_to_openai_tool() for tool in tools]
 
     def bind_tools(
         self,
         *,
-        tools: list[Tool],
+        tools: Sequence[Tool],
         tool_choice: str | None = None,
         parallel_tool_calls: bool | None = None,
     ) -> ChatOpenAI:
         """Bind tools to the LLM instance.
 
+        The tool definitions are compiled here, once, and reused by every
+        request that does not pass its own `tools`.
+
         Args:
             tools: List of Tool instances to bind.
             tool_choice: Optional tool selection strategy.
@@ -185,7 +387,7 @@ class ChatOpenAI(BaseModel):
         Returns:
             ``ChatOpenAI``: The updated instance with tools bound.
         """
-        self._tools = tools
+        self._tools = tools if isinstance(tools, ToolSet) else ToolSet(tools)
         self._tool_choice = tool_choice
         self._parallel_tool_calls = parallel_tool_calls
         return self
@@ -195,9 +397,11 @@ class ChatOpenAI(BaseModel):
         *,
         messages: PromptTemplate | list[dict[str, Any]],
         stream: bool,
-        tools: list[Tool] | None,
+        tools: Sequence[Tool] | None,
         tool_choice: str | None,
         parallel_tool_calls: bool | None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
     ) -> dict[str, Any]:
         """Prepare common request parameters for sync and async calls."""
         if isinstance(messages, PromptTemplate):
@@ -211,9 +415,11 @@ class ChatOpenAI(BaseModel):
             "max_output_tokens": self.max_output_tokens,
             "input": input_,
             "stream": stream,
-            "store": self.store,
+            "store": self.store if store is None else store,
             **self.model_kwargs,
         }
+        if previous_response_id is not None:
+            params["previous_response_id"] = previous_response_id
         if self.reasoning_effort is not None:
             params["reasoning"] = {"effort": self.reasoning_effort}
 
@@ -227,9 +433,7 @@ class ChatOpenAI(BaseModel):
 
         # Tools resolution
         active_tools = tools if tools is not None else self._tools
-        current_tools = (
-            self._convert_to_openai_tools(active_tools) if active_tools else None
-        )
+        current_tools = self._convert_to_openai_tools(active_tools)
 
         if current_tools:
             params["tools"] = current_tools
@@ -246,18 +450,23 @@ class ChatOpenAI(BaseModel):
         *,
         messages: PromptTemplate | list[dict[str, Any]],
         stream: bool = False,
-        tools: list[Tool] | None = None,
+        tools: Sequence[Tool] | None = None,
         tool_choice: str | None = None,
         parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
     ) -> Response | Iterator[ResponseStreamEvent]:
         """Call the model synchronously.
 
         Args:
             messages: PromptTemplate or list of messages in OpenAI format.
             stream: Whether to stream the output.
-            tools: Optional list of Tool instances.
+            tools: Optional list of Tool instances, or a ``ToolSet``.
             tool_choice: Optional tool selection strategy.
             parallel_tool_calls: Whether to allow parallel tool calls.
+            store: Optional override of the `store` setting for this request.
+            previous_response_id: Optional ID of a stored response to continue
+                from. Only the new input items need to be sent.
 
         Returns:
             Response | Iterator[ResponseStreamEvent]: The OpenAI response or stream.
@@ -268,26 +477,47 @@ class ChatOpenAI(BaseModel):
             tools=tools,
             tool_choice=tool_choice,
             parallel_tool_calls=parallel_tool_calls,
+            store=store,
+            previous_response_id=previous_response_id,
+        )
+        span = tracing.start_span(
+            "llm.chat", lambda: self._span_attributes(params), activate=False
         )
-        return self.client.responses.create(**params)
+        try:
+            if self.cache is not None:
+                result = self.cache.get_or_create(params, lambda: self._create(params))
+            else:
+                result = self._create(params)
+        except BaseException as e:
+            tracing.end_span(span, error=e)
+            raise
+        if stream:
+            return tracing.trace_stream(span, result, self._span_usage)
+        tracing.end_span(span, self._span_usage(result) if span else None)
+        return result
 
     async def achat(
         self,
         *,
         messages: PromptTemplate | list[dict[str, Any]],
         stream: bool = False,
-        tools: list[Tool] | None = None,
+        tools: Sequence[Tool] | None = None,
         tool_choice: str | None = None,
         parallel_tool_calls: bool | None = None,
+        store: bool | None = None,
+        previous_response_id: str | None = None,
     ) -> Response | AsyncIterator[ResponseStreamEvent]:
         """Call the model asynchronously.
 
         Args:
             messages: PromptTemplate or list of messages in OpenAI format.
             stream: Whether to stream the output.
-            tools: Optional list of Tool instances.
+            tools: Optional list of Tool instances, or a ``ToolSet``.
             tool_choice: Optional tool selection strategy.
             parallel_tool_calls: Whether to allow parallel tool calls.
+            store: Optional override of the `store` setting for this request.
+            previous_response_id: Optional ID of a stored response to continue
+                from. Only the new input items need to be sent.
 
         Returns:
             Response | AsyncIterator[ResponseStreamEvent]: The OpenAI response or async stream.
@@ -298,8 +528,116 @@ class ChatOpenAI(BaseModel):
             tools=tools,
             tool_choice=tool_choice,
             parallel_tool_calls=parallel_tool_calls,
+            store=store,
+            previous_response_id=previous_response_id,
+        )
+        span = tracing.start_span(
+            "llm.chat", lambda: self._span_attributes(params), activate=False
+        )
+        try:
+            if self.cache is not None:
+                result = await self.cache.aget_or_create(
+                    params, lambda: self._acreate(params)
+                )
+            else:
+                result = await self._acreate(params)
+        except BaseException as e:
+            tracing.end_span(span, error=e)
+            raise
+        if stream:
+            return tracing.atrace_stream(span, result, self._span_usage)
+        tracing.end_span(span, self._span_usage(result) if span else None)
+        return result
+
+    @staticmethod
+    def _span_attributes(params: dict[str, Any]) -> dict[str, Any]:
+        """Build the initial attributes of an `llm.chat` span."""
+        input_ = params["input"]
+        return {
+            "llm.model": params["model"],
+            "llm.stream": params["stream"],
+            "llm.input_items": len(input_) if isinstance(input_, list) else 1,
+            "llm.tools": len(params.get("tools") or ()),
+            "llm.previous_response_id": params.get("previous_response_id"),
+        }
+
+    @staticmethod
+    def _span_usage(response: Response) -> dict[str, Any]:
+        """Build the final attributes of an `llm.chat` span from its response."""
+        attributes: dict[str, Any] = {"llm.response_id": response.id}
+        if response.usage is not None:
+            attributes["usage.input_tokens"] = response.usage.input_tokens
+            attributes["usage.cached_tokens"] = (
+                response.usage.input_tokens_details.cached_tokens
+            )
+            attributes["usage.output_tokens"] = response.usage.output_tokens
+            attributes["usage.total_tokens"] = response.usage.total_tokens
+        return attributes
+
+    def _create(self, params: dict[str, Any]) -> Response | Iterator[ResponseStreamEvent]:
+        """Send a request to the Responses API, within the configured limits."""
+        create = partial(self.client.responses.create, **params)
+        if self.concurrency_limiter is not None:
+            create = partial(self.concurrency_limiter.call, params, create)
+        if self.rate_limiter is not None:
+            return self.rate_limiter.call(params, create)
+        return create()
+
+    async def _acreate(
+        self, params: dict[str, Any]
+    ) -> Response | AsyncIterator[ResponseStreamEvent]:
+        """Send a request to the Responses API asynchronously, within the configured limits."""
+        acreate = partial(self.async_client.responses.create, **params)
+        if self.concurrency_limiter is not None:
+            acreate = partial(self.concurrency_limiter.acall, params, acreate)
+        if self.rate_limiter is not None:
+            return await self.rate_limiter.acall(params, acreate)
+        return await acreate()
+
+    def batch_chat(
+        self,
+        messages_list: Sequence[PromptTemplate | list[dict[str, Any]]],
+        *,
+        tools: Sequence[Tool] | None = None,
+        tool_choice: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> list[Response | BatchRequestError]:
+        """Call the model for many conversations through the Batch API.
+
+        Trades latency for throughput and cost: all requests are submitted
+        as one batch, and this call blocks until the batch finishes.
+
+        Args:
+            messages_list: One PromptTemplate or message list per request.
+            tools: Optional list of Tool instances, or a ``ToolSet``.
+            tool_choice: Optional tool selection strategy.
+            parallel_tool_calls: Whether to allow parallel tool calls.
+            poll_interval: Seconds to wait between batch status checks.
+            timeout: Optional maximum number of seconds to wait for the batch.
+
+        Returns:
+            list[Response | BatchRequestError]: One entry per request, in order.
+        """
+        from .batch_api import BatchSubmitter
+
+        requests = [
+            self._prepare_request_params(
+                messages=messages,
+                stream=False,
+                tools=tools,
+                tool_choice=tool_choice,
+                parallel_tool_calls=parallel_tool_calls,
+            )
+            for messages in messages_list
+        ]
+        submitter = BatchSubmitter(
+            self.batch_client if self.batch_client is not None else self.client,
+            poll_interval=poll_interval,
+            timeout=timeout,
         )
-        return await self.async_client.responses.create(**params)
+        return submitter.submit(requests)
 
     def invoke(self, messages: list[dict[str, Any]] | PromptTemplate) -> Response:
         """Synchronously call the model.
@@ -358,12 +696,22 @@ class ChatOpenAI(BaseModel):
             yield event
 
     def close(self) -> None:
-        """Close the synchronous client."""
-        self._client.close()
+        """Close the synchronous client owned by the instance, if any.
+
+        Shared clients stay open for the other instances using them.
+        """
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     async def aclose(self) -> None:
-        """Close the asynchronous client."""
-        await self._async_client.close()
+        """Close the asynchronous client owned by the instance, if any.
+
+        Shared clients stay open for the other instances using them.
+        """
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
 
     def __enter__(self) -> ChatOpenAI:
         return self
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict, Literal
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 
 from .constants import Role, ContentType
 
@@ -14,8 +14,13 @@ class PromptMessage(BaseModel):
     This class is the only place that knows how to convert a semantic
     message into an OpenAI-compatible message dictionary. It enforces
     invariants depending on the message type.
+
+    Messages are immutable once constructed, which allows their OpenAI
+    representation to be computed once and reused.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     role: Role | None = None
     """The role of the message sender.
 
@@ -43,6 +48,9 @@ class PromptMessage(BaseModel):
     Options: `text`, `tool_call`, `tool_call_output`
     """
 
+    _openai_message: Dict[str, Any] | None = PrivateAttr(default=None)
+    """Cached OpenAI representation of the message."""
+
     @model_validator(mode="after")
     def _validate_invariants(self) -> PromptMessage:
         """Enforce invariants so that invalid messages are never constructed.
@@ -80,6 +88,9 @@ class PromptMessage(BaseModel):
     def convert_to_openai_message(self) -> Dict[str, Any]:
         """Convert the PromptMessage to an OpenAI-compatible message dictionary.
 
+        The dictionary is built on first use and cached. It is shared between
+        calls and must not be modified.
+
         Returns:
             Dict[str, Any]: The formatted message dictionary.
 
@@ -87,6 +98,12 @@ class PromptMessage(BaseModel):
             ValueError: If required fields are missing for the specified content_type.
             RuntimeError: If the message state is invalid (should not occur).
         """
+        if self._openai_message is None:
+            self._openai_message = self._build_openai_message()
+        return self._openai_message
+
+    def _build_openai_message(self) -> Dict[str, Any]:
+        """Build the OpenAI message dictionary from the message fields."""
         # System / User / Assistant messages
         if self.content_type == "text":
             if self.role == "system":
@@ -2,27 +2,75 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Any
+from typing import Iterable, Iterator, Any, Sequence, overload
 from pydantic import BaseModel, Field, PrivateAttr
 
 from .message import PromptMessage
 
 
+class MessagesView(Sequence[PromptMessage]):
+    """Read-only view of a template's messages, without copying them.
+
+    Slicing returns a new list.
+    """
+
+    __slots__ = ("_messages",)
+
+    def __init__(self, messages: list[PromptMessage]) -> None:
+        self._messages = messages
+
+    @overload
+    def __getitem__(self, index: int) -> PromptMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[PromptMessage]: ...
+
+    def __getitem__(self, index):
+        return self._messages[index]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[PromptMessage]:
+        return iter(self._messages)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MessagesView):
+            return self._messages == other._messages
+        if isinstance(other, (list, tuple)):
+            return self._messages == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessagesView({self._messages!r})"
+
+
 class PromptTemplate(BaseModel):
     """Container for conversation state.
 
     This class stores the authoritative message history used by the Agent.
     It manages ``PromptMessage`` objects and serializes them only at the
     OpenAI API boundary.
+
+    History is append-only, except for ``replace_messages``: the serialized
+    form of each message is kept, so converting the template only serializes
+    the messages added since the previous conversion.
     """
 
     _messages: list[PromptMessage] = PrivateAttr(default_factory=list)
     """List of messages in the prompt template."""
 
+    _serialized: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    """OpenAI representation of the leading messages, in order."""
+
     @property
-    def messages(self) -> list[PromptMessage]:
-        """Return a read-only view of the messages."""
-        return self._messages
+    def messages(self) -> MessagesView:
+        """Return a read-only view of the messages.
+
+        Use the ``add_*`` methods and ``replace_messages`` to change the
+        history.
+        """
+        return MessagesView(self._messages)
 
     def add_message(self, message: PromptMessage) -> PromptTemplate:
         """Add a custom prompt message.
@@ -38,7 +86,7 @@ class PromptTemplate(BaseModel):
         """
         if not isinstance(message, PromptMessage):
             raise TypeError("Expected PromptMessage")
-        self.messages.append(message)
+        self._messages.append(message)
         return self
 
     def add_messages(self, messages: Iterable[PromptMessage]) -> PromptTemplate:
@@ -154,31 +202,70 @@ class PromptTemplate(BaseModel):
             )
         )
 
+    def replace_messages(
+        self, start: int, end: int, messages: Iterable[PromptMessage]
+    ) -> PromptTemplate:
+        """Replace the messages in `[start, end)` with `messages`.
+
+        Used to rewrite older history, e.g. by ``HistoryCompactor``. Messages
+        before `start` keep their serialized form.
+
+        Args:
+            start: Index of the first message to replace.
+            end: Index after the last message to replace.
+            messages: The replacement messages.
+
+        Returns:
+            ``PromptTemplate``: The template instance, allowing method chaining.
+
+        Raises:
+            TypeError: If a replacement is not a ``PromptMessage`` instance.
+        """
+        messages = list(messages)
+        if not all(isinstance(message, PromptMessage) for message in messages):
+            raise TypeError("Expected PromptMessage")
+        self._messages[start:end] = messages
+        del self._serialized[start:]
+        return self
+
     def copy(self) -> PromptTemplate:
         """Create a shallow copy of this template.
 
         This is required to avoid mutating caller-owned templates inside
         the Agent.
 
+        Messages are immutable, so both the messages and their already
+        serialized form are shared with the copy.
+
         Returns:
             ``PromptTemplate``: A new template containing the same messages.
         """
         new = PromptTemplate()
-        new.messages = list(self.messages)
+        new._messages = list(self._messages)
+        new._serialized = list(self._serialized)
         return new
 
     def convert_to_openai_input(self) -> list[dict[str, Any]]:
         """Convert the template to OpenAI message dictionaries.
 
+        Only messages added since the previous call are serialized. The
+        message dictionaries are shared and must not be modified.
+
         Returns:
             list[dict[str, Any]]: The formatted messages.
         """
-        return [msg.convert_to_openai_message() for msg in self.messages]
+        serialized = self._serialized
+        if len(serialized) > len(self._messages):
+            # The history was shortened outside of the add_* methods
+            serialized.clear()
+        for msg in self._messages[len(serialized) :]:
+            serialized.append(msg.convert_to_openai_message())
+        return list(serialized)
 
     def __len__(self) -> int:
         """Return the number of messages in the template."""
-        return len(self.messages)
+        return len(self._messages)
 
     def __iter__(self):
         """Iterate over stored messages."""
-        return iter(self.messages)
+        return iter(self._messages)
@@ -0,0 +1,343 @@
+"""Client-side rate limiting for requests to the Responses API."""
+
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Callable, Iterator, AsyncIterator, Awaitable, TYPE_CHECKING
+
+from .constants import DEFAULT_CHARS_PER_TOKEN
+
+if TYPE_CHECKING:
+    from .events import ResponseStreamEvent
+
+
+_shared_limiters: dict[str, RateLimiter] = {}
+"""Process-wide registry of limiters created with ``RateLimiter.shared``."""
+
+_shared_limiters_lock = threading.Lock()
+
+
+class _TokenBucket:
+    """A bucket refilled continuously up to its per-minute capacity.
+
+    The level may go negative: a reservation is taken immediately and the
+    caller waits until the debt has been refilled, which keeps waiters in
+    arrival order without a queue.
+    """
+
+    __slots__ = ("capacity", "rate", "level", "updated")
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(
+            self.capacity, self.level + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def take(self, amount: float) -> float:
+        """Reserve `amount` and return the seconds until it is covered."""
+        self.level -= min(amount, self.capacity)
+        return -self.level / self.rate if self.level < 0 else 0.0
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests per minute and tokens per minute.
+
+    Each request reserves one request slot and its estimated token cost
+    before it is sent, waiting if either budget is exhausted. Once the actual
+    usage is known, the token estimate is reconciled against it. Cache hits do
+    not consume any budget.
+
+    A limiter is thread-safe and works for both sync and async callers, so a
+    single instance can be shared by several ``ChatOpenAI`` instances. Use
+    ``RateLimiter.shared`` to get the process-wide limiter for a key, e.g. one
+    per OpenAI organization.
+
+    Example:
+        limiter = RateLimiter.shared("my-org", rpm=500, tpm=200_000)
+        llm = ChatOpenAI(model="gpt-4.1-mini", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+    ) -> None:
+        """Create a rate limiter.
+
+        Args:
+            rpm: Maximum number of requests per minute.
+            tpm: Maximum number of tokens (input plus output) per minute.
+            chars_per_token: Characters per token used to estimate the input
+                size from the serialized request.
+
+        Raises:
+            ValueError: If neither limit is set, or a limit is not positive.
+        """
+        if rpm is None and tpm is None:
+            raise ValueError("At least one of rpm or tpm must be set")
+        if (rpm is not None and rpm < 1) or (tpm is not None and tpm < 1):
+            raise ValueError("rpm and tpm must be >= 1")
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be > 0")
+
+        self.rpm = rpm
+        self.tpm = tpm
+        self.chars_per_token = chars_per_token
+        self._requests = _TokenBucket(rpm) if rpm is not None else None
+        self._tokens = _TokenBucket(tpm) if tpm is not None else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls,
+        key: str,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+    ) -> RateLimiter:
+        """Return the process-wide limiter registered under `key`.
+
+        The limiter is created on first use; later calls with the same key
+        return the same instance.
+
+        Args:
+            key: Name of the shared budget, e.g. an organization or project.
+            rpm: Maximum number of requests per minute.
+            tpm: Maximum number of tokens per minute.
+            chars_per_token: Characters per token used for estimates.
+
+        Returns:
+            ``RateLimiter``: The shared limiter.
+
+        Raises:
+            ValueError: If a limiter with different limits is already
+                registered under `key`.
+        """
+        with _shared_limiters_lock:
+            limiter = _shared_limiters.get(key)
+            if limiter is None:
+                limiter = cls(rpm=rpm, tpm=tpm, chars_per_token=chars_per_token)
+                _shared_limiters[key] = limiter
+            elif (limiter.rpm, limiter.tpm) != (rpm, tpm):
+                raise ValueError(
+                    f"Rate limiter '{key}' already exists with "
+                    f"rpm={limiter.rpm}, tpm={limiter.tpm}"
+                )
+            return limiter
+
+    @property
+    def available_requests(self) -> float | None:
+        """Request slots currently available, or None without an RPM limit."""
+        return self._available(self._requests)
+
+    @property
+    def available_tokens(self) -> float | None:
+        """Tokens currently available, or None without a TPM limit."""
+        return self._available(self._tokens)
+
+    def _available(self, bucket: _TokenBucket | None) -> float | None:
+        if bucket is None:
+            return None
+        with self._lock:
+            bucket.refill(time.monotonic())
+            return bucket.level
+
+    def estimate_tokens(self, params: dict[str, Any]) -> int:
+        """Estimate the token cost of a request.
+
+        The input size is approximated from the length of the serialized
+        input, instructions and tools; the output size is `max_output_tokens`.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+
+        Returns:
+            int: The estimated number of tokens.
+        """
+        chars = 0
+        for field in ("input", "instructions", "tools"):
+            value = params.get(field)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                chars += len(value)
+            else:
+                chars += len(json.dumps(value, separators=(",", ":"), default=str))
+        return int(chars / self.chars_per_token) + (params.get("max_output_tokens") or 0)
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve one request and `tokens`, returning the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests is not None:
+                self._requests.refill(now)
+                delay = self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.refill(now)
+                delay = max(delay, self._tokens.take(tokens))
+            return delay
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request and `tokens` tokens may be sent.
+
+        Args:
+            tokens: The estimated token cost of the request.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Asynchronous counterpart of ``acquire``.
+
+        Args:
+            tokens: The estimated token cost of the request.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """Correct a token reservation once the actual usage is known.
+
+        Over-estimates are returned to the budget and under-estimates are
+        charged to it. Estimates above the TPM limit only reserved the limit,
+        so only that much is given back.
+
+        Args:
+            estimated: The number of tokens estimated for the request.
+            actual: The number of tokens the request actually used.
+        """
+        if self._tokens is None:
+            return
+        reserved = min(estimated, self._tokens.capacity)
+        if reserved == actual:
+            return
+        with self._lock:
+            self._tokens.refill(time.monotonic())
+            self._tokens.give(reserved - actual)
+
+    def call(
+        self,
+        params: dict[str, Any],
+        create: Callable[[], Any],
+    ) -> Any:
+        """Send a request within the limits and reconcile its usage.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            create: Sends the request and returns a response or an event stream.
+
+        Returns:
+            Response | Iterator[ResponseStreamEvent]: The response or stream.
+        """
+        estimated = self.estimate_tokens(params)
+        self.acquire(estimated)
+        try:
+            result = create()
+        except Exception:
+            # A failed request did not generate tokens
+            self.reconcile(estimated, 0)
+            raise
+        if params.get("stream"):
+            return self._reconcile_stream(estimated, result)
+        self.reconcile(estimated, _total_tokens(result, estimated))
+        return result
+
+    async def acall(
+        self,
+        params: dict[str, Any],
+        acreate: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Asynchronous counterpart of ``call``.
+
+        Args:
+            params: The request parameters sent to the Responses API.
+            acreate: Sends the request and returns a response or an async event stream.
+
+        Returns:
+            Response | AsyncIterator[ResponseStreamEvent]: The response or async stream.
+        """
+        estimated = self.estimate_tokens(params)
+        await self.aacquire(estimated)
+        try:
+            result = await acreate()
+        except Exception:
+            self.reconcile(estimated, 0)
+            raise
+        if params.get("stream"):
+            return self._areconcile_stream(estimated, result)
+        self.reconcile(estimated, _total_tokens(result, estimated))
+        return result
+
+    def _reconcile_stream(
+        self, estimated: int, stream: Iterator[ResponseStreamEvent]
+    ) -> Iterator[ResponseStreamEvent]:
+        """Yield a live stream, reconciling usage when it ends.
+
+        Streams that fail, end without completing or are abandoned are
+        reconciled against the usage they reported, if any, or zero.
+        """
+        actual = 0
+        try:
+            for event in stream:
+                actual = _stream_tokens(event, estimated, actual)
+                yield event
+        finally:
+            self.reconcile(estimated, actual)
+
+    async def _areconcile_stream(
+        self, estimated: int, stream: AsyncIterator[ResponseStreamEvent]
+    ) -> AsyncIterator[ResponseStreamEvent]:
+        """Asynchronous counterpart of ``_reconcile_stream``."""
+        actual = 0
+        try:
+            async for event in stream:
+                actual = _stream_tokens(event, estimated, actual)
+                yield event
+        finally:
+            self.reconcile(estimated, actual)
+
+
+def _stream_tokens(event: ResponseStreamEvent, estimated: int, actual: int) -> int:
+    """Return the tokens used by a stream so far, updated with `event`.
+
+    Completed responses without usage are assumed to match the estimate.
+    """
+    if event.type == "response.completed":
+        return _total_tokens(event.response, estimated)
+    if event.type in ("response.failed", "response.incomplete"):
+        return _total_tokens(event.response, actual)
+    return actual
+
+
+def _total_tokens(response: Any, default: int) -> int:
+    """Return the total tokens reported by a response, or `default`."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return default
+    return usage.total_tokens
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any
 
 from openai.types.responses import Response
 from .items import RunItem
 from .events import StreamEvent
+from .usage import RunUsage, RunTimings
 
 
 class RunResult(BaseModel):
@@ -30,6 +31,12 @@ class RunResult(BaseModel):
     final_output: Any
     """The output produced by the final agent invocation."""
 
+    usage: RunUsage = Field(default_factory=RunUsage)
+    """Token usage aggregated over all model calls of the run."""
+
+    timings: RunTimings = Field(default_factory=RunTimings)
+    """Latency breakdown of the run: model calls, time to first token and tools."""
+
 
 class RunResultStreaming(BaseModel):
     """Streaming result returned by the OpenAI Agent.
@@ -51,3 +58,54 @@ class RunResultStreaming(BaseModel):
 
     This value is `None` until the final message is complete.
     """
+
+
+class StreamChunk:
+    """Lightweight streaming result for fast streaming mode.
+
+    Used in ``Agent.stream(fast=True)``. Has the same attributes as
+    ``RunResultStreaming`` but is a plain slotted object: nothing is
+    validated or copied, which keeps the per-event cost of long streams low.
+    """
+
+    __slots__ = ("input", "event", "final_output")
+
+    def __init__(
+        self, *, input: str | list[Any], event: StreamEvent, final_output: Any
+    ) -> None:
+        self.input = input
+        self.event = event
+        self.final_output = final_output
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamChunk(input={self.input!r}, event={self.event!r}, "
+            f"final_output={self.final_output!r})"
+        )
+
+
+class BatchItem(BaseModel):
+    """Outcome of a single input in a batch run.
+
+    Used in the ``Agent.batch()`` family of methods. Exactly one of `result`
+    and `error` is set.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    """The position of the input in the batch."""
+
+    input: str
+    """The user input of this batch item."""
+
+    result: RunResult | None = None
+    """The result of the agent run, if it succeeded."""
+
+    error: Exception | None = None
+    """The exception raised by the agent run, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the agent run succeeded."""
+        return self.error is None
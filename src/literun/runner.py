@@ -3,10 +3,22 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Iterator, AsyncIterator, TYPE_CHECKING
+import time
+import logging
+import contextvars
+import queue
+import asyncio
+from typing import Any, Awaitable, Callable, Iterator, AsyncIterator, TYPE_CHECKING
+
+from openai import BadRequestError, NotFoundError
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from openai.types.responses import Response
     from .agent import Agent
+    from .tool import Tool
+    from .context import Compaction
+    from .events import ResponseStreamEvent
 
 from .items import (
     RunItem,
@@ -16,12 +28,130 @@ from .items import (
     ReasoningItem,
     ResponseFunctionToolCallOutput,
 )
-from .results import RunResult, RunResultStreaming
+from .results import RunResult, RunResultStreaming, StreamChunk
+from .usage import RunUsage, RunTimings, LLMCallTiming, ToolCallTiming
 from .events import (
+    RunCompletedEvent,
     ResponseFunctionCallOutputItemAddedEvent,
     ResponseFunctionCallOutputItemDoneEvent,
 )
 from .prompt import PromptTemplate
+from .executors import take_queue_wait
+from . import tracing
+
+
+logger = logging.getLogger(__name__)
+
+
+class _ResponseChain:
+    """Server-side conversation state of a `chain_responses` run.
+
+    Tracks the last stored response and how much of the local prompt it
+    already covers, so that only the new input items have to be sent.
+    """
+
+    __slots__ = ("response_id", "synced", "_pending")
+
+    def __init__(self) -> None:
+        self.response_id: str | None = None
+        self.synced = 0
+        self._pending: int | None = None
+
+    def begin(self, prompt: PromptTemplate) -> None:
+        """Record the prompt length covered by an outgoing request."""
+        self._pending = len(prompt)
+
+    def request_input(self, prompt: PromptTemplate) -> list[dict[str, Any]]:
+        """Return the prompt items not yet known to the stored response.
+
+        Assistant messages and function calls in the tail were produced by
+        the stored response itself, so only client-side items are sent.
+        """
+        self.begin(prompt)
+        return [
+            item
+            for item in prompt.convert_to_openai_input()[self.synced :]
+            if item.get("role") != "assistant" and item.get("type") != "function_call"
+        ]
+
+    def advance(self, response_id: str) -> None:
+        """Continue the chain from a newly stored response."""
+        if self._pending is None:
+            return
+        self.response_id = response_id
+        self.synced = self._pending
+        self._pending = None
+
+    def settle(self) -> None:
+        """Drop the chain if the last request did not complete."""
+        if self._pending is not None:
+            self.reset()
+
+    def reset(self) -> None:
+        """Drop the chain, forcing the next request to replay the history."""
+        self.response_id = None
+        self.synced = 0
+        self._pending = None
+
+    @staticmethod
+    def is_chain_error(error: Exception) -> bool:
+        """Check whether an API error means the stored response is unusable."""
+        return isinstance(error, NotFoundError) or (
+            getattr(error, "param", None) == "previous_response_id"
+        )
+
+
+class _EagerTools:
+    """Tool calls of an `eager_tool_execution` turn, started mid-stream.
+
+    Each call starts as soon as it is known; progress is reported as
+    ``(index, None)`` on start and ``(index, output)`` on finish, like
+    ``Runner._astream_tools``.
+    """
+
+    __slots__ = ("_run_tool", "_semaphore", "_queue", "_tasks", "_pending")
+
+    def __init__(
+        self, agent: Agent, run_tool: Callable[[dict[str, Any]], Awaitable[str]]
+    ) -> None:
+        self._run_tool = run_tool
+        self._semaphore = asyncio.Semaphore(
+            agent.max_concurrent_tool_calls if agent.parallel_tool_calls else 1
+        )
+        self._queue: asyncio.Queue[tuple[int, str | None]] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._pending = 0
+
+    def start(self, tool_call: dict[str, Any]) -> None:
+        """Launch the next tool call in the background."""
+        index = len(self._tasks)
+        self._pending += 2
+        self._tasks.append(asyncio.create_task(self._run_one(index, tool_call)))
+
+    async def _run_one(self, index: int, tool_call: dict[str, Any]) -> None:
+        async with self._semaphore:
+            self._queue.put_nowait((index, None))
+            self._queue.put_nowait((index, await self._run_tool(tool_call)))
+
+    def ready(self) -> list[tuple[int, str | None]]:
+        """Return the progress reported so far, without waiting."""
+        progress = []
+        while not self._queue.empty():
+            progress.append(self._queue.get_nowait())
+        self._pending -= len(progress)
+        return progress
+
+    async def remaining(self) -> AsyncIterator[tuple[int, str | None]]:
+        """Yield the rest of the progress as the tool calls finish."""
+        while self._pending:
+            self._pending -= 1
+            yield await self._queue.get()
+
+    async def aclose(self) -> None:
+        """Cancel the tool calls that are still running."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 class Runner:
@@ -56,103 +186,56 @@ class Runner:
             raise ValueError("user_input cannot be empty")
 
         prompt = cls._build_prompt(agent, user_input, prompt_template)
+        chain = _ResponseChain() if agent.chain_responses else None
         all_items: list[RunItem] = []
-
-        iteration = 0
-        while iteration < agent.max_iterations:
-            response = agent.llm.chat(
-                messages=prompt,
-                stream=False,
-                tools=agent.tools,
-                tool_choice=agent.tool_choice,
-                parallel_tool_calls=agent.parallel_tool_calls,
-            )
-
-            tool_calls: dict[str, dict[str, Any]] = {}
-            final_output_text: str = ""
-
-            for item in response.output:
-                if item.type == "reasoning":
-                    all_items.append(
-                        ReasoningItem(
-                            role="assistant",
-                            content=item.content,
-                            raw_item=item,
-                            type="reasoning_item",
-                        )
+        usage = RunUsage()
+        timings = RunTimings()
+        run_start = time.perf_counter()
+
+        with tracing.span("agent.run", lambda: cls._span_attributes(agent, "run")) as span:
+            pending: Future[Compaction | None] | None = None
+            iteration = 0
+            try:
+                while iteration < agent.max_iterations:
+                    cls._compact(agent, prompt, pending, chain, usage)
+                    start = time.perf_counter()
+                    response = cls._chat(agent, prompt, chain, stream=False, usage=usage)
+                    timings.llm_calls.append(
+                        LLMCallTiming(iteration=iteration, latency=time.perf_counter() - start)
                     )
-
-                elif item.type == "function_call":
-                    tool_calls[item.id] = {
-                        "call_id": item.call_id,
-                        "name": item.name,
-                        "arguments": item.arguments,
-                    }
-                    all_items.append(
-                        ToolCallItem(
-                            role="assistant",
-                            content="",
-                            raw_item=item,
-                            type="tool_call_item",
-                        )
-                    )
-
-                elif item.type == "message":
-                    text_parts = [
-                        c.text for c in item.content if c.type == "output_text"
-                    ]
-                    final_output_text = "".join(text_parts)
-                    all_items.append(
-                        MessageOutputItem(
-                            role="assistant",
-                            content=final_output_text,
-                            raw_item=item,
-                            type="message_output_item",
+                    usage.add(response)
+                    if chain is not None:
+                        chain.advance(response.id)
+
+                    tool_calls, final_output_text = cls._collect_output(response, all_items)
+
+                    if not tool_calls:
+                        timings.total = time.perf_counter() - run_start
+                        if span is not None:
+                            span.set_attributes(
+                                cls._span_summary(usage, timings, iteration + 1)
+                            )
+                        return RunResult(
+                            input=user_input,
+                            new_items=all_items,
+                            final_output=final_output_text,
+                            usage=usage,
+                            timings=timings,
                         )
-                    )
-
-            if not tool_calls:
-                return RunResult(
-                    input=user_input,
-                    new_items=all_items,
-                    final_output=final_output_text,
-                )
-
-            if final_output_text:
-                prompt.add_assistant(final_output_text)
 
-            for tc in tool_calls.values():
-                call_id = tc["call_id"]
-                name = tc["name"]
-                arguments_str = tc["arguments"]
+                    if final_output_text:
+                        prompt.add_assistant(final_output_text)
 
-                prompt.add_tool_call(
-                    name=name,
-                    arguments=arguments_str,
-                    call_id=call_id,
-                )
+                    calls = list(tool_calls.values())
+                    pending = cls._start_compaction(agent, prompt)
+                    tool_outputs = cls._run_tools(agent, calls, runtime_context, timings)
 
-                tool_output = cls._run_tool(agent, name, arguments_str, runtime_context)
+                    cls._add_tool_outputs(prompt, all_items, calls, tool_outputs)
+                    iteration += 1
 
-                prompt.add_tool_output(call_id=call_id, output=tool_output)
-
-                all_items.append(
-                    ToolCallOutputItem(
-                        role="tool",
-                        content=tool_output,
-                        raw_item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output=tool_output,
-                            name=name,
-                            type="function_call_output",
-                            status="completed",
-                        ),
-                        type="tool_call_output_item",
-                    )
-                )
-            iteration += 1
-
-        raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+                raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+            finally:
+                cls._discard_compaction(pending)
 
     @classmethod
     async def arun(
@@ -183,105 +266,56 @@ class Runner:
             raise ValueError("user_input cannot be empty")
 
         prompt = cls._build_prompt(agent, user_input, prompt_template)
+        chain = _ResponseChain() if agent.chain_responses else None
         all_items: list[RunItem] = []
-
-        iteration = 0
-        while iteration < agent.max_iterations:
-            response = await agent.llm.achat(
-                messages=prompt,
-                stream=False,
-                tools=agent.tools,
-                tool_choice=agent.tool_choice,
-                parallel_tool_calls=agent.parallel_tool_calls,
-            )
-
-            tool_calls: dict[str, dict[str, Any]] = {}
-            final_output_text: str = ""
-
-            for item in response.output:
-                if item.type == "reasoning":
-                    all_items.append(
-                        ReasoningItem(
-                            role="assistant",
-                            content=item.content,
-                            raw_item=item,
-                            type="reasoning_item",
-                        )
+        usage = RunUsage()
+        timings = RunTimings()
+        run_start = time.perf_counter()
+
+        with tracing.span("agent.run", lambda: cls._span_attributes(agent, "arun")) as span:
+            pending: asyncio.Task[Compaction | None] | None = None
+            iteration = 0
+            try:
+                while iteration < agent.max_iterations:
+                    await cls._acompact(agent, prompt, pending, chain, usage)
+                    start = time.perf_counter()
+                    response = await cls._achat(agent, prompt, chain, stream=False, usage=usage)
+                    timings.llm_calls.append(
+                        LLMCallTiming(iteration=iteration, latency=time.perf_counter() - start)
                     )
-
-                elif item.type == "function_call":
-                    tool_calls[item.id] = {
-                        "call_id": item.call_id,
-                        "name": item.name,
-                        "arguments": item.arguments,
-                    }
-                    all_items.append(
-                        ToolCallItem(
-                            role="assistant",
-                            content="",
-                            raw_item=item,
-                            type="tool_call_item",
+                    usage.add(response)
+                    if chain is not None:
+                        chain.advance(response.id)
+
+                    tool_calls, final_output_text = cls._collect_output(response, all_items)
+
+                    if not tool_calls:
+                        timings.total = time.perf_counter() - run_start
+                        if span is not None:
+                            span.set_attributes(
+                                cls._span_summary(usage, timings, iteration + 1)
+                            )
+                        return RunResult(
+                            input=user_input,
+                            new_items=all_items,
+                            final_output=final_output_text,
+                            usage=usage,
+                            timings=timings,
                         )
-                    )
-
-                elif item.type == "message":
-                    text_parts = [
-                        c.text for c in item.content if c.type == "output_text"
-                    ]
-                    final_output_text = "".join(text_parts)
-                    all_items.append(
-                        MessageOutputItem(
-                            role="assistant",
-                            content=final_output_text,
-                            raw_item=item,
-                            type="message_output_item",
-                        )
-                    )
 
-            if not tool_calls:
-                return RunResult(
-                    input=user_input,
-                    new_items=all_items,
-                    final_output=final_output_text,
-                )
-
-            if final_output_text:
-                prompt.add_assistant(final_output_text)
+                    if final_output_text:
+                        prompt.add_assistant(final_output_text)
 
-            for tc in tool_calls.values():
-                call_id = tc["call_id"]
-                name = tc["name"]
-                arguments_str = tc["arguments"]
+                    calls = list(tool_calls.values())
+                    pending = cls._astart_compaction(agent, prompt)
+                    tool_outputs = await cls._arun_tools(agent, calls, runtime_context, timings)
 
-                prompt.add_tool_call(
-                    name=name,
-                    arguments=arguments_str,
-                    call_id=call_id,
-                )
-
-                tool_output = await cls._arun_tool(
-                    agent, name, arguments_str, runtime_context
-                )
-
-                prompt.add_tool_output(call_id=call_id, output=tool_output)
-
-                all_items.append(
-                    ToolCallOutputItem(
-                        role="tool",
-                        content=tool_output,
-                        raw_item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output=tool_output,
-                            name=name,
-                            type="function_call_output",
-                            status="completed",
-                        ),
-                        type="tool_call_output_item",
-                    )
-                )
-            iteration += 1
+                    cls._add_tool_outputs(prompt, all_items, calls, tool_outputs)
+                    iteration += 1
 
-        raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+                raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+            finally:
+                cls._discard_compaction(pending)
 
     @classmethod
     def run_stream(
@@ -290,7 +324,8 @@ class Runner:
         user_input: str,
         prompt_template: PromptTemplate | None = None,
         runtime_context: dict[str, Any] | None = None,
-    ) -> Iterator[RunResultStreaming]:
+        fast: bool = False,
+    ) -> Iterator[RunResultStreaming | StreamChunk]:
         """Run the agent synchronously with streaming output.
 
         Streams events as they occur (tokens, tool calls, tool results).
@@ -300,9 +335,11 @@ class Runner:
             user_input: The input text from the user.
             prompt_template: Optional template to initialize conversation history.
             runtime_context: Optional runtime context dictionary to pass to tools.
+            fast: Whether to yield lightweight ``StreamChunk`` objects instead
+                of validated ``RunResultStreaming`` models.
 
         Yields:
-            ``RunResultStreaming``: Individual streaming events from the agent execution.
+            ``RunResultStreaming | StreamChunk``: Individual streaming events from the agent execution.
 
         Raises:
             ValueError: If `user_input` is empty.
@@ -311,96 +348,138 @@ class Runner:
         if not user_input:
             raise ValueError("user_input cannot be empty")
 
+        span = tracing.start_span(
+            "agent.run", lambda: cls._span_attributes(agent, "stream"), activate=False
+        )
+        yield from tracing.trace_generator(
+            span,
+            cls._run_stream(
+                agent, user_input, prompt_template, runtime_context, fast, span
+            ),
+        )
+
+    @classmethod
+    def _run_stream(
+        cls,
+        agent: Agent,
+        user_input: str,
+        prompt_template: PromptTemplate | None,
+        runtime_context: dict[str, Any] | None,
+        fast: bool,
+        span: tracing.Span | None,
+    ) -> Iterator[RunResultStreaming | StreamChunk]:
+        """Body of ``run_stream``, run under its `agent.run` span."""
         prompt = cls._build_prompt(agent, user_input, prompt_template)
+        chain = _ResponseChain() if agent.chain_responses else None
+        result_type = StreamChunk if fast else RunResultStreaming
+        usage = RunUsage()
+        timings = RunTimings()
+        run_start = time.perf_counter()
 
+        pending: Future[Compaction | None] | None = None
         iteration = 0
-        while iteration < agent.max_iterations:
-            response_stream = agent.llm.chat(
-                messages=prompt,
-                stream=True,
-                tools=agent.tools,
-                tool_choice=agent.tool_choice,
-                parallel_tool_calls=agent.parallel_tool_calls,
-            )
-
-            tool_calls: dict[str, dict[str, Any]] = {}
-            final_output_text: str = ""
-
-            for event in response_stream:
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=event,
-                    final_output=final_output_text,
-                )
-
-                if event.type == "response.output_item.done":
-                    if event.item.type == "message":
-                        for content_part in event.item.content:
-                            if content_part.type == "output_text":
-                                final_output_text += content_part.text
-
-                    elif event.item.type == "function_call":
-                        tool_calls[event.item.id] = {
-                            "call_id": event.item.call_id,
-                            "name": event.item.name,
-                            "arguments": event.item.arguments,
-                        }
-
-            if not tool_calls:
-                return
-
-            if final_output_text:
-                prompt.add_assistant(final_output_text)
-
-            for tc in tool_calls.values():
-                call_id = tc["call_id"]
-                name = tc["name"]
-                arguments_str = tc["arguments"]
+        try:
+            while iteration < agent.max_iterations:
+                cls._compact(agent, prompt, pending, chain, usage)
+                start = time.perf_counter()
+                first_token: float | None = None
+                response_stream = cls._chat(agent, prompt, chain, stream=True, usage=usage)
+
+                tool_calls: dict[str, dict[str, Any]] = {}
+                final_output_text: str = ""
+
+                for event in response_stream:
+                    if first_token is None and event.type.endswith(".delta"):
+                        first_token = time.perf_counter() - start
+
+                    yield result_type(
+                        input=user_input,
+                        event=event,
+                        final_output=final_output_text,
+                    )
 
-                prompt.add_tool_call(
-                    name=name, arguments=arguments_str, call_id=call_id
+                    if event.type == "response.completed":
+                        usage.add(event.response)
+                        if chain is not None:
+                            chain.advance(event.response.id)
+
+                    elif event.type == "response.output_item.done":
+                        if event.item.type == "message":
+                            for content_part in event.item.content:
+                                if content_part.type == "output_text":
+                                    final_output_text += content_part.text
+
+                        elif event.item.type == "function_call":
+                            tool_calls[event.item.id] = {
+                                "call_id": event.item.call_id,
+                                "name": event.item.name,
+                                "arguments": event.item.arguments,
+                            }
+
+                timings.llm_calls.append(
+                    LLMCallTiming(
+                        iteration=iteration,
+                        latency=time.perf_counter() - start,
+                        time_to_first_token=first_token,
+                    )
                 )
-
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=ResponseFunctionCallOutputItemAddedEvent(
-                        type="response.function_call_output_item.added",
-                        item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output="",
-                            name=name,
-                            type="function_call_output",
-                            status="in_progress",
+                if chain is not None:
+                    chain.settle()
+
+                if not tool_calls:
+                    timings.total = time.perf_counter() - run_start
+                    if span is not None:
+                        span.set_attributes(
+                            cls._span_summary(usage, timings, iteration + 1)
+                        )
+                    yield result_type(
+                        input=user_input,
+                        event=RunCompletedEvent(
+                            final_output=final_output_text, usage=usage, timings=timings
                         ),
-                        output_index=None,
-                        sequence_number=None,
-                    ),
-                    final_output=final_output_text,
-                )
-
-                tool_output = cls._run_tool(agent, name, arguments_str, runtime_context)
+                        final_output=final_output_text,
+                    )
+                    return
+
+                if final_output_text:
+                    prompt.add_assistant(final_output_text)
+
+                calls = list(tool_calls.values())
+                tool_outputs: list[str] = [""] * len(calls)
+                pending = cls._start_compaction(agent, prompt)
+
+                for index, tool_output in cls._stream_tools(
+                    agent, calls, runtime_context, timings
+                ):
+                    call_id = calls[index]["call_id"]
+                    name = calls[index]["name"]
+
+                    if tool_output is None:
+                        yield result_type(
+                            input=user_input,
+                            event=cls._tool_output_added_event(call_id, name),
+                            final_output=final_output_text,
+                        )
+                        continue
 
-                prompt.add_tool_output(call_id=call_id, output=tool_output)
+                    tool_outputs[index] = tool_output
+                    yield result_type(
+                        input=user_input,
+                        event=cls._tool_output_done_event(call_id, name, tool_output),
+                        final_output=final_output_text,
+                    )
 
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=ResponseFunctionCallOutputItemDoneEvent(
-                        type="response.function_call_output_item.done",
-                        item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output=tool_output,
-                            name=name,
-                            type="function_call_output",
-                            status="completed",
-                        ),
-                        output_index=None,
-                        sequence_number=None,
-                    ),
-                    final_output=final_output_text,
-                )
-            iteration += 1
+                # Outputs are appended in call order, regardless of completion order
+                for tc, tool_output in zip(calls, tool_outputs):
+                    prompt.add_tool_call(
+                        name=tc["name"], arguments=tc["arguments"], call_id=tc["call_id"]
+                    )
+                    prompt.add_tool_output(call_id=tc["call_id"], output=tool_output)
+                iteration += 1
 
-        raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+            raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+        finally:
+            cls._discard_compaction(pending)
 
     @classmethod
     async def arun_stream(
@@ -409,19 +488,24 @@ class Runner:
         user_input: str,
         prompt_template: PromptTemplate | None = None,
         runtime_context: dict[str, Any] | None = None,
-    ) -> AsyncIterator[RunResultStreaming]:
+        fast: bool = False,
+    ) -> AsyncIterator[RunResultStreaming | StreamChunk]:
         """Run the agent asynchronously with streaming output.
 
         Streams events asynchronously as they occur (tokens, tool calls, tool results).
         Useful for real-time user interfaces.
+        With `eager_tool_execution`, each tool starts as soon as its call is
+        complete, while the rest of the response is still streaming.
 
         Args:
             user_input: The input text from the user.
             prompt_template: Optional template to initialize conversation history.
             runtime_context: Optional runtime context dictionary to pass to tools.
+            fast: Whether to yield lightweight ``StreamChunk`` objects instead
+                of validated ``RunResultStreaming`` models.
 
         Yields:
-            ``RunResultStreaming``: Individual streaming events from the agent execution.
+            ``RunResultStreaming | StreamChunk``: Individual streaming events from the agent execution.
 
         Raises:
             ValueError: If `user_input` is empty.
@@ -430,98 +514,441 @@ class Runner:
         if not user_input:
             raise ValueError("user_input cannot be empty")
 
+        span = tracing.start_span(
+            "agent.run", lambda: cls._span_attributes(agent, "astream"), activate=False
+        )
+        stream = tracing.atrace_generator(
+            span,
+            cls._arun_stream(
+                agent, user_input, prompt_template, runtime_context, fast, span
+            ),
+        )
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    @classmethod
+    async def _arun_stream(
+        cls,
+        agent: Agent,
+        user_input: str,
+        prompt_template: PromptTemplate | None,
+        runtime_context: dict[str, Any] | None,
+        fast: bool,
+        span: tracing.Span | None,
+    ) -> AsyncIterator[RunResultStreaming | StreamChunk]:
+        """Body of ``arun_stream``, run under its `agent.run` span."""
         prompt = cls._build_prompt(agent, user_input, prompt_template)
+        chain = _ResponseChain() if agent.chain_responses else None
+        result_type = StreamChunk if fast else RunResultStreaming
+        usage = RunUsage()
+        timings = RunTimings()
+        run_start = time.perf_counter()
+
+        eager: _EagerTools | None = None
+        pending: asyncio.Task[Compaction | None] | None = None
+        try:
+            iteration = 0
+            while iteration < agent.max_iterations:
+                await cls._acompact(agent, prompt, pending, chain, usage)
+                start = time.perf_counter()
+                first_token: float | None = None
+                response_stream = await cls._achat(
+                    agent, prompt, chain, stream=True, usage=usage
+                )
 
-        iteration = 0
-        while iteration < agent.max_iterations:
-            response_stream = await agent.llm.achat(
-                messages=prompt,
-                stream=True,
-                tools=agent.tools,
-                tool_choice=agent.tool_choice,
-                parallel_tool_calls=agent.parallel_tool_calls,
-            )
+                calls: list[dict[str, Any]] = []
+                final_output_text: str = ""
+                tool_outputs: list[str] = []
+                if agent.eager_tool_execution:
+                    eager = _EagerTools(
+                        agent,
+                        lambda tc: cls._acall_tool(agent, tc, runtime_context, timings),
+                    )
 
-            tool_calls: dict[str, dict[str, Any]] = {}
-            final_output_text: str = ""
+                def tool_event(index: int, tool_output: str | None):
+                    tc = calls[index]
+                    if tool_output is None:
+                        event = cls._tool_output_added_event(tc["call_id"], tc["name"])
+                    else:
+                        tool_outputs[index] = tool_output
+                        event = cls._tool_output_done_event(
+                            tc["call_id"], tc["name"], tool_output
+                        )
+                    return result_type(
+                        input=user_input,
+                        event=event,
+                        final_output=final_output_text,
+                    )
+
+                async for event in response_stream:
+                    if first_token is None and event.type.endswith(".delta"):
+                        first_token = time.perf_counter() - start
+
+                    yield result_type(
+                        input=user_input,
+                        event=event,
+                        final_output=final_output_text,
+                    )
 
-            async for event in response_stream:
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=event,
-                    final_output=final_output_text,
+                    if event.type == "response.completed":
+                        usage.add(event.response)
+                        if chain is not None:
+                            chain.advance(event.response.id)
+
+                    elif event.type == "response.output_item.done":
+                        if event.item.type == "message":
+                            for content_part in event.item.content:
+                                if content_part.type == "output_text":
+                                    final_output_text += content_part.text
+
+                        elif event.item.type == "function_call":
+                            calls.append(
+                                {
+                                    "call_id": event.item.call_id,
+                                    "name": event.item.name,
+                                    "arguments": event.item.arguments,
+                                }
+                            )
+                            if eager is not None:
+                                tool_outputs.append("")
+                                eager.start(calls[-1])
+
+                    if eager is not None:
+                        for index, tool_output in eager.ready():
+                            yield tool_event(index, tool_output)
+
+                timings.llm_calls.append(
+                    LLMCallTiming(
+                        iteration=iteration,
+                        latency=time.perf_counter() - start,
+                        time_to_first_token=first_token,
+                    )
                 )
+                if chain is not None:
+                    chain.settle()
+
+                if not calls:
+                    timings.total = time.perf_counter() - run_start
+                    if span is not None:
+                        span.set_attributes(
+                            cls._span_summary(usage, timings, iteration + 1)
+                        )
+                    yield result_type(
+                        input=user_input,
+                        event=RunCompletedEvent(
+                            final_output=final_output_text, usage=usage, timings=timings
+                        ),
+                        final_output=final_output_text,
+                    )
+                    return
+
+                if final_output_text:
+                    prompt.add_assistant(final_output_text)
+
+                pending = cls._astart_compaction(agent, prompt)
+                if eager is not None:
+                    progress = eager.remaining()
+                else:
+                    tool_outputs = [""] * len(calls)
+                    progress = cls._astream_tools(
+                        agent, calls, runtime_context, timings
+                    )
+
+                async for index, tool_output in progress:
+                    yield tool_event(index, tool_output)
+
+                # Outputs are appended in call order, regardless of completion order
+                for tc, tool_output in zip(calls, tool_outputs):
+                    prompt.add_tool_call(
+                        name=tc["name"], arguments=tc["arguments"], call_id=tc["call_id"]
+                    )
+                    prompt.add_tool_output(call_id=tc["call_id"], output=tool_output)
+                eager = None
+                iteration += 1
+        finally:
+            cls._discard_compaction(pending)
+            if eager is not None:
+                await eager.aclose()
+
+        raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+
+    @staticmethod
+    def _span_attributes(agent: Agent, mode: str) -> dict[str, Any]:
+        """Build the initial attributes of an `agent.run` span."""
+        return {
+            "agent.mode": mode,
+            "agent.model": agent.llm.model,
+            "agent.tools": len(agent._tools),
+        }
+
+    @staticmethod
+    def _span_summary(
+        usage: RunUsage, timings: RunTimings, iterations: int
+    ) -> dict[str, Any]:
+        """Build the final attributes of an `agent.run` span."""
+        return {
+            "agent.iterations": iterations,
+            "agent.tool_calls": len(timings.tool_calls),
+            "usage.input_tokens": usage.input_tokens,
+            "usage.cached_tokens": usage.cached_tokens,
+            "usage.output_tokens": usage.output_tokens,
+            "usage.total_tokens": usage.total_tokens,
+            "usage.context_tokens_saved": usage.context_tokens_saved,
+            "usage.compactions": usage.compactions,
+            "usage.compaction_failures": usage.compaction_failures,
+        }
+
+    @staticmethod
+    def _start_compaction(
+        agent: Agent, prompt: PromptTemplate
+    ) -> Future[Compaction | None] | None:
+        """Start summarizing the history while the turn's tools execute.
 
-                if event.type == "response.output_item.done":
-                    if event.item.type == "message":
-                        for content_part in event.item.content:
-                            if content_part.type == "output_text":
-                                final_output_text += content_part.text
+        Returns:
+            Future[Compaction | None] | None: The pending compaction, or None
+            if background compaction is disabled or not needed yet.
+        """
+        compactor = agent.compaction
+        if compactor is None or not compactor.background:
+            return None
+        if not compactor.needs_compaction(prompt):
+            return None
+        return compactor.submit(prompt)
 
-                    elif event.item.type == "function_call":
-                        tool_calls[event.item.id] = {
-                            "call_id": event.item.call_id,
-                            "name": event.item.name,
-                            "arguments": event.item.arguments,
-                        }
+    @staticmethod
+    def _astart_compaction(
+        agent: Agent, prompt: PromptTemplate
+    ) -> asyncio.Task[Compaction | None] | None:
+        """Asynchronous counterpart of ``_start_compaction``."""
+        compactor = agent.compaction
+        if compactor is None or not compactor.background:
+            return None
+        if not compactor.needs_compaction(prompt):
+            return None
+        return compactor.asubmit(prompt)
+
+    @staticmethod
+    def _compact(
+        agent: Agent,
+        prompt: PromptTemplate,
+        pending: Future[Compaction | None] | None,
+        chain: _ResponseChain | None,
+        usage: RunUsage,
+    ) -> None:
+        """Compact the history before a model call, if needed.
+
+        Applies the compaction started in the background during the previous
+        turn, or summarizes the history now if it exceeds the threshold.
+        Compaction is only an optimization: if the summary fails, the run
+        continues with the full history.
 
-            if not tool_calls:
+        Args:
+            prompt: The authoritative conversation history, modified in place.
+            pending: The background compaction, if any.
+            chain: The server-side chain state, reset when the history changes.
+            usage: The run usage, counting the compactions and failures.
+        """
+        compactor = agent.compaction
+        if compactor is None:
+            return
+        try:
+            if pending is not None:
+                compaction = pending.result()
+            elif compactor.needs_compaction(prompt):
+                compaction = compactor.summarize(prompt)
+            else:
                 return
+        except Exception:
+            Runner._compaction_failed(usage)
+            return
+        Runner._apply_compaction(compaction, prompt, chain, usage)
 
-            if final_output_text:
-                prompt.add_assistant(final_output_text)
+    @staticmethod
+    async def _acompact(
+        agent: Agent,
+        prompt: PromptTemplate,
+        pending: asyncio.Task[Compaction | None] | None,
+        chain: _ResponseChain | None,
+        usage: RunUsage,
+    ) -> None:
+        """Asynchronous counterpart of ``_compact``."""
+        compactor = agent.compaction
+        if compactor is None:
+            return
+        try:
+            if pending is not None:
+                compaction = await pending
+            elif compactor.needs_compaction(prompt):
+                compaction = await compactor.asummarize(prompt)
+            else:
+                return
+        except Exception:
+            Runner._compaction_failed(usage)
+            return
+        Runner._apply_compaction(compaction, prompt, chain, usage)
 
-            for tc in tool_calls.values():
-                call_id = tc["call_id"]
-                name = tc["name"]
-                arguments_str = tc["arguments"]
+    @staticmethod
+    def _compaction_failed(usage: RunUsage) -> None:
+        """Record a failed summary. Must be called from an exception handler."""
+        logger.warning(
+            "History compaction failed; continuing with the full history", exc_info=True
+        )
+        usage.compaction_failures += 1
 
-                prompt.add_tool_call(
-                    name=name, arguments=arguments_str, call_id=call_id
-                )
+    @staticmethod
+    def _discard_compaction(
+        pending: Future[Compaction | None] | asyncio.Task[Compaction | None] | None,
+    ) -> None:
+        """Cancel a background compaction the run no longer needs."""
+        if pending is None or pending.cancel():
+            return
+        if pending.done() and not pending.cancelled():
+            # Retrieve a failure, so it is not reported as never retrieved
+            pending.exception()
 
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=ResponseFunctionCallOutputItemAddedEvent(
-                        type="response.function_call_output_item.added",
-                        item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output="",
-                            name=name,
-                            type="function_call_output",
-                            status="in_progress",
-                        ),
-                        output_index=None,
-                        sequence_number=None,
-                    ),
-                    final_output=final_output_text,
-                )
+    @staticmethod
+    def _apply_compaction(
+        compaction: Compaction | None,
+        prompt: PromptTemplate,
+        chain: _ResponseChain | None,
+        usage: RunUsage,
+    ) -> None:
+        """Apply a compaction and replay the history on the next chained request."""
+        if compaction is None or not compaction.apply(prompt):
+            return
+        usage.compactions += 1
+        if chain is not None:
+            chain.reset()
+
+    @staticmethod
+    def _apply_context(
+        agent: Agent, prompt: PromptTemplate, usage: RunUsage | None
+    ) -> PromptTemplate | list[dict[str, Any]]:
+        """Fit the full history into the agent's context policy, if any.
+
+        Args:
+            prompt: The authoritative conversation history.
+            usage: The run usage, credited with the tokens left out.
+
+        Returns:
+            PromptTemplate | list[dict[str, Any]]: The request input.
+        """
+        if agent.context_policy is None:
+            return prompt
+        request_input, saved = agent.context_policy.apply(prompt)
+        if usage is not None:
+            usage.context_tokens_saved += saved
+        return request_input
+
+    @staticmethod
+    def _chat(
+        agent: Agent,
+        prompt: PromptTemplate,
+        chain: _ResponseChain | None,
+        *,
+        stream: bool,
+        usage: RunUsage | None = None,
+    ) -> Response | Iterator[ResponseStreamEvent]:
+        """Call the agent's model with the current prompt.
 
-                tool_output = await cls._arun_tool(
-                    agent, name, arguments_str, runtime_context
+        In `chain_responses` mode, only the new input items are sent along
+        with `previous_response_id`. If the chain is rejected, the full
+        history is replayed and a new chain is started.
+
+        The agent's `context_policy` is applied whenever the full history is
+        sent. Incremental chained requests are sent as-is.
+
+        Args:
+            prompt: The authoritative conversation history.
+            chain: The server-side chain state, or None when chaining is disabled.
+            stream: Whether to stream the output.
+            usage: The run usage, credited with the tokens saved by the context policy.
+
+        Returns:
+            Response | Iterator[ResponseStreamEvent]: The model response or stream.
+        """
+        kwargs: dict[str, Any] = {
+            "stream": stream,
+            "tools": agent._tool_set,
+            "tool_choice": agent.tool_choice,
+            "parallel_tool_calls": agent.parallel_tool_calls,
+        }
+        if chain is None:
+            return agent.llm.chat(
+                messages=Runner._apply_context(agent, prompt, usage), **kwargs
+            )
+
+        if chain.response_id is not None:
+            try:
+                return agent.llm.chat(
+                    messages=chain.request_input(prompt),
+                    store=True,
+                    previous_response_id=chain.response_id,
+                    **kwargs,
                 )
+            except (BadRequestError, NotFoundError) as e:
+                if not chain.is_chain_error(e):
+                    raise
+                chain.reset()
 
-                prompt.add_tool_output(call_id=call_id, output=tool_output)
-
-                yield RunResultStreaming(
-                    input=user_input,
-                    event=ResponseFunctionCallOutputItemDoneEvent(
-                        type="response.function_call_output_item.done",
-                        item=ResponseFunctionToolCallOutput(
-                            call_id=call_id,
-                            output=tool_output,
-                            name=name,
-                            type="function_call_output",
-                            status="completed",
-                        ),
-                        output_index=None,
-                        sequence_number=None,
-                    ),
-                    final_output=final_output_text,
+        chain.begin(prompt)
+        return agent.llm.chat(
+            messages=Runner._apply_context(agent, prompt, usage), store=True, **kwargs
+        )
+
+    @staticmethod
+    async def _achat(
+        agent: Agent,
+        prompt: PromptTemplate,
+        chain: _ResponseChain | None,
+        *,
+        stream: bool,
+        usage: RunUsage | None = None,
+    ) -> Response | AsyncIterator[ResponseStreamEvent]:
+        """Call the agent's model asynchronously with the current prompt.
+
+        See ``_chat`` for the `chain_responses` and `context_policy` behavior.
+
+        Args:
+            prompt: The authoritative conversation history.
+            chain: The server-side chain state, or None when chaining is disabled.
+            stream: Whether to stream the output.
+            usage: The run usage, credited with the tokens saved by the context policy.
+
+        Returns:
+            Response | AsyncIterator[ResponseStreamEvent]: The model response or stream.
+        """
+        kwargs: dict[str, Any] = {
+            "stream": stream,
+            "tools": agent._tool_set,
+            "tool_choice": agent.tool_choice,
+            "parallel_tool_calls": agent.parallel_tool_calls,
+        }
+        if chain is None:
+            return await agent.llm.achat(
+                messages=Runner._apply_context(agent, prompt, usage), **kwargs
+            )
+
+        if chain.response_id is not None:
+            try:
+                return await agent.llm.achat(
+                    messages=chain.request_input(prompt),
+                    store=True,
+                    previous_response_id=chain.response_id,
+                    **kwargs,
                 )
-            iteration += 1
+            except (BadRequestError, NotFoundError) as e:
+                if not chain.is_chain_error(e):
+                    raise
+                chain.reset()
 
-        raise RuntimeError(f"Agent exceeded max iterations ({agent.max_iterations})")
+        chain.begin(prompt)
+        return await agent.llm.achat(
+            messages=Runner._apply_context(agent, prompt, usage), store=True, **kwargs
+        )
 
     @staticmethod
     def _build_prompt(
@@ -549,6 +976,143 @@ class Runner:
         prompt.add_user(user_input)
         return prompt
 
+    @staticmethod
+    def _collect_output(
+        response: Response,
+        all_items: list[RunItem],
+    ) -> tuple[dict[str, dict[str, Any]], str]:
+        """Convert a response's output into run items.
+
+        Args:
+            response: The model response.
+            all_items: The run items accumulated so far, extended in place.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], str]: The tool calls keyed by item
+            ID, and the final output text.
+        """
+        tool_calls: dict[str, dict[str, Any]] = {}
+        final_output_text: str = ""
+
+        for item in response.output:
+            if item.type == "reasoning":
+                all_items.append(
+                    ReasoningItem(
+                        role="assistant",
+                        content=item.content,
+                        raw_item=item,
+                        type="reasoning_item",
+                    )
+                )
+
+            elif item.type == "function_call":
+                tool_calls[item.id] = {
+                    "call_id": item.call_id,
+                    "name": item.name,
+                    "arguments": item.arguments,
+                }
+                all_items.append(
+                    ToolCallItem(
+                        role="assistant",
+                        content="",
+                        raw_item=item,
+                        type="tool_call_item",
+                    )
+                )
+
+            elif item.type == "message":
+                text_parts = [c.text for c in item.content if c.type == "output_text"]
+                final_output_text = "".join(text_parts)
+                all_items.append(
+                    MessageOutputItem(
+                        role="assistant",
+                        content=final_output_text,
+                        raw_item=item,
+                        type="message_output_item",
+                    )
+                )
+
+        return tool_calls, final_output_text
+
+    @staticmethod
+    def _add_tool_outputs(
+        prompt: PromptTemplate,
+        all_items: list[RunItem],
+        tool_calls: list[dict[str, Any]],
+        tool_outputs: list[str],
+    ) -> None:
+        """Record a turn's tool calls and outputs, in call order.
+
+        Args:
+            prompt: The conversation history, extended in place.
+            all_items: The run items accumulated so far, extended in place.
+            tool_calls: The tool calls of the turn.
+            tool_outputs: The tool outputs, in the same order as `tool_calls`.
+        """
+        for tc, tool_output in zip(tool_calls, tool_outputs):
+            call_id = tc["call_id"]
+            name = tc["name"]
+            arguments_str = tc["arguments"]
+
+            prompt.add_tool_call(
+                name=name,
+                arguments=arguments_str,
+                call_id=call_id,
+            )
+
+            prompt.add_tool_output(call_id=call_id, output=tool_output)
+
+            all_items.append(
+                ToolCallOutputItem(
+                    role="tool",
+                    content=tool_output,
+                    raw_item=ResponseFunctionToolCallOutput(
+                        call_id=call_id,
+                        output=tool_output,
+                        name=name,
+                        type="function_call_output",
+                        status="completed",
+                    ),
+                    type="tool_call_output_item",
+                )
+            )
+
+    @staticmethod
+    def _tool_output_added_event(
+        call_id: str, name: str
+    ) -> ResponseFunctionCallOutputItemAddedEvent:
+        """Build the event emitted when a tool starts executing."""
+        return ResponseFunctionCallOutputItemAddedEvent(
+            type="response.function_call_output_item.added",
+            item=ResponseFunctionToolCallOutput(
+                call_id=call_id,
+                output="",
+                name=name,
+                type="function_call_output",
+                status="in_progress",
+            ),
+            output_index=None,
+            sequence_number=None,
+        )
+
+    @staticmethod
+    def _tool_output_done_event(
+        call_id: str, name: str, output: str
+    ) -> ResponseFunctionCallOutputItemDoneEvent:
+        """Build the event emitted when a tool finishes executing."""
+        return ResponseFunctionCallOutputItemDoneEvent(
+            type="response.function_call_output_item.done",
+            item=ResponseFunctionToolCallOutput(
+                call_id=call_id,
+                output=output,
+                name=name,
+                type="function_call_output",
+                status="completed",
+            ),
+            output_index=None,
+            sequence_number=None,
+        )
+
     @staticmethod
     def _run_tool(
         agent: Agent,
@@ -559,6 +1123,7 @@ class Runner:
         """Execute a registered tool safely with provided arguments.
 
         Handles parsing of arguments (from JSON string or dict) and catches execution errors.
+        Outputs above the tool's or agent's output policy limit are offloaded.
 
         Args:
             name: The name of the tool to execute.
@@ -578,8 +1143,9 @@ class Runner:
             else:
                 args = arguments
 
-            result = tool.run(args, runtime_context)
-            return str(result)
+            result = tool.run(args, runtime_context, agent._tool_executors)
+            # Offloading a large output may write to the blob store
+            return Runner._limit_output(agent, tool, str(result))
         except Exception as e:
             return f"Error executing tool '{name}': {e}"
 
@@ -610,7 +1176,284 @@ class Runner:
             else:
                 args = arguments
 
-            result = await tool.arun(args, runtime_context)
-            return str(result)
+            result = await tool.arun(args, runtime_context, agent._tool_executors)
+            # Offloading a large output may write to the blob store
+            return Runner._limit_output(agent, tool, str(result))
         except Exception as e:
             return f"Error executing tool '{name}': {e}"
+
+    @staticmethod
+    def _limit_output(agent: Agent, tool: Tool, output: str) -> str:
+        """Apply the tool's output policy, or the agent's, to a tool output."""
+        policy = tool.output_policy or agent.tool_output_policy
+        if policy is None:
+            return output
+        return policy.apply(output)
+
+    @classmethod
+    def _call_tool(
+        cls,
+        agent: Agent,
+        tool_call: dict[str, Any],
+        runtime_context: dict[str, Any] | None,
+        timings: RunTimings | None,
+    ) -> str:
+        """Execute a tool call, recording its duration in `timings` if given.
+
+        Time spent waiting for a worker of the tool's executor is recorded
+        separately from the execution time.
+        """
+        # Discard a wait recorded outside of this call
+        take_queue_wait()
+        start = time.perf_counter()
+        output = cls._run_tool(
+            agent, tool_call["name"], tool_call["arguments"], runtime_context
+        )
+        if timings is not None:
+            cls._record_tool_timing(timings, tool_call, start, take_queue_wait())
+        return output
+
+    @classmethod
+    async def _acall_tool(
+        cls,
+        agent: Agent,
+        tool_call: dict[str, Any],
+        runtime_context: dict[str, Any] | None,
+        timings: RunTimings | None,
+    ) -> str:
+        """Execute a tool call asynchronously, recording its duration in `timings` if given.
+
+        Time spent waiting for a worker of the tool's executor is recorded
+        separately from the execution time.
+        """
+        # Discard a wait recorded outside of this call
+        take_queue_wait()
+        start = time.perf_counter()
+        output = await cls._arun_tool(
+            agent, tool_call["name"], tool_call["arguments"], runtime_context
+        )
+        if timings is not None:
+            cls._record_tool_timing(timings, tool_call, start, take_queue_wait())
+        return output
+
+    @staticmethod
+    def _record_tool_timing(
+        timings: RunTimings,
+        tool_call: dict[str, Any],
+        start: float,
+        queue_wait: float = 0.0,
+    ) -> None:
+        timings.tool_calls.append(
+            ToolCallTiming(
+                call_id=tool_call["call_id"],
+                name=tool_call["name"],
+                duration=time.perf_counter() - start - queue_wait,
+                queue_wait=queue_wait,
+            )
+        )
+
+    @staticmethod
+    def _pooled_calls(agent: Agent, tool_calls: list[dict[str, Any]]) -> list[int]:
+        """Return the indexes of the calls the sync runner dispatches to the pool.
+
+        In `thread` tool execution, with `parallel_tool_calls` and several
+        calls in the turn, these are the calls of registered tools not in
+        `inline` mode.
+        """
+        if (
+            agent.tool_execution != "thread"
+            or not agent.parallel_tool_calls
+            or len(tool_calls) < 2
+        ):
+            return []
+        pooled = []
+        for index, tc in enumerate(tool_calls):
+            tool = agent._tools.get(tc["name"])
+            if tool is not None and tool.execution_mode != "inline":
+                pooled.append(index)
+        return pooled
+
+    @classmethod
+    def _run_tools(
+        cls,
+        agent: Agent,
+        tool_calls: list[dict[str, Any]],
+        runtime_context: dict[str, Any] | None = None,
+        timings: RunTimings | None = None,
+    ) -> list[str]:
+        """Execute a turn's tool calls synchronously.
+
+        In `thread` mode with `parallel_tool_calls` enabled, the calls of
+        tools not in `inline` mode are dispatched to the agent's tool executor
+        and gathered once all of them finish. The other calls run in the
+        caller's thread, one after another.
+
+        Args:
+            tool_calls: The tool calls of the turn, in the order the model made them.
+            runtime_context: Optional runtime context to pass to tool arguments of type ``ToolRuntime``.
+            timings: Optional run timings that tool durations are recorded in.
+
+        Returns:
+            list[str]: The tool outputs, in the same order as `tool_calls`.
+        """
+        pooled = cls._pooled_calls(agent, tool_calls)
+        if not pooled:
+            return [
+                cls._call_tool(agent, tc, runtime_context, timings)
+                for tc in tool_calls
+            ]
+
+        executor = agent.get_tool_executor()
+        futures = {
+            index: executor.submit(
+                contextvars.copy_context().run,
+                cls._call_tool,
+                agent,
+                tool_calls[index],
+                runtime_context,
+                timings,
+            )
+            for index in pooled
+        }
+        outputs = [
+            None if index in futures else cls._call_tool(agent, tc, runtime_context, timings)
+            for index, tc in enumerate(tool_calls)
+        ]
+        for index, future in futures.items():
+            outputs[index] = future.result()
+        return outputs
+
+    @classmethod
+    def _stream_tools(
+        cls,
+        agent: Agent,
+        tool_calls: list[dict[str, Any]],
+        runtime_context: dict[str, Any] | None = None,
+        timings: RunTimings | None = None,
+    ) -> Iterator[tuple[int, str | None]]:
+        """Execute a turn's tool calls synchronously, reporting progress.
+
+        Yields ``(index, None)`` when the tool call at `index` starts and
+        ``(index, output)`` when it finishes. Calls dispatched to the agent's
+        tool executor (see ``_run_tools``) may finish out of order.
+
+        Args:
+            tool_calls: The tool calls of the turn, in the order the model made them.
+            runtime_context: Optional runtime context to pass to tool arguments of type ``ToolRuntime``.
+            timings: Optional run timings that tool durations are recorded in.
+
+        Yields:
+            tuple[int, str | None]: The call index and its output (``None`` on start).
+        """
+        pooled = set(cls._pooled_calls(agent, tool_calls))
+        futures = []
+        if pooled:
+            progress: queue.SimpleQueue[tuple[int, str | None]] = queue.SimpleQueue()
+
+            def run_one(index: int, tc: dict[str, Any]) -> None:
+                progress.put((index, None))
+                output = cls._call_tool(agent, tc, runtime_context, timings)
+                progress.put((index, output))
+
+            executor = agent.get_tool_executor()
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, run_one, index, tool_calls[index]
+                )
+                for index in sorted(pooled)
+            ]
+        try:
+            for index, tc in enumerate(tool_calls):
+                if index not in pooled:
+                    yield index, None
+                    yield index, cls._call_tool(agent, tc, runtime_context, timings)
+            for _ in range(2 * len(pooled)):
+                yield progress.get()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @classmethod
+    async def _arun_tools(
+        cls,
+        agent: Agent,
+        tool_calls: list[dict[str, Any]],
+        runtime_context: dict[str, Any] | None = None,
+        timings: RunTimings | None = None,
+    ) -> list[str]:
+        """Execute a turn's tool calls asynchronously.
+
+        When `parallel_tool_calls` is enabled, the calls run concurrently with
+        at most `max_concurrent_tool_calls` in flight. Otherwise they run one
+        after another.
+
+        Args:
+            tool_calls: The tool calls of the turn, in the order the model made them.
+            runtime_context: Optional runtime context to pass to tool arguments of type ``ToolRuntime``.
+            timings: Optional run timings that tool durations are recorded in.
+
+        Returns:
+            list[str]: The tool outputs, in the same order as `tool_calls`.
+        """
+        if not agent.parallel_tool_calls or len(tool_calls) < 2:
+            return [
+                await cls._acall_tool(agent, tc, runtime_context, timings)
+                for tc in tool_calls
+            ]
+
+        semaphore = asyncio.Semaphore(agent.max_concurrent_tool_calls)
+
+        async def run_one(tc: dict[str, Any]) -> str:
+            async with semaphore:
+                return await cls._acall_tool(agent, tc, runtime_context, timings)
+
+        return list(await asyncio.gather(*(run_one(tc) for tc in tool_calls)))
+
+    @classmethod
+    async def _astream_tools(
+        cls,
+        agent: Agent,
+        tool_calls: list[dict[str, Any]],
+        runtime_context: dict[str, Any] | None = None,
+        timings: RunTimings | None = None,
+    ) -> AsyncIterator[tuple[int, str | None]]:
+        """Execute a turn's tool calls asynchronously, reporting progress.
+
+        Yields ``(index, None)`` when the tool call at `index` starts and
+        ``(index, output)`` when it finishes. Calls run concurrently under the
+        same rules as ``_arun_tools``, so finish events may arrive out of order.
+
+        Args:
+            tool_calls: The tool calls of the turn, in the order the model made them.
+            runtime_context: Optional runtime context to pass to tool arguments of type ``ToolRuntime``.
+            timings: Optional run timings that tool durations are recorded in.
+
+        Yields:
+            tuple[int, str | None]: The call index and its output (``None`` on start).
+        """
+        if not agent.parallel_tool_calls or len(tool_calls) < 2:
+            for index, tc in enumerate(tool_calls):
+                yield index, None
+                yield index, await cls._acall_tool(agent, tc, runtime_context, timings)
+            return
+
+        semaphore = asyncio.Semaphore(agent.max_concurrent_tool_calls)
+        queue: asyncio.Queue[tuple[int, str | None]] = asyncio.Queue()
+
+        async def run_one(index: int, tc: dict[str, Any]) -> None:
+            async with semaphore:
+                queue.put_nowait((index, None))
+                output = await cls._acall_tool(agent, tc, runtime_context, timings)
+                queue.put_nowait((index, output))
+
+        tasks = [
+            asyncio.create_task(run_one(index, tc))
+            for index, tc in enumerate(tool_calls)
+        ]
+        try:
+            for _ in range(2 * len(tool_calls)):
+                yield await queue.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -2,13 +2,208 @@
 
 from __future__ import annotations
 
+import json
+import pickle
 import inspect
 import asyncio
-from typing import Any, get_type_hints
-from collections.abc import Awaitable, Callable
-from pydantic import BaseModel, ConfigDict, model_validator
-
+import itertools
+import threading
+from typing import Any, Hashable, NamedTuple, get_type_hints
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .cache import LRUCache
+from .blobs import BlobStore
+from .executors import (
+    ToolExecutor,
+    get_tool_executor,
+    run_in_process,
+    arun_in_process,
+)
+from . import tracing
 from .args_schema import ArgsSchema
+from .constants import (
+    ToolExecutionMode,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_TOOL_OUTPUT_MAX_CHARS,
+    DEFAULT_TOOL_OUTPUT_PREVIEW_CHARS,
+    DEFAULT_TOOL_OUTPUT_PAGE_CHARS,
+    READ_TOOL_OUTPUT_TOOL_NAME,
+)
+
+
+_SCHEMA_FIELDS = frozenset({"name", "description", "args_schema", "strict"})
+"""Tool fields that contribute to the OpenAI tool definition."""
+
+_schema_generations = itertools.count(1)
+
+_schema_generation = 0
+"""Bumped whenever any tool's definition changes, so ``ToolSet`` can skip
+checking its tools while nothing changed."""
+
+
+_MISSING = object()
+
+_result_caches: dict[tuple[Any, ...], LRUCache] = {}
+"""Process-wide tool result caches, keyed by tool name and implementation."""
+
+_result_caches_lock = threading.Lock()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a tool's result cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class ToolCachePolicy(BaseModel):
+    """Declarative policy for memoizing tool results.
+
+    Results are cached per tool, keyed on the validated arguments, and shared
+    by every agent in the process that uses the same tool. Runtime context is
+    not part of the default key; provide a `key_func` if the result depends on
+    it. Exceptions are never cached.
+
+    Example:
+        Tool(func=geocode, cache_policy=ToolCachePolicy(ttl=3600))
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    enabled: bool = True
+    """Whether results are cached. Set to False for side-effecting tools."""
+
+    ttl: float | None = None
+    """Lifetime of a cached result, in seconds. None means no expiry."""
+
+    max_entries: int | None = DEFAULT_CACHE_MAX_ENTRIES
+    """Maximum number of cached results for the tool."""
+
+    key_func: Callable[[dict[str, Any]], Hashable] | None = None
+    """Builds the cache key from the validated arguments.
+
+    Defaults to the canonical JSON encoding of the arguments.
+    """
+
+
+class ToolOutputPolicy(BaseModel):
+    """Declarative policy for tool outputs too large to paste into the prompt.
+
+    Outputs longer than `max_chars` are saved in `store`, and the model gets
+    a preview of the first `preview_chars` characters plus a handle. Agents
+    using the policy register a `read_tool_output` tool, which the model can
+    call to page through the full output `page_chars` characters at a time.
+
+    Example:
+        Tool(func=fetch_logs, output_policy=ToolOutputPolicy(max_chars=8000))
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    enabled: bool = True
+    """Whether large outputs are offloaded. Set to False to opt a tool out of
+    the agent's `tool_output_policy`."""
+
+    max_chars: int = DEFAULT_TOOL_OUTPUT_MAX_CHARS
+    """Outputs longer than this are offloaded to the store."""
+
+    preview_chars: int = DEFAULT_TOOL_OUTPUT_PREVIEW_CHARS
+    """Number of leading characters kept in the prompt, at most `max_chars`."""
+
+    page_chars: int = DEFAULT_TOOL_OUTPUT_PAGE_CHARS
+    """Number of characters returned per `read_tool_output` call."""
+
+    store: BlobStore = Field(default_factory=BlobStore)
+    """Where offloaded outputs are kept. Defaults to an in-memory store."""
+
+    @model_validator(mode="after")
+    def _validate_sizes(self) -> ToolOutputPolicy:
+        if self.max_chars < 1:
+            raise ValueError("max_chars must be >= 1")
+        if self.preview_chars < 0:
+            raise ValueError("preview_chars must be >= 0")
+        if self.page_chars < 1:
+            raise ValueError("page_chars must be >= 1")
+        return self
+
+    def apply(self, output: str) -> str:
+        """Offload `output` if it is too large.
+
+        Args:
+            output: The tool output.
+
+        Returns:
+            str: `output` itself, or its preview followed by the handle and
+            instructions to read the rest.
+        """
+        if not self.enabled or len(output) <= self.max_chars:
+            return output
+        handle = self.store.put(output)
+        preview = min(self.preview_chars, self.max_chars)
+        return (
+            f"{output[:preview]}\n\n"
+            f"[Output truncated: showing {preview} of {len(output)} characters. "
+            f"The full output is stored under handle '{handle}'. Call "
+            f"{READ_TOOL_OUTPUT_TOOL_NAME} with this handle and offset={preview} "
+            "to read more.]"
+        )
+
+    @staticmethod
+    def retrieval_tool(policies: list[ToolOutputPolicy]) -> Tool:
+        """Build the tool that pages through outputs offloaded by `policies`.
+
+        Args:
+            policies: The policies whose stores are searched, in order.
+
+        Returns:
+            ``Tool``: The `read_tool_output` tool.
+        """
+        stores = list({id(policy.store): policy.store for policy in policies}.values())
+        page_chars = min(policy.page_chars for policy in policies)
+
+        def read_tool_output(handle: str, offset: int) -> str:
+            for store in stores:
+                content = store.get(handle)
+                if content is not None:
+                    break
+            else:
+                return f"Error: No stored output with handle '{handle}'"
+
+            offset = max(0, offset)
+            end = min(offset + page_chars, len(content))
+            if end >= len(content):
+                footer = f"[Characters {offset}-{end} of {len(content)}. End of output.]"
+            else:
+                footer = (
+                    f"[Characters {offset}-{end} of {len(content)}. "
+                    f"Call again with offset={end} to read more.]"
+                )
+            return f"{content[offset:end]}\n\n{footer}"
+
+        return Tool(
+            name=READ_TOOL_OUTPUT_TOOL_NAME,
+            description=(
+                "Read part of a tool output that was too large to show in full. "
+                f"Returns up to {page_chars} characters starting at `offset`."
+            ),
+            func=read_tool_output,
+            args_schema=[
+                ArgsSchema(
+                    name="handle",
+                    type=str,
+                    description="The handle given in the truncated output.",
+                ),
+                ArgsSchema(
+                    name="offset",
+                    type=int,
+                    description="Index of the first character to read.",
+                ),
+            ],
+            output_policy=ToolOutputPolicy(enabled=False),
+        )
 
 
 class ToolRuntime(BaseModel):
@@ -55,6 +250,47 @@ class Tool(BaseModel):
     provided in the function definition. If None, `strict` argument will not
     be included in tool definition."""
 
+    cache_policy: ToolCachePolicy | None = None
+    """Optional policy for memoizing the tool's results."""
+
+    output_policy: ToolOutputPolicy | None = None
+    """Optional policy for offloading large outputs.
+
+    Overrides the agent's `tool_output_policy` for this tool.
+    """
+
+    execution_mode: ToolExecutionMode = "thread"
+    """Where `func` runs.
+
+    Options: `thread` runs it on a worker thread: the tool's `executor` if
+    set, otherwise the event loop's default executor in async runs, and the
+    agent's `tool_executor` in sync runs when a turn's calls run in parallel.
+    `inline` always runs it in the caller's thread, even on the event loop;
+    use it for fast functions only. `process` runs it in a shared,
+    pre-started process pool, for CPU-bound work; `func` must be a
+    module-level function, and its arguments and result must be picklable.
+    Has no effect on `coroutine` in async runs.
+    """
+
+    executor: str | ToolExecutor | None = None
+    """Optional dedicated executor for `func`, in sync and async runs.
+
+    Either a ``ToolExecutor`` or the name of one, resolved against the
+    agent's `tool_executors` and then the process-wide registry. Tools
+    naming the same executor share its workers and queue. Only valid with
+    the `thread` execution mode.
+    """
+
+    # Plain slots rather than private attributes, which are read through
+    # ``BaseModel.__getattr__`` and cost as much as rebuilding the definition
+    __slots__ = ("_openai_tool", "_schema_version")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Any change to the schema-relevant fields invalidates the cached definition
+        if name in _SCHEMA_FIELDS:
+            self._set_openai_tool(None)
+
     @model_validator(mode="after")
     def _validate_callable(self) -> Tool:
         """Ensure correct usage of func (sync) vs coroutine (async)."""
@@ -69,6 +305,22 @@ class Tool(BaseModel):
         if self.coroutine and not inspect.iscoroutinefunction(self.coroutine):
             raise ValueError("`coroutine` should be an async function.")
 
+        if self.execution_mode == "process":
+            if self.func is None:
+                raise ValueError("`process` execution requires a synchronous `func`.")
+            try:
+                pickle.dumps(self.func)
+            except Exception as e:
+                raise ValueError(
+                    "`process` execution requires a picklable, module-level `func`"
+                ) from e
+
+        if self.executor is not None:
+            if self.func is None:
+                raise ValueError("`executor` requires a synchronous `func`.")
+            if self.execution_mode != "thread":
+                raise ValueError("`executor` requires the `thread` execution mode.")
+
         return self
 
     @model_validator(mode="after")
@@ -126,45 +378,214 @@ class Tool(BaseModel):
 
         return final_args
 
+    # Result caching
+    def _result_cache(self) -> LRUCache | None:
+        """Return the shared result cache of the tool, if caching is enabled."""
+        policy = self.cache_policy
+        if policy is None or not policy.enabled:
+            return None
+
+        key = (self.name, self.func, self.coroutine, policy.ttl, policy.max_entries)
+        with _result_caches_lock:
+            cache = _result_caches.get(key)
+            if cache is None:
+                cache = LRUCache(max_entries=policy.max_entries, ttl=policy.ttl)
+                _result_caches[key] = cache
+            return cache
+
+    def _cache_key(self, parsed_args: dict[str, Any]) -> Hashable:
+        """Build the result cache key for a set of validated arguments."""
+        if self.cache_policy and self.cache_policy.key_func:
+            return self.cache_policy.key_func(parsed_args)
+        return json.dumps(parsed_args, sort_keys=True, default=str)
+
+    def cache_info(self) -> CacheInfo:
+        """Report hit/miss statistics of the tool's result cache.
+
+        Returns:
+            ``CacheInfo``: The counters of the shared cache, or zeros if
+            caching is disabled.
+        """
+        cache = self._result_cache()
+        if cache is None:
+            return CacheInfo(hits=0, misses=0, maxsize=None, currsize=0)
+        return CacheInfo(
+            hits=cache.hits,
+            misses=cache.misses,
+            maxsize=cache.max_entries,
+            currsize=len(cache),
+        )
+
+    def cache_clear(self) -> None:
+        """Clear the tool's result cache and its counters."""
+        cache = self._result_cache()
+        if cache is not None:
+            cache.clear()
+
     def run(
         self,
         args: dict[str, Any],
         runtime_context: dict[str, Any] | None = None,
+        executors: dict[str, ToolExecutor] | None = None,
     ) -> Any:
-        """Execute the tool synchronously."""
+        """Execute the tool synchronously.
+
+        If a `cache_policy` is set, a cached result for the same arguments is
+        returned without running the function. With the `process` execution
+        mode, the function runs in the tool process pool; with an `executor`,
+        on that executor. Otherwise it runs in the calling thread.
+
+        Args:
+            args: The arguments produced by the model.
+            runtime_context: Values for ``ToolRuntime`` parameters.
+            executors: Named executors to resolve `executor` against before
+                the process-wide registry, usually the agent's.
+
+        Raises:
+            ToolExecutorFullError: If the tool's executor queue is full.
+        """
         if not self.func:
             raise RuntimeError("This tool has no synchronous implementation")
-        parsed_args = self._resolve_arguments(args)
-        final_args = self._inject_runtime(parsed_args, runtime_context, self.func)
-        return self.func(**final_args)
+
+        with tracing.span("tool.run", {"tool.name": self.name}) as span:
+            parsed_args = self._resolve_arguments(args)
+
+            cache = self._result_cache()
+            if cache is not None:
+                key = self._cache_key(parsed_args)
+                result = cache.get(key, _MISSING)
+                if span is not None:
+                    span.set_attribute("tool.cache_hit", result is not _MISSING)
+                if result is not _MISSING:
+                    return result
+
+            final_args = self._inject_runtime(parsed_args, runtime_context, self.func)
+            if self.execution_mode == "process":
+                # Only the function reference and the resolved arguments are pickled
+                result = run_in_process(self.func, final_args)
+            elif self.executor is not None:
+                executor = self._resolve_executor(executors)
+                result = executor.run(self.func, **final_args)
+            else:
+                result = self.func(**final_args)
+            if cache is not None:
+                cache.set(key, result)
+            return result
 
     async def arun(
         self,
         args: dict[str, Any],
         runtime_context: dict[str, Any] | None = None,
+        executors: dict[str, ToolExecutor] | None = None,
     ) -> Any:
         """Execute the tool asynchronously.
 
         If `coroutine` is provided, it is used. Otherwise, `func` is run
-        in a thread pool to avoid blocking the event loop.
-        """
-        parsed_args = self._resolve_arguments(args)
-        if self.coroutine:
-            final_args = self._inject_runtime(
-                parsed_args, runtime_context, self.coroutine
-            )
-            return await self.coroutine(**final_args)
+        according to `execution_mode`: by default in a thread pool to avoid
+        blocking the event loop, which is the tool's `executor` when one is
+        set. If a `cache_policy` is set, a cached result for the same
+        arguments is returned without running either.
 
-        # Fallback: run sync func on a thread
-        final_args = self._inject_runtime(parsed_args, runtime_context, self.func)
-        return await asyncio.to_thread(self.func, **final_args)
+        Args:
+            args: The arguments produced by the model.
+            runtime_context: Values for ``ToolRuntime`` parameters.
+            executors: Named executors to resolve `executor` against before
+                the process-wide registry, usually the agent's.
+
+        Raises:
+            ToolExecutorFullError: If the tool's executor queue is full.
+        """
+        with tracing.span("tool.run", {"tool.name": self.name}) as span:
+            parsed_args = self._resolve_arguments(args)
+
+            cache = self._result_cache()
+            if cache is not None:
+                key = self._cache_key(parsed_args)
+                result = cache.get(key, _MISSING)
+                if span is not None:
+                    span.set_attribute("tool.cache_hit", result is not _MISSING)
+                if result is not _MISSING:
+                    return result
+
+            if self.coroutine and self.execution_mode != "process":
+                final_args = self._inject_runtime(
+                    parsed_args, runtime_context, self.coroutine
+                )
+                result = await self.coroutine(**final_args)
+            else:
+                final_args = self._inject_runtime(
+                    parsed_args, runtime_context, self.func
+                )
+                if self.execution_mode == "process":
+                    result = await arun_in_process(self.func, final_args)
+                elif self.execution_mode == "inline":
+                    result = self.func(**final_args)
+                elif self.executor is not None:
+                    executor = self._resolve_executor(executors)
+                    result = await executor.arun(self.func, **final_args)
+                else:
+                    # Fallback: run sync func on a thread
+                    result = await asyncio.to_thread(self.func, **final_args)
+
+            if cache is not None:
+                cache.set(key, result)
+            return result
+
+    def _resolve_executor(
+        self, executors: dict[str, ToolExecutor] | None
+    ) -> ToolExecutor:
+        """Return the ``ToolExecutor`` named or given by `executor`."""
+        if isinstance(self.executor, ToolExecutor):
+            return self.executor
+        if executors and self.executor in executors:
+            return executors[self.executor]
+        return get_tool_executor(self.executor)
 
     def convert_to_openai_tool(self) -> dict[str, Any]:
         """Convert the tool to the OpenAI tool schema format.
 
+        The definition is built once and cached until one of `name`,
+        `description`, `args_schema` or `strict` is reassigned. Call
+        ``refresh_openai_tool()`` after mutating an ``ArgsSchema`` in place.
+        The returned dictionary is shared and must not be modified.
+
         Returns:
             dict[str, Any]: The OpenAI-compatible tool definition.
         """
+        try:
+            definition = self._openai_tool
+        except AttributeError:
+            # Not set yet, or lost by `model_copy`
+            definition = None
+        if definition is None:
+            definition = self._build_openai_tool()
+            object.__setattr__(self, "_openai_tool", definition)
+        return definition
+
+    def refresh_openai_tool(self) -> dict[str, Any]:
+        """Rebuild the cached OpenAI tool definition.
+
+        Returns:
+            dict[str, Any]: The freshly built tool definition.
+        """
+        definition = self._build_openai_tool()
+        self._set_openai_tool(definition)
+        return definition
+
+    @property
+    def schema_version(self) -> int:
+        """Counter incremented whenever the tool definition changes."""
+        return getattr(self, "_schema_version", 0)
+
+    def _set_openai_tool(self, definition: dict[str, Any] | None) -> None:
+        """Replace the cached definition and bump the versions."""
+        global _schema_generation
+        object.__setattr__(self, "_openai_tool", definition)
+        object.__setattr__(self, "_schema_version", self.schema_version + 1)
+        _schema_generation = next(_schema_generations)
+
+    def _build_openai_tool(self) -> dict[str, Any]:
+        """Build the OpenAI tool definition from the current fields."""
         properties = {}
         required = []
 
@@ -185,3 +606,64 @@ class Tool(BaseModel):
             },
             **({"strict": self.strict} if self.strict is not None else {}),
         }
+
+
+class ToolSet(Sequence[Tool]):
+    """An ordered list of tools with their compiled OpenAI definitions.
+
+    The definitions list is compiled once and reused by every request, so
+    sending tools costs nothing per call. It is rebuilt only when one of the
+    tools' definitions changes, detected through ``Tool.schema_version``.
+    Agents and ``ChatOpenAI.bind_tools`` keep one; pass it as `tools` when
+    calling ``ChatOpenAI.chat`` repeatedly with the same tools.
+
+    Example:
+        tools = ToolSet([search, fetch])
+        llm.chat(messages=prompt, tools=tools)
+    """
+
+    __slots__ = ("_tools", "_definitions", "_versions", "_generation")
+
+    def __init__(self, tools: Iterable[Tool] | None = None) -> None:
+        """Compile the definitions of `tools`.
+
+        Args:
+            tools: The tools, in the order they are sent to the model.
+        """
+        self._tools = list(tools or ())
+        self._definitions: list[dict[str, Any]] = []
+        self._versions: tuple[int, ...] | None = None
+        self._generation = -1
+        self.definitions()
+
+    def definitions(self) -> list[dict[str, Any]]:
+        """Return the OpenAI tool definitions, in order.
+
+        The returned list is shared and must not be modified.
+
+        Returns:
+            list[dict[str, Any]]: The compiled definitions.
+        """
+        generation = _schema_generation
+        if generation == self._generation:
+            return self._definitions
+
+        # Some tool changed since the last check; rebuild only if it is ours
+        versions = tuple(tool.schema_version for tool in self._tools)
+        if versions != self._versions:
+            self._definitions = [tool.convert_to_openai_tool() for tool in self._tools]
+            self._versions = versions
+        self._generation = generation
+        return self._definitions
+
+    def __getitem__(self, index):
+        return self._tools[index]
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __iter__(self) -> Iterator[Tool]:
+        return iter(self._tools)
+
+    def __repr__(self) -> str:
+        return f"ToolSet({[tool.name for tool in self._tools]!r})"
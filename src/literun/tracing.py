@@ -0,0 +1,526 @@
+"""Tracing hooks for agent runs, model calls and tool executions.
+
+Spans are only created while a tracer is installed with ``set_tracer``.
+Without one, every hook is a single global lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, AsyncIterator, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .events import ResponseStreamEvent
+
+
+Attributes = dict[str, Any]
+
+T = TypeVar("T")
+
+_tracer: Tracer | None = None
+"""The installed tracer, or None when tracing is disabled."""
+
+_current_span: ContextVar[Span | None] = ContextVar(
+    "literun_current_span", default=None
+)
+"""The innermost open span of the current thread or task."""
+
+
+class Span:
+    """A timed operation with attributes, nested under its parent span."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "parent",
+        "start_ns",
+        "end_ns",
+        "error",
+        "thread_id",
+        "task_name",
+        "data",
+    )
+
+    def __init__(self, name: str, attributes: Attributes, parent: Span | None) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.error: BaseException | None = None
+        self.thread_id = threading.get_ident()
+        self.task_name = _current_task_name()
+        # Tracer-specific state, e.g. the native span of an adapter
+        self.data: Any = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a single attribute."""
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Attributes) -> None:
+        """Set several attributes at once."""
+        self.attributes.update(attributes)
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the span in seconds, once it has ended."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name!r}, attributes={self.attributes!r})"
+
+
+class Tracer:
+    """Receives span start and end notifications.
+
+    Subclass and override ``on_start`` and ``on_end``. Both are called on
+    the thread that runs the traced operation, so implementations must be
+    thread-safe.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts."""
+
+    def on_end(self, span: Span) -> None:
+        """Called when a span ends. `span.error` is set if the operation failed."""
+
+
+def set_tracer(tracer: Tracer | None) -> Tracer | None:
+    """Install a process-wide tracer, or disable tracing with None.
+
+    Args:
+        tracer: The tracer to install.
+
+    Returns:
+        Tracer | None: The previously installed tracer.
+    """
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def get_tracer() -> Tracer | None:
+    """Return the installed tracer, if any."""
+    return _tracer
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span of the current thread or task."""
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    attributes: Attributes | Callable[[], Attributes] | None = None,
+    *,
+    activate: bool = True,
+) -> Span | None:
+    """Start a span under the current span.
+
+    Args:
+        name: The span name, e.g. ``llm.chat``.
+        attributes: Initial attributes, or a function that builds them. The
+            function is only called when tracing is enabled.
+        activate: Whether the span becomes the parent of spans started
+            until it ends. Disable for spans that outlive the current call,
+            such as streams.
+
+    Returns:
+        Span | None: The span, or None when tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return None
+    if callable(attributes):
+        attributes = attributes()
+    span = Span(name, dict(attributes or {}), _current_span.get())
+    if activate:
+        _current_span.set(span)
+    tracer.on_start(span)
+    return span
+
+
+def end_span(
+    span: Span | None,
+    attributes: Attributes | None = None,
+    error: BaseException | None = None,
+) -> None:
+    """End a span started with ``start_span``. Does nothing for None.
+
+    Args:
+        span: The span to end.
+        attributes: Attributes to set before ending.
+        error: The exception the operation failed with, if any.
+    """
+    if span is None or span.end_ns is not None:
+        return
+    if attributes:
+        span.attributes.update(attributes)
+    if error is not None and not isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+        span.error = error
+    span.end_ns = time.time_ns()
+    if _current_span.get() is span:
+        _current_span.set(span.parent)
+    tracer = _tracer
+    if tracer is not None:
+        tracer.on_end(span)
+
+
+class _SpanScope:
+    """Context manager form of ``start_span``/``end_span``."""
+
+    __slots__ = ("_name", "_attributes", "_span")
+
+    def __init__(
+        self, name: str, attributes: Attributes | Callable[[], Attributes] | None
+    ) -> None:
+        self._name = name
+        self._attributes = attributes
+        self._span: Span | None = None
+
+    def __enter__(self) -> Span | None:
+        self._span = start_span(self._name, self._attributes)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_span(self._span, error=exc)
+        return False
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+def span(
+    name: str,
+    attributes: Attributes | Callable[[], Attributes] | None = None,
+) -> _SpanScope | _NoopScope:
+    """Trace a block of code as a span.
+
+    Example:
+        with tracing.span("tool.run", {"tool.name": name}) as span:
+            if span is not None:
+                span.set_attribute("tool.cache_hit", True)
+
+    Args:
+        name: The span name.
+        attributes: Initial attributes, or a function that builds them.
+
+    Returns:
+        A context manager yielding the span, or None when tracing is disabled.
+    """
+    if _tracer is None:
+        return _NOOP_SCOPE
+    return _SpanScope(name, attributes)
+
+
+def trace_stream(
+    span: Span | None,
+    stream: Iterator[ResponseStreamEvent],
+    on_complete: Callable[[Any], Attributes],
+) -> Iterator[ResponseStreamEvent]:
+    """Keep `span` open until `stream` is exhausted.
+
+    Args:
+        span: The span of the request, or None when tracing is disabled.
+        stream: The response event stream.
+        on_complete: Builds the final attributes from the completed response.
+
+    Returns:
+        Iterator[ResponseStreamEvent]: `stream` itself when tracing is disabled.
+    """
+    if span is None:
+        return stream
+    return _traced_stream(span, stream, on_complete)
+
+
+def _traced_stream(
+    span: Span,
+    stream: Iterator[ResponseStreamEvent],
+    on_complete: Callable[[Any], Attributes],
+) -> Iterator[ResponseStreamEvent]:
+    try:
+        for event in stream:
+            if event.type == "response.completed":
+                span.set_attributes(on_complete(event.response))
+            yield event
+    except BaseException as e:
+        end_span(span, error=e)
+        raise
+    end_span(span)
+
+
+def atrace_stream(
+    span: Span | None,
+    stream: AsyncIterator[ResponseStreamEvent],
+    on_complete: Callable[[Any], Attributes],
+) -> AsyncIterator[ResponseStreamEvent]:
+    """Asynchronous counterpart of ``trace_stream``."""
+    if span is None:
+        return stream
+    return _atraced_stream(span, stream, on_complete)
+
+
+async def _atraced_stream(
+    span: Span,
+    stream: AsyncIterator[ResponseStreamEvent],
+    on_complete: Callable[[Any], Attributes],
+) -> AsyncIterator[ResponseStreamEvent]:
+    try:
+        async for event in stream:
+            if event.type == "response.completed":
+                span.set_attributes(on_complete(event.response))
+            yield event
+    except BaseException as e:
+        end_span(span, error=e)
+        raise
+    end_span(span)
+
+
+def trace_generator(span: Span | None, generator: Iterator[T]) -> Iterator[T]:
+    """Make `span` current only while `generator` runs, and end it with the generator.
+
+    A span kept current across ``yield`` would leak into the consumer's
+    context: spans the consumer starts between items would get the wrong
+    parent. Start `span` with ``activate=False`` and wrap the generator
+    instead.
+
+    Args:
+        span: The span of the generator, or None when tracing is disabled.
+        generator: The generator to run under `span`.
+
+    Returns:
+        Iterator[T]: `generator` itself when tracing is disabled.
+    """
+    if span is None:
+        return generator
+    return _traced_generator(span, generator)
+
+
+def _traced_generator(span: Span, generator: Iterator[T]) -> Iterator[T]:
+    try:
+        while True:
+            previous = _current_span.get()
+            _current_span.set(span)
+            try:
+                item = next(generator)
+            except StopIteration:
+                break
+            finally:
+                _current_span.set(previous)
+            yield item
+    except BaseException as e:
+        # Also reached when the consumer closes us: close the generator under its span
+        previous = _current_span.get()
+        _current_span.set(span)
+        try:
+            generator.close()
+        finally:
+            _current_span.set(previous)
+        end_span(span, error=e)
+        raise
+    end_span(span)
+
+
+def atrace_generator(
+    span: Span | None, generator: AsyncIterator[T]
+) -> AsyncIterator[T]:
+    """Asynchronous counterpart of ``trace_generator``."""
+    if span is None:
+        return generator
+    return _atraced_generator(span, generator)
+
+
+async def _atraced_generator(span: Span, generator: AsyncIterator[T]) -> AsyncIterator[T]:
+    try:
+        while True:
+            previous = _current_span.get()
+            _current_span.set(span)
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _current_span.set(previous)
+            yield item
+    except BaseException as e:
+        previous = _current_span.get()
+        _current_span.set(span)
+        try:
+            await generator.aclose()
+        finally:
+            _current_span.set(previous)
+        end_span(span, error=e)
+        raise
+    end_span(span)
+
+
+def _current_task_name() -> str | None:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return task.get_name() if task is not None else None
+
+
+class ChromeTraceExporter(Tracer):
+    """Collects spans as Chrome trace events.
+
+    Open the exported file in ``chrome://tracing`` or https://ui.perfetto.dev
+    to see where model calls and tool calls overlap or serialize. Each thread
+    and each asyncio task gets its own lane.
+
+    Example:
+        exporter = ChromeTraceExporter()
+        set_tracer(exporter)
+        agent.invoke(user_input="...")
+        exporter.export("trace.json")
+    """
+
+    def __init__(self) -> None:
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def clear(self) -> None:
+        """Drop the collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def events(self) -> list[dict[str, Any]]:
+        """Return the collected spans in the Chrome trace-event format.
+
+        Returns:
+            list[dict[str, Any]]: Complete (``X``) events plus lane names.
+        """
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: s.start_ns)
+
+        lanes: dict[tuple[int, str | None], int] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            lane = (span.thread_id, span.task_name)
+            tid = lanes.get(lane)
+            if tid is None:
+                tid = lanes[lane] = len(lanes) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": span.task_name or f"thread-{span.thread_id}"},
+                    }
+                )
+            args = {key: _json_value(value) for key, value in span.attributes.items()}
+            if span.error is not None:
+                args["error"] = f"{type(span.error).__name__}: {span.error}"
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": 1,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        return events
+
+    def export(self, path: str) -> None:
+        """Write the collected spans to a Chrome trace JSON file.
+
+        Args:
+            path: The output file path.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Forwards spans to OpenTelemetry.
+
+    Requires the ``opentelemetry-api`` package (``pip install literun[otel]``)
+    and a configured OpenTelemetry SDK to export anything.
+
+    Example:
+        set_tracer(OpenTelemetryTracer())
+    """
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        """Create the adapter.
+
+        Args:
+            tracer: An OpenTelemetry tracer. Defaults to
+                ``trace.get_tracer("literun")``.
+
+        Raises:
+            ImportError: If ``opentelemetry-api`` is not installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryTracer requires the 'opentelemetry-api' package. "
+                "Install it with `pip install literun[otel]`."
+            ) from e
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("literun")
+
+    def on_start(self, span: Span) -> None:
+        parent = span.parent.data if span.parent is not None else None
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        span.data = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes=_otel_attributes(span.attributes),
+            start_time=span.start_ns,
+        )
+
+    def on_end(self, span: Span) -> None:
+        native = span.data
+        if native is None:
+            return
+        native.set_attributes(_otel_attributes(span.attributes))
+        if span.error is not None:
+            native.record_exception(span.error)
+            native.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(span.error))
+            )
+        native.end(end_time=span.end_ns)
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _otel_attributes(attributes: Attributes) -> Attributes:
+    """Drop None values and stringify types OpenTelemetry does not accept."""
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
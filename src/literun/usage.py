@@ -0,0 +1,118 @@
+"""Token usage and latency accounting for agent runs."""
+
+from __future__ import annotations
+
+from typing import Any
+from pydantic import BaseModel, Field
+
+from .utils import extract_usage_dict
+
+
+class RunUsage(BaseModel):
+    """Token usage aggregated over all model calls of an agent run."""
+
+    requests: int = 0
+    """Number of model calls made."""
+
+    input_tokens: int = 0
+    """Number of input tokens billed."""
+
+    cached_tokens: int = 0
+    """Number of input tokens served from the prompt cache."""
+
+    output_tokens: int = 0
+    """Number of output tokens generated."""
+
+    reasoning_tokens: int = 0
+    """Number of output tokens spent on reasoning."""
+
+    total_tokens: int = 0
+    """Total number of tokens used."""
+
+    context_tokens_saved: int = 0
+    """Estimated input tokens left out of requests by the agent's context policy."""
+
+    compactions: int = 0
+    """Number of times the history was summarized by the agent's compactor."""
+
+    compaction_failures: int = 0
+    """Number of failed summaries. The run continues with the full history."""
+
+    def add(self, response: Any) -> None:
+        """Add the usage reported by a model response.
+
+        Args:
+            response: The response object, with an optional `usage` attribute.
+        """
+        self.requests += 1
+        if getattr(response, "usage", None) is None:
+            return
+
+        usage = extract_usage_dict(response)
+        self.input_tokens += usage["input_tokens"]
+        self.cached_tokens += usage["input_tokens_details"]["cached_tokens"] or 0
+        self.output_tokens += usage["output_tokens"]
+        self.reasoning_tokens += usage["output_tokens_details"]["reasoning_tokens"] or 0
+        self.total_tokens += usage["total_tokens"]
+
+
+class LLMCallTiming(BaseModel):
+    """Latency of a single model call."""
+
+    iteration: int
+    """The agent loop iteration of the call, starting at 0."""
+
+    latency: float
+    """Seconds until the response was received, or the stream completed."""
+
+    time_to_first_token: float | None = None
+    """Seconds until the first streamed delta. `None` for non-streaming calls."""
+
+
+class ToolCallTiming(BaseModel):
+    """Wall time of a single tool call."""
+
+    call_id: str
+    """The ID of the tool call."""
+
+    name: str
+    """The name of the tool."""
+
+    duration: float
+    """Seconds spent executing the tool, excluding `queue_wait`."""
+
+    queue_wait: float = 0.0
+    """Seconds spent waiting for a worker of the tool's ``ToolExecutor``."""
+
+
+class RunTimings(BaseModel):
+    """Latency breakdown of an agent run. All durations are wall time in seconds."""
+
+    total: float = 0.0
+    """Duration of the whole run."""
+
+    llm_calls: list[LLMCallTiming] = Field(default_factory=list)
+    """One entry per model call, in call order."""
+
+    tool_calls: list[ToolCallTiming] = Field(default_factory=list)
+    """One entry per tool call, in completion order."""
+
+    @property
+    def time_to_first_token(self) -> float | None:
+        """Time to first token of the first model call, if streamed."""
+        return self.llm_calls[0].time_to_first_token if self.llm_calls else None
+
+    @property
+    def llm_time(self) -> float:
+        """Total latency of all model calls."""
+        return sum(call.latency for call in self.llm_calls)
+
+    @property
+    def tool_time(self) -> float:
+        """Total wall time of all tool calls, counting concurrent calls separately."""
+        return sum(call.duration for call in self.tool_calls)
+
+    @property
+    def tool_queue_time(self) -> float:
+        """Total time tool calls spent waiting for an executor worker."""
+        return sum(call.queue_wait for call in self.tool_calls)
@@ -0,0 +1,141 @@
+import sys
+import os
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydantic import ValidationError
+from openai.types.responses import Response
+
+from literun import Agent, ChatOpenAI, Tool, ArgsSchema, ModelBackend, ScriptedBackend
+
+
+def make_tool():
+    return Tool(
+        name="get_weather",
+        description="Get the weather",
+        func=lambda city: f"Sunny in {city}",
+        args_schema=[ArgsSchema(name="city", type=str)],
+    )
+
+
+def make_backend(**kwargs):
+    return ScriptedBackend(
+        [
+            [ScriptedBackend.tool_call("get_weather", {"city": "Paris"})],
+            "It is sunny in Paris.",
+        ],
+        **kwargs,
+    )
+
+
+class TestScriptedBackend(unittest.TestCase):
+    """
+    Unit tests for the in-process scripted backend.
+    """
+
+    def test_is_a_model_backend(self):
+        """Verify ChatOpenAI and ScriptedBackend implement the protocol."""
+        self.assertIsInstance(ChatOpenAI(api_key="fake"), ModelBackend)
+        self.assertIsInstance(make_backend(), ModelBackend)
+        with self.assertRaises(ValidationError):
+            Agent(llm=object())
+
+    def test_invoke_round_trip(self):
+        """Verify a tool round trip runs against the script."""
+        backend = make_backend()
+        agent = Agent(llm=backend, tools=[make_tool()])
+
+        result = agent.invoke(user_input="Weather in Paris?")
+
+        self.assertEqual(result.final_output, "It is sunny in Paris.")
+        self.assertEqual(result.usage.requests, 2)
+        self.assertGreater(result.usage.total_tokens, 0)
+        self.assertEqual(len(backend.requests), 2)
+        self.assertEqual(backend.requests[0]["tools"], ["get_weather"])
+        outputs = [
+            item
+            for item in backend.requests[1]["input"]
+            if item.get("type") == "function_call_output"
+        ]
+        self.assertEqual(outputs[0]["output"], "Sunny in Paris")
+
+    def test_stream_yields_real_events(self):
+        """Verify streamed runs get typed events derived from the responses."""
+        agent = Agent(llm=make_backend(chars_per_delta=5), tools=[make_tool()])
+
+        events = [result.event for result in agent.stream(user_input="Weather?")]
+        types = [event.type for event in events]
+
+        self.assertEqual(types[0], "response.created")
+        self.assertIn("response.function_call_arguments.delta", types)
+        deltas = [e.delta for e in events if e.type == "response.output_text.delta"]
+        self.assertEqual("".join(deltas), "It is sunny in Paris.")
+        self.assertEqual(deltas[0], "It is")
+        self.assertEqual(types[-1], "run.completed")
+
+    def test_exhausted_script_raises(self):
+        """Verify calls past the end of the script fail unless looping."""
+        agent = Agent(llm=ScriptedBackend(["one"]))
+        agent.invoke(user_input="Hi")
+        with self.assertRaises(RuntimeError):
+            agent.invoke(user_input="Hi")
+
+        looping = Agent(llm=ScriptedBackend(["one"], loop=True))
+        for _ in range(3):
+            self.assertEqual(looping.invoke(user_input="Hi").final_output, "one")
+
+    def test_exceptions_callables_and_responses(self):
+        """Verify exception, callable and Response script entries."""
+        canned = Response.model_validate(
+            {
+                "id": "resp_canned",
+                "created_at": 0,
+                "model": "gpt-4o",
+                "object": "response",
+                "output": [],
+                "parallel_tool_calls": True,
+                "tool_choice": "auto",
+                "tools": [],
+            }
+        )
+        backend = ScriptedBackend(
+            [
+                ValueError("backend down"),
+                lambda request: f"echo {request['input'][-1]['content'][0]['text']}",
+                canned,
+            ]
+        )
+        agent = Agent(llm=backend)
+
+        with self.assertRaises(ValueError):
+            agent.invoke(user_input="first")
+        self.assertEqual(agent.invoke(user_input="second").final_output, "echo second")
+        self.assertIs(backend.chat(messages=[]), canned)
+
+    def test_batch_offline_requires_batch_support(self):
+        """Verify batch_offline rejects backends without the Batch API."""
+        with self.assertRaises(TypeError):
+            Agent(llm=make_backend()).batch_offline(["Hi"])
+
+
+class TestAsyncScriptedBackend(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for async runs against the scripted backend.
+    """
+
+    async def test_ainvoke_and_astream(self):
+        """Verify async runs, streamed or not, follow the script."""
+        agent = Agent(llm=make_backend(loop=True), tools=[make_tool()])
+
+        result = await agent.ainvoke(user_input="Weather?")
+        self.assertEqual(result.final_output, "It is sunny in Paris.")
+
+        events = [chunk async for chunk in agent.astream(user_input="Weather?", fast=True)]
+        self.assertEqual(events[-1].event.type, "run.completed")
+        self.assertEqual(events[-2].final_output, "It is sunny in Paris.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import sys
+import os
+import time
+import asyncio
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.responses import Response
+
+from literun import Agent, ChatOpenAI, PromptTemplate
+
+
+def echo_response(text):
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "output": [
+                {
+                    "type": "message",
+                    "id": "msg_1",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                }
+            ],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+    )
+
+
+class EchoLLM(ChatOpenAI):
+    """Echoes the last user message, sleeping for `delay:<seconds>` inputs."""
+
+    @staticmethod
+    def _last_user_text(messages):
+        if isinstance(messages, PromptTemplate):
+            messages = messages.convert_to_openai_input()
+        return [m for m in messages if m.get("role") == "user"][-1]["content"][0]["text"]
+
+    def chat(self, *, messages, stream=False, **kwargs):
+        text = self._last_user_text(messages)
+        if text == "fail":
+            raise RuntimeError("model failure")
+        if text.startswith("delay:"):
+            time.sleep(float(text.split(":")[1]))
+        return echo_response(text)
+
+    async def achat(self, *, messages, stream=False, **kwargs):
+        text = self._last_user_text(messages)
+        if text == "fail":
+            raise RuntimeError("model failure")
+        if text.startswith("delay:"):
+            await asyncio.sleep(float(text.split(":")[1]))
+        return echo_response(text)
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Unit tests for Agent.batch.
+    """
+
+    def setUp(self):
+        self.agent = Agent(llm=EchoLLM(api_key="fake"))
+
+    def test_ordered_results_and_error_capture(self):
+        """Verify results keep input order and failures are captured per item."""
+        items = self.agent.batch(["a", "fail", {"user_input": "c"}], max_concurrency=2)
+
+        self.assertEqual([item.index for item in items], [0, 1, 2])
+        self.assertEqual(items[0].result.final_output, "a")
+        self.assertFalse(items[1].ok)
+        self.assertIsInstance(items[1].error, RuntimeError)
+        self.assertEqual(items[2].result.final_output, "c")
+
+    def test_as_completed_order(self):
+        """Verify unordered batches return items as they complete."""
+        items = self.agent.batch(["delay:0.2", "fast"], max_concurrency=2, ordered=False)
+        self.assertEqual([item.input for item in items], ["fast", "delay:0.2"])
+
+    def test_invalid_input_is_captured(self):
+        """Verify malformed inputs fail their own item only."""
+        items = self.agent.batch([{"user_input": "a", "bogus": 1}, "b"])
+        self.assertIsInstance(items[0].error, ValueError)
+        self.assertTrue(items[1].ok)
+
+
+class TestAsyncBatch(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for Agent.abatch and Agent.abatch_iter.
+    """
+
+    def setUp(self):
+        self.agent = Agent(llm=EchoLLM(api_key="fake"))
+
+    async def test_abatch_bounded_concurrency(self):
+        """Verify the concurrency limit bounds the runs in flight."""
+        start = time.perf_counter()
+        items = await self.agent.abatch(["delay:0.1"] * 4, max_concurrency=2)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(items), 4)
+        self.assertTrue(all(item.ok for item in items))
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.35)
+
+    async def test_abatch_iter_consumes_lazily(self):
+        """Verify the iterator variant pulls inputs only as slots free up."""
+        pulled = []
+
+        def inputs():
+            for index in range(100):
+                pulled.append(index)
+                yield f"item-{index}"
+
+        seen = []
+        async for item in self.agent.abatch_iter(inputs(), max_concurrency=3):
+            seen.append(item.input)
+            if len(seen) == 5:
+                break
+
+        self.assertEqual(len(seen), 5)
+        self.assertLessEqual(len(pulled), 8)
+
+    async def test_abatch_iter_ordered(self):
+        """Verify ordered iteration yields items in input order."""
+        inputs = ["delay:0.1", "fail", "c"]
+        items = [
+            item
+            async for item in self.agent.abatch_iter(inputs, max_concurrency=3, ordered=True)
+        ]
+        self.assertEqual([item.input for item in items], inputs)
+        self.assertFalse(items[1].ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
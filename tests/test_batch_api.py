@@ -0,0 +1,159 @@
+import sys
+import os
+import json
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.responses import Response
+
+from literun import (
+    Agent,
+    Tool,
+    ArgsSchema,
+    ChatOpenAI,
+    LocalBatchClient,
+    BatchRequestError,
+)
+from literun.batch_api import BatchSubmitter
+
+
+def make_response(output):
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+    )
+
+
+def handler(params):
+    """Calls `shout` for the user input, then answers with the tool output."""
+    last = params["input"][-1]
+    if last.get("type") == "function_call_output":
+        text = last["output"]
+        return make_response(
+            [
+                {
+                    "type": "message",
+                    "id": "msg_1",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                }
+            ]
+        )
+
+    text = last["content"][0]["text"]
+    if text == "fail":
+        raise RuntimeError("model failure")
+    return make_response(
+        [
+            {
+                "type": "function_call",
+                "id": "fc_1",
+                "call_id": "call_1",
+                "name": "shout",
+                "arguments": json.dumps({"text": text}),
+                "status": "completed",
+            }
+        ]
+    )
+
+
+class CountingBatchClient(LocalBatchClient):
+    """Counts the batches submitted to the local endpoint."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = []
+        create = self.batches.create
+
+        def counting_create(**kwargs):
+            self.submitted.append(kwargs["input_file_id"])
+            return create(**kwargs)
+
+        self.batches.create = counting_create
+
+
+class TestBatchSubmitter(unittest.TestCase):
+    """
+    Unit tests for the Batch API submitter against the local endpoint.
+    """
+
+    def test_results_map_back_to_requests(self):
+        """Verify each result is mapped back to its request by custom_id."""
+        client = LocalBatchClient(handler, polls_until_complete=2)
+        submitter = BatchSubmitter(client, poll_interval=0)
+        requests = [
+            {"model": "m", "input": [{"role": "user", "content": [{"type": "input_text", "text": "a"}]}]},
+            {"model": "m", "input": [{"role": "user", "content": [{"type": "input_text", "text": "fail"}]}]},
+        ]
+
+        results = submitter.submit(requests)
+
+        self.assertIsInstance(results[0], Response)
+        self.assertEqual(results[0].output[0].name, "shout")
+        self.assertIsInstance(results[1], BatchRequestError)
+        self.assertIn("model failure", str(results[1]))
+
+    def test_jsonl_format(self):
+        """Verify the input file follows the Batch API line format."""
+        data = BatchSubmitter.build_jsonl([{"model": "m", "stream": True}])
+        line = json.loads(data.decode("utf-8").splitlines()[0])
+
+        self.assertEqual(line["custom_id"], "0")
+        self.assertEqual(line["method"], "POST")
+        self.assertEqual(line["url"], "/v1/responses")
+        self.assertFalse(line["body"]["stream"])
+
+    def test_timeout(self):
+        """Verify waiting for a batch can time out."""
+        client = LocalBatchClient(handler, polls_until_complete=1000)
+        submitter = BatchSubmitter(client, poll_interval=0.01, timeout=0.05)
+
+        with self.assertRaises(TimeoutError):
+            submitter.submit([{"model": "m", "input": []}])
+
+
+class TestOfflineBatchRunner(unittest.TestCase):
+    """
+    Unit tests for Agent.batch_offline.
+    """
+
+    def test_tool_loops_resubmit_in_bulk(self):
+        """Verify each loop iteration is one batch covering all unfinished runs."""
+        client = CountingBatchClient(handler)
+        tool = Tool(
+            name="shout",
+            description="Upper-case text",
+            func=lambda text: text.upper(),
+            args_schema=[ArgsSchema(name="text", type=str)],
+        )
+        agent = Agent(
+            llm=ChatOpenAI(api_key="fake", batch_client=client),
+            tools=[tool],
+        )
+
+        items = agent.batch_offline(["hello", "fail", "", "world"], poll_interval=0)
+
+        self.assertEqual(len(client.submitted), 2)
+        self.assertEqual(items[0].result.final_output, "HELLO")
+        self.assertIsInstance(items[1].error, BatchRequestError)
+        self.assertIsInstance(items[2].error, ValueError)
+        self.assertEqual(items[3].result.final_output, "WORLD")
+        self.assertEqual(
+            [item.type for item in items[0].result.new_items],
+            ["tool_call_item", "tool_call_output_item", "message_output_item"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
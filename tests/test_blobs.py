@@ -0,0 +1,204 @@
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydantic import ValidationError
+
+from literun import Agent, Tool, ArgsSchema, BlobStore, ToolOutputPolicy, ScriptedBackend
+
+
+def handle_of(output):
+    return output.split("handle '")[1].split("'")[0]
+
+
+class TestBlobStore(unittest.TestCase):
+    """
+    Unit tests for the content-addressed blob store.
+    """
+
+    def check_store(self, store):
+        handle = store.put("hello world")
+        self.assertEqual(store.put("hello world"), handle)
+        self.assertNotEqual(store.put("other"), handle)
+        self.assertIn(handle, store)
+        self.assertEqual(store.get(handle), "hello world")
+        self.assertEqual(store.read(handle, offset=6, length=3), "wor")
+        self.assertEqual(store.read(handle, offset=6), "world")
+        self.assertIsNone(store.get("0" * len(handle)))
+        store.clear()
+        self.assertNotIn(handle, store)
+
+    def test_memory_store(self):
+        """Verify the in-memory store round trip."""
+        self.check_store(BlobStore())
+
+    def test_directory_store(self):
+        """Verify the on-disk store round trip."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = BlobStore(directory)
+            self.check_store(store)
+            handle = store.put("persisted")
+            self.assertEqual(BlobStore(directory).get(handle), "persisted")
+
+    def test_directory_store_rejects_paths(self):
+        """Verify handles cannot escape the store directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(BlobStore(directory).get("../etc/passwd"))
+
+    def test_memory_store_evicts(self):
+        """Verify the in-memory store is bounded."""
+        store = BlobStore(max_entries=2)
+        first = store.put("a")
+        store.put("b")
+        store.put("c")
+        self.assertNotIn(first, store)
+
+
+class TestToolOutputPolicy(unittest.TestCase):
+    """
+    Unit tests for offloading large tool outputs.
+    """
+
+    def test_small_output_unchanged(self):
+        """Verify outputs within the limit are returned as-is."""
+        policy = ToolOutputPolicy(max_chars=100)
+        self.assertEqual(policy.apply("short"), "short")
+
+    def test_large_output_offloaded(self):
+        """Verify large outputs are replaced by a preview and a handle."""
+        policy = ToolOutputPolicy(max_chars=100, preview_chars=10)
+        output = "x" * 10 + "y" * 500
+        limited = policy.apply(output)
+
+        self.assertTrue(limited.startswith("x" * 10 + "\n"))
+        self.assertNotIn("y", limited.split("\n")[0])
+        self.assertLess(len(limited), 300)
+        self.assertEqual(policy.store.get(handle_of(limited)), output)
+
+    def test_retrieval_tool_pages(self):
+        """Verify the retrieval tool pages through the stored output."""
+        policy = ToolOutputPolicy(max_chars=100, preview_chars=10, page_chars=200)
+        output = "".join(str(i % 10) for i in range(450))
+        handle = handle_of(policy.apply(output))
+        tool = ToolOutputPolicy.retrieval_tool([policy])
+
+        pages = []
+        offset = 10
+        while True:
+            page = tool.run({"handle": handle, "offset": offset})
+            text, footer = page.rsplit("\n\n", 1)
+            pages.append(text)
+            if "End of output" in footer:
+                break
+            offset = int(footer.split("offset=")[1].split(" ")[0])
+        self.assertEqual(output[:10] + "".join(pages), output)
+        self.assertIn("Error", tool.run({"handle": "missing", "offset": 0}))
+
+    def test_invalid_sizes(self):
+        """Verify sizes are validated and the preview fits within the limit."""
+        with self.assertRaises(ValidationError):
+            ToolOutputPolicy(preview_chars=-1)
+        with self.assertRaises(ValidationError):
+            ToolOutputPolicy(page_chars=0)
+        limited = ToolOutputPolicy(max_chars=5, preview_chars=20).apply("abcdefgh")
+        self.assertTrue(limited.startswith("abcde\n"))
+
+
+class TestAgentToolOutputs(unittest.TestCase):
+    """
+    Tests for tool output offloading in agent runs.
+    """
+
+    def setUp(self):
+        self.output = "line\n" * 10_000
+        self.tool = Tool(
+            name="fetch_logs",
+            description="Fetch the logs",
+            func=lambda service: self.output,
+            args_schema=[ArgsSchema(name="service", type=str)],
+        )
+
+    def make_backend(self):
+        def read_first_page(request):
+            limited = request["input"][-1]["output"]
+            return [
+                ScriptedBackend.tool_call(
+                    "read_tool_output", {"handle": handle_of(limited), "offset": 2000}
+                )
+            ]
+
+        return ScriptedBackend(
+            [
+                [ScriptedBackend.tool_call("fetch_logs", {"service": "api"})],
+                read_first_page,
+                "done",
+            ]
+        )
+
+    def test_no_policy_keeps_outputs(self):
+        """Verify outputs are untouched and no tool is added without a policy."""
+        agent = Agent(llm=ScriptedBackend([]), tools=[self.tool])
+        self.assertEqual(list(agent._tools), ["fetch_logs"])
+
+    def test_agent_policy_offloads_and_registers_retrieval(self):
+        """Verify the prompt holds a preview and the model can read more."""
+        backend = self.make_backend()
+        agent = Agent(llm=backend, tools=[self.tool], tool_output_policy=ToolOutputPolicy())
+        self.assertIn("read_tool_output", agent._tools)
+
+        result = agent.invoke(user_input="Why did the api fail?")
+        self.assertEqual(result.final_output, "done")
+        self.assertEqual(backend.requests[0]["tools"], ["fetch_logs", "read_tool_output"])
+
+        outputs = [item["output"] for item in backend.requests[-1]["input"] if "output" in item]
+        self.assertLess(len(outputs[0]), 3000)
+        self.assertTrue(outputs[1].startswith(self.output[2000:10_000]))
+
+    def test_async_run_offloads(self):
+        """Verify async runs apply the policy too."""
+        backend = self.make_backend()
+        agent = Agent(llm=backend, tools=[self.tool], tool_output_policy=ToolOutputPolicy())
+        asyncio.run(agent.ainvoke(user_input="Why did the api fail?"))
+        outputs = [item["output"] for item in backend.requests[-1]["input"] if "output" in item]
+        self.assertLess(len(outputs[0]), 3000)
+
+    def test_tool_policy_overrides_agent(self):
+        """Verify a tool can opt out of the agent's policy."""
+        self.tool.output_policy = ToolOutputPolicy(enabled=False)
+        backend = ScriptedBackend(
+            [[ScriptedBackend.tool_call("fetch_logs", {"service": "api"})], "done"]
+        )
+        agent = Agent(llm=backend, tools=[self.tool], tool_output_policy=ToolOutputPolicy())
+        agent.invoke(user_input="logs")
+        self.assertEqual(backend.requests[-1]["input"][-1]["output"], self.output)
+
+    def test_store_failure_becomes_tool_error(self):
+        """Verify a failed blob write is reported to the model, not raised."""
+
+        class FullStore(BlobStore):
+            def put(self, content):
+                raise OSError("No space left on device")
+
+        policy = ToolOutputPolicy(store=FullStore())
+        for run in (
+            lambda agent: agent.invoke(user_input="logs"),
+            lambda agent: asyncio.run(agent.ainvoke(user_input="logs")),
+        ):
+            backend = ScriptedBackend(
+                [[ScriptedBackend.tool_call("fetch_logs", {"service": "api"})], "done"]
+            )
+            agent = Agent(llm=backend, tools=[self.tool], tool_output_policy=policy)
+            self.assertEqual(run(agent).final_output, "done")
+            self.assertEqual(
+                backend.requests[-1]["input"][-1]["output"],
+                "Error executing tool 'fetch_logs': No space left on device",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
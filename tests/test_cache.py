@@ -0,0 +1,236 @@
+import sys
+import os
+import time
+import tempfile
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseTextDeltaEvent,
+)
+
+from literun import Agent, ChatOpenAI, ResponseCache
+from literun.cache import LRUCache
+
+
+def make_response(text):
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "status": "completed",
+            "output": [
+                {
+                    "type": "message",
+                    "id": "msg_1",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                }
+            ],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+    )
+
+
+def make_events(text):
+    return [
+        ResponseTextDeltaEvent(
+            type="response.output_text.delta",
+            delta=text,
+            item_id="msg_1",
+            output_index=0,
+            content_index=0,
+            logprobs=[],
+            sequence_number=0,
+        ),
+        ResponseCompletedEvent(
+            type="response.completed",
+            response=make_response(text),
+            sequence_number=1,
+        ),
+    ]
+
+
+class FakeCreate:
+    """Counts calls to `responses.create` and returns canned results."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, **params):
+        self.calls += 1
+        if params.get("stream"):
+            return iter(make_events("streamed"))
+        return make_response("hello")
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Unit tests for the in-memory LRU tier.
+    """
+
+    def test_size_eviction(self):
+        """Verify the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_ttl_expiry(self):
+        """Verify entries expire after their TTL."""
+        cache = LRUCache(ttl=0.05)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Unit tests for ResponseCache and its integration with ChatOpenAI.
+    """
+
+    def make_llm(self, cache):
+        llm = ChatOpenAI(api_key="fake", cache=cache)
+        fake = FakeCreate()
+        llm.client.responses.create = fake
+        return llm, fake
+
+    def test_key_is_canonical(self):
+        """Verify the key ignores dict ordering but not values."""
+        a = ResponseCache.make_key({"model": "m", "input": [{"a": 1, "b": 2}]})
+        b = ResponseCache.make_key({"input": [{"b": 2, "a": 1}], "model": "m"})
+        c = ResponseCache.make_key({"model": "m", "input": [{"a": 1, "b": 3}]})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_identical_requests_hit_cache(self):
+        """Verify byte-identical requests are only sent once."""
+        llm, fake = self.make_llm(ResponseCache())
+        messages = [{"role": "user", "content": "Hi"}]
+
+        first = llm.invoke(messages)
+        second = llm.invoke(messages)
+        llm.invoke([{"role": "user", "content": "Other"}])
+
+        self.assertIs(first, second)
+        self.assertEqual(fake.calls, 2)
+
+    def test_incomplete_response_not_cached(self):
+        """Verify responses that did not complete are sent again."""
+        llm = ChatOpenAI(api_key="fake", cache=ResponseCache())
+        calls = []
+
+        def create(**params):
+            calls.append(params)
+            return make_response("cut off").model_copy(update={"status": "incomplete"})
+
+        llm.client.responses.create = create
+        messages = [{"role": "user", "content": "Hi"}]
+
+        llm.invoke(messages)
+        llm.invoke(messages)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_cached_stream_replays_through_runner(self):
+        """Verify a cached stream replays through Runner.run_stream like a live one."""
+        agent = Agent(llm=ChatOpenAI(api_key="fake", cache=ResponseCache()))
+        fake = FakeCreate()
+        agent.llm.client.responses.create = fake
+
+        live = [r.event for r in agent.stream(user_input="Hi")]
+        replayed = [r.event for r in agent.stream(user_input="Hi")]
+
+        self.assertEqual(fake.calls, 1)
+        self.assertEqual([e.type for e in replayed], [e.type for e in live])
+        self.assertEqual(replayed[0].delta, "streamed")
+
+    def test_incomplete_stream_is_not_cached(self):
+        """Verify a stream is only cached once it has completed."""
+        llm, fake = self.make_llm(ResponseCache())
+        messages = [{"role": "user", "content": "Hi"}]
+
+        stream = llm.stream(messages)
+        next(stream)
+        stream.close()
+        list(llm.stream(messages))
+
+        self.assertEqual(fake.calls, 2)
+
+    def test_disk_tier_survives_new_instance(self):
+        """Verify responses and streams are restored from the sqlite tier."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "responses.db")
+            messages = [{"role": "user", "content": "Hi"}]
+
+            cache = ResponseCache(path=path)
+            llm, _ = self.make_llm(cache)
+            llm.invoke(messages)
+            list(llm.stream(messages))
+            cache.close()
+
+            cache = ResponseCache(path=path)
+            llm, fake = self.make_llm(cache)
+            response = llm.invoke(messages)
+            events = list(llm.stream(messages))
+
+            self.assertEqual(fake.calls, 0)
+            self.assertEqual(response.output_text, "hello")
+            self.assertIsInstance(events[-1], ResponseCompletedEvent)
+            self.assertEqual(events[0].delta, "streamed")
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (2, 2, 0))
+
+            # Restored entries are then served from memory
+            llm.invoke(messages)
+            llm.invoke([{"role": "user", "content": "Other"}])
+            self.assertEqual((cache.hits, cache.memory_hits, cache.misses), (3, 1, 1))
+            cache.close()
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the asynchronous cache path.
+    """
+
+    async def test_async_stream_replay(self):
+        """Verify achat caches and replays streams."""
+        llm = ChatOpenAI(api_key="fake", cache=ResponseCache())
+        calls = []
+
+        async def create(**params):
+            calls.append(params)
+
+            async def events():
+                for event in make_events("async"):
+                    yield event
+
+            return events()
+
+        llm.async_client.responses.create = create
+        messages = [{"role": "user", "content": "Hi"}]
+
+        live = [event async for event in llm.astream(messages)]
+        replayed = [event async for event in llm.astream(messages)]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([e.type for e in replayed], [e.type for e in live])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import os
+import time
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from literun import AdaptiveConcurrencyLimiter, ChatOpenAI
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """
+    Unit tests for the AIMD limit adjustments.
+    """
+
+    def test_invalid_bounds(self):
+        """Verify inconsistent bounds are rejected."""
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease_factor=1.5)
+
+    def test_overload_decreases_once_per_window(self):
+        """Verify a burst of overload signals halves the limit only once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(overloaded=True)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_rising_p95_decreases(self):
+        """Verify a p95 latency well above the baseline decreases the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_window=5)
+        for latency in [0.01] * 5 + [0.1] * 5:
+            limiter.acquire()
+            limiter.release(latency)
+
+        self.assertEqual(limiter.limit, 4)
+
+    def test_saturated_success_increases(self):
+        """Verify healthy requests grow the limit while it is the bottleneck."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+        def request():
+            limiter.call({}, lambda: time.sleep(0.01))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: request(), range(40)))
+
+        self.assertEqual(limiter.limit, 3)
+
+    def test_threads_respect_limit(self):
+        """Verify sync callers never exceed the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        lock = threading.Lock()
+        peak = [0, 0]
+
+        def create():
+            with lock:
+                peak[0] += 1
+                peak[1] = max(peak[1], peak[0])
+            time.sleep(0.02)
+            with lock:
+                peak[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: limiter.call({}, create), range(12)))
+
+        self.assertEqual(peak[1], 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_stream_holds_slot_until_exhausted(self):
+        """Verify a stream keeps its slot until it is consumed."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        stream = limiter.call({"stream": True}, lambda: iter([1, 2]))
+
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(list(stream), [1, 2])
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_shared_by_key(self):
+        """Verify the same key returns the same limiter."""
+        a = AdaptiveConcurrencyLimiter.shared("test-shared", max_limit=16)
+        b = AdaptiveConcurrencyLimiter.shared("test-shared", max_limit=16)
+        self.assertIs(a, b)
+
+    def test_shared_rejects_other_settings(self):
+        """Verify a key cannot be reused with different settings."""
+        AdaptiveConcurrencyLimiter.shared("test-shared-settings", max_limit=16)
+        with self.assertRaisesRegex(ValueError, "max_limit=16"):
+            AdaptiveConcurrencyLimiter.shared("test-shared-settings", max_limit=32)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter.shared("test-shared-settings")
+
+
+class TestAsyncConcurrencyLimiter(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for async callers of the concurrency limiter.
+    """
+
+    async def test_queue_depth_and_timeout_feedback(self):
+        """Verify excess requests queue, and timeouts shrink the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        llm = ChatOpenAI(api_key="fake", concurrency_limiter=limiter)
+
+        async def create(**params):
+            await asyncio.sleep(0.05)
+            raise TimeoutError("slow backend")
+
+        llm.async_client.responses.create = create
+        tasks = [
+            asyncio.create_task(llm.ainvoke([{"role": "user", "content": "Hi"}]))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        self.assertEqual((limiter.in_flight, limiter.queue_depth), (2, 3))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertTrue(all(isinstance(r, TimeoutError) for r in results))
+        self.assertEqual(limiter.limit, 1)
+        self.assertEqual((limiter.in_flight, limiter.queue_depth), (0, 0))
+
+    async def test_cancelled_waiter_frees_its_place(self):
+        """Verify cancelling a queued request does not leak a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        await limiter.aacquire()
+        waiter = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        limiter.release(0.01)
+
+        self.assertEqual((limiter.in_flight, limiter.queue_depth), (0, 0))
+        await asyncio.wait_for(limiter.aacquire(), timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,414 @@
+import sys
+import os
+import gc
+import asyncio
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydantic import ValidationError
+
+from literun import (
+    Agent,
+    Tool,
+    ArgsSchema,
+    ContextPolicy,
+    HistoryCompactor,
+    PromptTemplate,
+    ScriptedBackend,
+)
+from literun.constants import COMPACTION_SUMMARY_PREFIX
+
+
+def make_history(turns=5, size=400):
+    prompt = PromptTemplate().add_system("You are a helpful assistant.")
+    for turn in range(turns):
+        prompt.add_user(f"question {turn} " + "q" * size)
+        prompt.add_tool_call(name="search", arguments='{"q": "x"}', call_id=f"call_{turn}")
+        prompt.add_tool_output(call_id=f"call_{turn}", output="o" * size)
+        prompt.add_assistant(f"answer {turn} " + "a" * size)
+    prompt.add_user("latest question")
+    return prompt
+
+
+def texts(items):
+    return [
+        item["content"][0]["text"] if isinstance(item.get("content"), list) else item.get("content")
+        for item in items
+        if "role" in item
+    ]
+
+
+class TestContextPolicy(unittest.TestCase):
+    """
+    Unit tests for token-budgeted context trimming.
+    """
+
+    def test_within_budget_returns_prompt(self):
+        """Verify a prompt within the budget is sent unchanged."""
+        prompt = make_history(turns=1, size=10)
+        request_input, saved = ContextPolicy(max_input_tokens=10_000).apply(prompt)
+        self.assertIs(request_input, prompt)
+        self.assertEqual(saved, 0)
+
+    def test_evicts_oldest_and_keeps_pinned(self):
+        """Verify the oldest items go first and system/latest user are kept."""
+        prompt = make_history()
+        policy = ContextPolicy(max_input_tokens=300)
+        request_input, saved = policy.apply(prompt)
+
+        self.assertGreater(saved, 0)
+        self.assertLess(len(request_input), len(prompt))
+        kept = texts(request_input)
+        self.assertEqual(kept[0], "You are a helpful assistant.")
+        self.assertEqual(kept[-1], "latest question")
+        self.assertNotIn(texts(prompt.convert_to_openai_input())[1], kept)
+
+        total = sum(policy.estimate_tokens(message) for message in prompt.messages)
+        self.assertLessEqual(total - saved, 300)
+        # The prompt itself is not modified
+        self.assertEqual(len(prompt), 22)
+
+    def test_pinned_items_kept_over_budget(self):
+        """Verify pinned messages are sent even when they alone exceed the budget."""
+        prompt = make_history(turns=2)
+        request_input, _ = ContextPolicy(max_input_tokens=1).apply(prompt)
+        self.assertEqual(
+            texts(request_input), ["You are a helpful assistant.", "latest question"]
+        )
+
+    def test_current_turn_is_kept_over_budget(self):
+        """Verify the tool calls and outputs of the latest user turn are never evicted."""
+        prompt = make_history(turns=2)
+        prompt.add_tool_call(name="search", arguments='{"q": "y"}', call_id="call_now")
+        prompt.add_tool_output(call_id="call_now", output="n" * 2000)
+
+        request_input, saved = ContextPolicy(max_input_tokens=300).apply(prompt)
+
+        self.assertGreater(saved, 0)
+        self.assertEqual(
+            texts(request_input), ["You are a helpful assistant.", "latest question"]
+        )
+        self.assertEqual(
+            [item.get("call_id") for item in request_input[-2:]], ["call_now", "call_now"]
+        )
+
+    def test_never_splits_tool_pairs(self):
+        """Verify tool calls and outputs are evicted together."""
+        prompt = PromptTemplate().add_user("first")
+        prompt.add_tool_call(name="a", arguments="{}", call_id="call_a")
+        prompt.add_tool_call(name="b", arguments="{}", call_id="call_b")
+        prompt.add_tool_output(call_id="call_a", output="x" * 400)
+        prompt.add_assistant("between")
+        prompt.add_tool_output(call_id="call_b", output="y" * 400)
+        prompt.add_user("last")
+
+        for budget in range(1, 300, 7):
+            request_input, _ = ContextPolicy(max_input_tokens=budget).apply(prompt)
+            if request_input is prompt:
+                continue
+            calls = {item["call_id"] for item in request_input if item.get("type") == "function_call"}
+            outputs = {
+                item["call_id"] for item in request_input if item.get("type") == "function_call_output"
+            }
+            self.assertEqual(calls, outputs)
+
+    def test_invalid_budget(self):
+        """Verify a non-positive budget is rejected."""
+        with self.assertRaises(ValidationError):
+            ContextPolicy(max_input_tokens=0)
+
+
+class TestAgentContextPolicy(unittest.TestCase):
+    """
+    Tests for applying the context policy in agent runs.
+    """
+
+    def setUp(self):
+        self.tool = Tool(
+            name="search",
+            description="Search",
+            func=lambda q: "r" * 2000,
+            args_schema=[ArgsSchema(name="q", type=str)],
+        )
+
+    def make_agent(self, policy):
+        backend = ScriptedBackend(
+            [
+                [ScriptedBackend.tool_call("search", {"q": "a"})],
+                [ScriptedBackend.tool_call("search", {"q": "b"})],
+                "done",
+            ]
+        )
+        agent = Agent(
+            llm=backend,
+            system_prompt="Be brief.",
+            tools=[self.tool],
+            context_policy=policy,
+        )
+        return agent, backend
+
+    def earlier_turn(self):
+        return (
+            PromptTemplate()
+            .add_system("Be brief.")
+            .add_user("old question")
+            .add_assistant("a" * 2000)
+        )
+
+    def test_run_trims_requests_and_reports_savings(self):
+        """Verify earlier turns are trimmed and the savings are reported."""
+        agent, backend = self.make_agent(ContextPolicy(max_input_tokens=600))
+        result = agent.invoke(user_input="find it", prompt_template=self.earlier_turn())
+
+        self.assertEqual(result.final_output, "done")
+        self.assertGreater(result.usage.context_tokens_saved, 0)
+        last_input = backend.requests[-1]["input"]
+        # The current turn's tool calls and outputs are all kept
+        self.assertEqual(len(last_input), 6)
+        self.assertEqual(texts(last_input), ["Be brief.", "find it"])
+
+    def test_async_run_trims_requests(self):
+        """Verify async runs apply the policy too."""
+        agent, backend = self.make_agent(ContextPolicy(max_input_tokens=600))
+        result = asyncio.run(
+            agent.ainvoke(user_input="find it", prompt_template=self.earlier_turn())
+        )
+        self.assertGreater(result.usage.context_tokens_saved, 0)
+        self.assertEqual(len(backend.requests[-1]["input"]), 6)
+
+    def test_no_policy_sends_full_history(self):
+        """Verify the full history is sent without a policy."""
+        agent, backend = self.make_agent(None)
+        result = agent.invoke(user_input="find it")
+        self.assertEqual(result.usage.context_tokens_saved, 0)
+        self.assertEqual(len(backend.requests[-1]["input"]), 6)
+
+
+class TestHistoryCompactor(unittest.TestCase):
+    """
+    Unit tests for summarizing old history.
+    """
+
+    def make_compactor(self, **kwargs):
+        summarizer = ScriptedBackend(["the summary"], loop=True)
+        kwargs.setdefault("trigger_tokens", 1000)
+        kwargs.setdefault("keep_recent_tokens", 300)
+        return HistoryCompactor(llm=summarizer, **kwargs), summarizer
+
+    def test_below_threshold_is_unchanged(self):
+        """Verify a short history is not compacted."""
+        compactor, summarizer = self.make_compactor(trigger_tokens=100_000)
+        prompt = make_history()
+        self.assertFalse(compactor.compact(prompt))
+        self.assertEqual(len(prompt), 22)
+        self.assertEqual(summarizer.requests, [])
+
+    def test_compact_replaces_old_history(self):
+        """Verify old turns are replaced by one summary message."""
+        compactor, summarizer = self.make_compactor()
+        prompt = make_history()
+        old_messages = list(prompt.messages)
+
+        self.assertTrue(compactor.compact(prompt))
+        messages = prompt.messages
+        self.assertEqual(messages[0].text, "You are a helpful assistant.")
+        self.assertEqual(messages[1].role, "system")
+        self.assertEqual(messages[1].text, COMPACTION_SUMMARY_PREFIX + "the summary")
+        self.assertEqual(messages[-1].text, "latest question")
+        self.assertLess(len(prompt), len(old_messages))
+        self.assertFalse(compactor.needs_compaction(prompt))
+
+        # Older tool calls and outputs went to the summarizer
+        transcript = summarizer.requests[0]["input"][1]["content"][0]["text"]
+        self.assertIn("[tool call call_0] search", transcript)
+        self.assertIn("[tool output call_0]", transcript)
+        self.assertNotIn("latest question", transcript)
+
+        # The serialized form follows the new history
+        self.assertEqual(len(prompt.convert_to_openai_input()), len(prompt))
+
+    def test_keeps_tool_pairs_together(self):
+        """Verify the kept tail never starts with an orphan tool output."""
+        compactor, _ = self.make_compactor()
+        prompt = make_history()
+        compactor.compact(prompt)
+        calls = {m.call_id for m in prompt.messages if m.content_type == "tool_call"}
+        outputs = {m.call_id for m in prompt.messages if m.content_type == "tool_call_output"}
+        self.assertEqual(calls, outputs)
+
+    def test_latest_user_message_is_kept(self):
+        """Verify the latest user message survives when it is in the old span."""
+        compactor, _ = self.make_compactor(trigger_tokens=500, keep_recent_tokens=100)
+        prompt = PromptTemplate().add_system("sys").add_user("the task")
+        for turn in range(4):
+            prompt.add_tool_call(name="search", arguments="{}", call_id=f"call_{turn}")
+            prompt.add_tool_output(call_id=f"call_{turn}", output="o" * 800)
+
+        self.assertTrue(compactor.compact(prompt))
+        texts_ = [m.text for m in prompt.messages if m.content_type == "text"]
+        self.assertEqual(texts_[:2], ["sys", COMPACTION_SUMMARY_PREFIX + "the summary"])
+        self.assertEqual(texts_[2], "the task")
+        self.assertEqual(prompt.messages[-1].call_id, "call_3")
+
+    def test_background_summary_applies_to_grown_history(self):
+        """Verify a background compaction applies after the history grew."""
+        compactor, _ = self.make_compactor()
+        prompt = make_history()
+        future = compactor.submit(prompt)
+        prompt.add_assistant("a new answer")
+        compaction = future.result()
+        compactor.close()
+
+        self.assertTrue(compaction.apply(prompt))
+        self.assertEqual(prompt.messages[-1].text, "a new answer")
+        self.assertGreater(compaction.tokens_saved, 0)
+
+    def test_stale_compaction_is_not_applied(self):
+        """Verify a compaction is dropped when its span changed."""
+        compactor, _ = self.make_compactor()
+        prompt = make_history()
+        compaction = compactor.summarize(prompt)
+        compactor.compact(prompt)
+        self.assertFalse(compaction.apply(prompt))
+
+    def test_invalid_thresholds(self):
+        """Verify keep_recent_tokens must be below trigger_tokens."""
+        with self.assertRaises(ValidationError):
+            HistoryCompactor(llm=ScriptedBackend([]), trigger_tokens=100, keep_recent_tokens=100)
+
+
+class TestAgentCompaction(unittest.TestCase):
+    """
+    Tests for compacting history during agent runs.
+    """
+
+    def setUp(self):
+        self.tool = Tool(
+            name="search",
+            description="Search",
+            func=lambda q: "r" * 2000,
+            args_schema=[ArgsSchema(name="q", type=str)],
+        )
+
+    def make_agent(self, background, chain_responses=False, summary="the summary"):
+        backend = ScriptedBackend(
+            [[ScriptedBackend.tool_call("search", {"q": str(i)})] for i in range(4)] + ["done"]
+        )
+        compactor = HistoryCompactor(
+            llm=ScriptedBackend([summary], loop=True),
+            trigger_tokens=1200,
+            keep_recent_tokens=200,
+            background=background,
+        )
+        agent = Agent(
+            llm=backend,
+            system_prompt="Be brief.",
+            tools=[self.tool],
+            compaction=compactor,
+            chain_responses=chain_responses,
+        )
+        self.addCleanup(compactor.close)
+        return agent, backend
+
+    def assert_compacted(self, result, backend):
+        self.assertEqual(result.final_output, "done")
+        self.assertGreater(result.usage.compactions, 0)
+        sizes = [len(request["input"]) for request in backend.requests]
+        self.assertLess(max(sizes), 8)
+        last_input = backend.requests[-1]["input"]
+        self.assertTrue(
+            last_input[1]["content"][0]["text"].startswith(COMPACTION_SUMMARY_PREFIX)
+        )
+        # All tool calls are still reported
+        self.assertEqual(len([i for i in result.new_items if i.type == "tool_call_item"]), 4)
+
+    def test_run_compacts_in_background(self):
+        """Verify the sync loop compacts while tools execute."""
+        agent, backend = self.make_agent(background=True)
+        self.assert_compacted(agent.invoke(user_input="find it"), backend)
+
+    def test_run_compacts_inline(self):
+        """Verify the sync loop compacts before the model call."""
+        agent, backend = self.make_agent(background=False)
+        self.assert_compacted(agent.invoke(user_input="find it"), backend)
+
+    def test_async_run_compacts(self):
+        """Verify the async loop compacts in a background task."""
+        agent, backend = self.make_agent(background=True)
+        self.assert_compacted(asyncio.run(agent.ainvoke(user_input="find it")), backend)
+
+    def test_stream_compacts(self):
+        """Verify streaming runs compact and report it in the final usage."""
+        agent, backend = self.make_agent(background=True)
+        chunks = list(agent.stream(user_input="find it"))
+        usage = chunks[-1].event.usage
+        self.assertGreater(usage.compactions, 0)
+
+    def test_chained_run_replays_after_compaction(self):
+        """Verify compaction restarts a server-side chain."""
+        agent, backend = self.make_agent(background=True, chain_responses=True)
+        agent.invoke(user_input="find it")
+        replays = [r for r in backend.requests if r["previous_response_id"] is None]
+        self.assertGreater(len(replays), 1)
+
+    def test_failed_summary_keeps_full_history(self):
+        """Verify a failing summarizer does not fail the run."""
+
+        def rate_limited(request):
+            raise RuntimeError("429 Too Many Requests")
+
+        for background in (True, False):
+            agent, backend = self.make_agent(background=background, summary=rate_limited)
+            with self.assertLogs("literun.runner", level="WARNING"):
+                result = agent.invoke(user_input="find it")
+            self.assertEqual(result.final_output, "done")
+            self.assertEqual(result.usage.compactions, 0)
+            self.assertGreater(result.usage.compaction_failures, 0)
+            self.assertEqual(len(backend.requests[-1]["input"]), 10)
+
+        agent, backend = self.make_agent(background=True, summary=rate_limited)
+        with self.assertLogs("literun.runner", level="WARNING"):
+            result = asyncio.run(agent.ainvoke(user_input="find it"))
+        self.assertEqual(result.final_output, "done")
+        self.assertGreater(result.usage.compaction_failures, 0)
+
+    def test_pending_compaction_is_discarded(self):
+        """Verify a summary still pending when the run ends is not orphaned."""
+
+        def timeout(request):
+            raise TimeoutError("summary timed out")
+
+        def make_agent():
+            backend = ScriptedBackend(
+                [[ScriptedBackend.tool_call("search", {"q": str(i)})] for i in range(4)]
+            )
+            compactor = HistoryCompactor(
+                llm=ScriptedBackend([timeout], loop=True),
+                trigger_tokens=100,
+                keep_recent_tokens=20,
+            )
+            self.addCleanup(compactor.close)
+            return Agent(llm=backend, tools=[self.tool], compaction=compactor, max_iterations=4)
+
+        async def main():
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: errors.append(context)
+            )
+            with self.assertLogs("literun.runner", level="WARNING"):
+                with self.assertRaisesRegex(RuntimeError, "max iterations"):
+                    await make_agent().ainvoke(user_input="find it")
+            gc.collect()
+            await asyncio.sleep(0)
+            return errors
+
+        self.assertEqual(asyncio.run(main()), [])
+
+        with self.assertLogs("literun.runner", level="WARNING"):
+            with self.assertRaisesRegex(RuntimeError, "max iterations"):
+                make_agent().invoke(user_input="find it")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+import sys
+import os
+import time
+import asyncio
+import threading
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydantic import ValidationError
+
+from literun import (
+    Agent,
+    Tool,
+    ArgsSchema,
+    ToolRuntime,
+    ScriptedBackend,
+    ToolExecutor,
+    ToolExecutorFullError,
+    register_tool_executor,
+    shutdown_tool_executors,
+    configure_process_pool,
+    shutdown_process_pool,
+)
+from literun.constants import DEFAULT_PROCESS_RESULT_SHM_THRESHOLD
+
+
+def worker_pid(n: int) -> str:
+    return f"{os.getpid()}:{sum(i * i for i in range(n))}"
+
+
+def greet(name: str, runtime: ToolRuntime) -> str:
+    return f"Hello {name} from {runtime.user_id}"
+
+
+def big_text(n: int) -> str:
+    return "x" * n
+
+
+def big_bytes(n: int) -> bytes:
+    return b"y" * n
+
+
+def thread_name(x: int) -> str:
+    return threading.current_thread().name
+
+
+def worker_name(x: int) -> str:
+    return threading.current_thread().name
+
+
+def make_tool(func, *args, **kwargs):
+    return Tool(func=func, args_schema=list(args), **kwargs)
+
+
+class TestProcessExecution(unittest.TestCase):
+    """
+    Tests for tools running in the shared process pool.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        configure_process_pool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_process_pool()
+
+    def test_runs_in_another_process(self):
+        """Verify process tools run in a worker with validated arguments."""
+        tool = make_tool(worker_pid, ArgsSchema(name="n", type=int), execution_mode="process")
+        pid, total = tool.run({"n": "10"}).split(":")
+        self.assertNotEqual(int(pid), os.getpid())
+        self.assertEqual(int(total), 285)
+
+    def test_async_runs_in_another_process(self):
+        """Verify arun awaits the process pool."""
+        tool = make_tool(worker_pid, ArgsSchema(name="n", type=int), execution_mode="process")
+
+        async def main():
+            return await asyncio.gather(*(tool.arun({"n": 3}) for _ in range(4)))
+
+        results = asyncio.run(main())
+        self.assertTrue(all(int(r.split(":")[0]) != os.getpid() for r in results))
+
+    def test_runtime_values_are_sent(self):
+        """Verify resolved ToolRuntime values reach the worker."""
+        tool = make_tool(greet, ArgsSchema(name="name", type=str), execution_mode="process")
+        self.assertEqual(
+            tool.run({"name": "Ada"}, {"user_id": "u1"}), "Hello Ada from u1"
+        )
+
+    def test_large_results(self):
+        """Verify large str and bytes results come back intact."""
+        n = DEFAULT_PROCESS_RESULT_SHM_THRESHOLD + 10
+        text = make_tool(big_text, ArgsSchema(name="n", type=int), execution_mode="process")
+        data = make_tool(big_bytes, ArgsSchema(name="n", type=int), execution_mode="process")
+        self.assertEqual(text.run({"n": n}), "x" * n)
+        self.assertEqual(data.run({"n": n}), b"y" * n)
+
+    def test_agent_run(self):
+        """Verify agents run process tools and record their outputs."""
+        tool = make_tool(worker_pid, ArgsSchema(name="n", type=int), execution_mode="process")
+        backend = ScriptedBackend(
+            [[ScriptedBackend.tool_call("worker_pid", {"n": 2})], "done"]
+        )
+        result = Agent(llm=backend, tools=[tool]).invoke(user_input="go")
+        self.assertEqual(result.final_output, "done")
+        output = backend.requests[-1]["input"][-1]["output"]
+        self.assertTrue(output.endswith(":1"))
+
+    def test_requires_picklable_func(self):
+        """Verify lambdas and async-only tools are rejected."""
+        with self.assertRaises(ValidationError):
+            Tool(name="f", func=lambda: "x", execution_mode="process")
+
+        async def coro():
+            return "x"
+
+        with self.assertRaises(ValidationError):
+            Tool(name="f", coroutine=coro, execution_mode="process")
+
+
+class TestExecutionModes(unittest.TestCase):
+    """
+    Tests for the inline and thread execution modes.
+    """
+
+    def test_inline_runs_on_event_loop_thread(self):
+        """Verify inline tools run on the calling thread in arun."""
+        tool = make_tool(thread_name, ArgsSchema(name="x", type=int), execution_mode="inline")
+
+        async def main():
+            return await tool.arun({"x": 1}), threading.current_thread().name
+
+        output, loop_thread = asyncio.run(main())
+        self.assertEqual(output, loop_thread)
+
+    def test_thread_is_default(self):
+        """Verify sync functions still run on a worker thread in arun by default."""
+        tool = make_tool(thread_name, ArgsSchema(name="x", type=int))
+        self.assertEqual(tool.execution_mode, "thread")
+
+        async def main():
+            return await tool.arun({"x": 1}), threading.current_thread().name
+
+        output, loop_thread = asyncio.run(main())
+        self.assertNotEqual(output, loop_thread)
+
+
+class TestToolExecutors(unittest.TestCase):
+    """
+    Tests for named, bounded executors for sync tools.
+    """
+
+    def tearDown(self):
+        shutdown_tool_executors()
+
+    def test_runs_on_named_executor(self):
+        """Verify the tool runs on its executor, not the loop's default one."""
+        executor = ToolExecutor("slow", max_workers=1)
+        tool = make_tool(thread_name, ArgsSchema(name="x", type=int), executor=executor)
+        output = asyncio.run(tool.arun({"x": 1}))
+        self.assertTrue(output.startswith("literun-slow"))
+        executor.shutdown()
+
+    def test_max_workers_bound(self):
+        """Verify at most max_workers calls run at once."""
+        executor = ToolExecutor("bounded", max_workers=2)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(x: int) -> str:
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return str(x)
+
+        tool = make_tool(work, ArgsSchema(name="x", type=int), executor=executor)
+
+        async def main():
+            return await asyncio.gather(*(tool.arun({"x": i}) for i in range(6)))
+
+        self.assertEqual(asyncio.run(main()), [str(i) for i in range(6)])
+        self.assertEqual(state["peak"], 2)
+        executor.shutdown()
+
+    def test_full_queue_rejects(self):
+        """Verify calls beyond the queue bound are rejected, and slots are freed."""
+        executor = ToolExecutor("tiny", max_workers=1, max_queue=0)
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        try:
+            with self.assertRaises(ToolExecutorFullError):
+                executor.submit(str, object=1)
+        finally:
+            release.set()
+        self.assertTrue(running.result()[0])
+        self.assertEqual(executor.submit(str, object=1).result()[0], "1")
+        executor.shutdown()
+
+    def test_queue_wait_reported(self):
+        """Verify queue wait is recorded apart from execution time, in async and sync runs."""
+
+        def nap(x: int) -> str:
+            time.sleep(0.05)
+            return threading.current_thread().name
+
+        tool = make_tool(nap, ArgsSchema(name="x", type=int), executor="serial")
+
+        def invoke_async(agent):
+            return asyncio.run(agent.ainvoke(user_input="go"))
+
+        def invoke_sync(agent):
+            return agent.invoke(user_input="go")
+
+        for invoke in (invoke_async, invoke_sync):
+            with self.subTest(invoke.__name__):
+                backend = ScriptedBackend(
+                    [
+                        [
+                            ScriptedBackend.tool_call("nap", {"x": 1}),
+                            ScriptedBackend.tool_call("nap", {"x": 2}),
+                        ],
+                        "done",
+                    ]
+                )
+                agent = Agent(
+                    llm=backend,
+                    tools=[tool],
+                    tool_executors=[ToolExecutor("serial", max_workers=1)],
+                    tool_execution="thread",
+                )
+                result = invoke(agent)
+                agent.close()
+
+                outputs = [
+                    item["output"]
+                    for item in backend.requests[-1]["input"]
+                    if item.get("type") == "function_call_output"
+                ]
+                self.assertTrue(all(name.startswith("literun-serial") for name in outputs))
+                calls = sorted(result.timings.tool_calls, key=lambda call: call.queue_wait)
+                self.assertLess(calls[0].queue_wait, 0.03)
+                self.assertGreaterEqual(calls[1].queue_wait, 0.03)
+                self.assertTrue(all(0.04 <= call.duration < 0.09 for call in calls))
+                self.assertAlmostEqual(
+                    result.timings.tool_queue_time, sum(call.queue_wait for call in calls)
+                )
+
+    def test_name_resolution(self):
+        """Verify names resolve against the agent, then the process registry."""
+        tool = make_tool(worker_name, ArgsSchema(name="x", type=int), executor="io")
+
+        def run(**kwargs):
+            backend = ScriptedBackend(
+                [[ScriptedBackend.tool_call("worker_name", {"x": 1})], "done"]
+            )
+            agent = Agent(llm=backend, tools=[tool], **kwargs)
+            asyncio.run(agent.ainvoke(user_input="go"))
+            agent.close()
+            return backend.requests[-1]["input"][-1]["output"]
+
+        # Unknown names are rejected when the agent is built
+        with self.assertRaisesRegex(ValidationError, "unknown tool executor 'io'"):
+            run()
+
+        register_tool_executor(ToolExecutor("io", max_workers=1))
+        self.assertTrue(run().startswith("literun-io"))
+
+        # The agent's executor shadows the process-wide one
+        own = ToolExecutor("io", max_workers=1)
+        used = []
+        own.submit = lambda func, **kwargs: used.append(func) or ToolExecutor.submit(
+            own, func, **kwargs
+        )
+        self.assertTrue(run(tool_executors=[own]).startswith("literun-io"))
+        self.assertEqual(used, [worker_name])
+
+    def test_invalid_configuration(self):
+        """Verify executors are only accepted where they apply."""
+        with self.assertRaises(ValidationError):
+            make_tool(thread_name, executor="io", execution_mode="inline")
+        with self.assertRaises(ValueError):
+            ToolExecutor("bad", max_workers=0)
+        with self.assertRaises(ValidationError):
+            Agent(
+                llm=ScriptedBackend([]),
+                tool_executors=[ToolExecutor("a"), ToolExecutor("a")],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
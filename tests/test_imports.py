@@ -0,0 +1,52 @@
+import sys
+import os
+import subprocess
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import literun
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([SRC, os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    return result.stdout.strip()
+
+
+class TestLazyImports(unittest.TestCase):
+    """
+    Unit tests for the lazily resolved package namespace.
+    """
+
+    def test_import_does_not_load_openai(self):
+        """Verify importing the package and building an agent defers openai."""
+        out = run_python(
+            "import sys, literun\n"
+            "from literun import Agent, Tool, ArgsSchema, ScriptedBackend\n"
+            "Agent(llm=ScriptedBackend(['hi']))\n"
+            "print('openai' in sys.modules)"
+        )
+        self.assertEqual(out, "False")
+
+    def test_all_public_names_resolve(self):
+        """Verify every name in __all__ can be imported."""
+        for name in literun.__all__:
+            self.assertIsNotNone(getattr(literun, name), name)
+        self.assertEqual(dir(literun), sorted(literun.__all__))
+
+    def test_unknown_name_raises(self):
+        """Verify unknown attributes raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            literun.DoesNotExist
+
+
+if __name__ == "__main__":
+    unittest.main()
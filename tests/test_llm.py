@@ -5,7 +5,10 @@ import unittest
 # Add the project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import asyncio
+
 from literun import ChatOpenAI, Tool, ArgsSchema
+from literun import llm as llm_module
 from literun.utils import extract_tool_calls
 
 
@@ -88,5 +91,95 @@ class TestChatOpenAI(unittest.TestCase):
             )
 
 
+class TestClientLifecycle(unittest.TestCase):
+    """
+    Unit tests for lazy and shared client construction.
+    """
+
+    def make_llm(self, **kwargs):
+        return ChatOpenAI(api_key="fake", base_url=f"http://{self.id()}/v1", **kwargs)
+
+    def test_clients_are_created_on_first_use(self):
+        """Verify no client is built until one is accessed."""
+        before = len(llm_module._shared_clients)
+        llm = self.make_llm()
+        self.make_llm(share_client=True)
+
+        self.assertIsNone(llm._client)
+        self.assertIsNone(llm._async_client)
+        self.assertEqual(len(llm_module._shared_clients), before)
+        self.assertIs(llm.client, llm.client)
+
+    def test_identical_configs_share_a_client(self):
+        """Verify instances with the same configuration share one client."""
+        a = self.make_llm(share_client=True)
+        b = self.make_llm(model="gpt-4o-mini", share_client=True)
+        self.assertIs(a.client, b.client)
+        self.assertIsNot(a.client, self.make_llm(timeout=5.0, share_client=True).client)
+        self.assertIsNot(a.client, self.make_llm().client)
+
+    def test_close_keeps_shared_clients_open(self):
+        """Verify closing an instance only closes clients it owns."""
+        shared, other = self.make_llm(share_client=True), self.make_llm(share_client=True)
+        client = shared.client
+        with shared:
+            pass
+        self.assertFalse(other.client.is_closed())
+
+        owned = self.make_llm()
+        own_client = owned.client
+        with owned:
+            pass
+        self.assertTrue(own_client.is_closed())
+        self.assertIsNot(owned.client, own_client)
+
+        ChatOpenAI.close_shared_clients()
+        self.assertTrue(client.is_closed())
+        self.assertIsNot(other.client, client)
+
+    def test_async_clients_are_per_event_loop(self):
+        """Verify shared async clients are reused within a loop, not across loops."""
+        llm = self.make_llm(share_client=True)
+
+        async def get_twice():
+            return llm.async_client, llm.async_client
+
+        first, again = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+
+    def test_async_clients_are_closed_with_their_loop(self):
+        """Verify a loop's shared async clients are closed and released at shutdown."""
+        llm = self.make_llm(share_client=True)
+
+        async def get_client():
+            await ChatOpenAI.aclose_shared_clients()
+            client = llm.async_client
+            self.assertFalse(client.is_closed())
+            return client
+
+        loop_count = len(llm_module._loop_guards)
+        client = asyncio.run(get_client())
+
+        self.assertTrue(client.is_closed())
+        self.assertNotIn(
+            client,
+            [c for clients in llm_module._shared_async_clients.values() for c in clients.values()],
+        )
+        self.assertEqual(len(llm_module._loop_guards), loop_count)
+
+        # A loop closed without shutting down its async generators is
+        # released by the next loop.
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(get_client())
+        loop.close()
+        self.assertIn(loop, llm_module._loop_guards)
+        asyncio.run(get_client())
+        self.assertNotIn(loop, llm_module._loop_guards)
+        self.assertNotIn(loop, llm_module._shared_async_clients)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -80,6 +80,59 @@ class TestPromptTemplates(unittest.TestCase):
         if "role" in output_msg:
             self.assertEqual(output_msg["role"], "tool")
 
+    def test_message_is_immutable_and_memoized(self):
+        """Verify messages cannot change and serialize only once."""
+        msg = PromptMessage(role="user", content_type="text", text="Hello")
+
+        with self.assertRaises(ValueError):
+            msg.text = "Changed"
+
+        self.assertIs(msg.convert_to_openai_message(), msg.convert_to_openai_message())
+
+    def test_incremental_serialization(self):
+        """Verify conversion only serializes the new tail of the history."""
+        template = PromptTemplate()
+        template.add_system("System prompt")
+        template.add_user("User prompt")
+
+        first = template.convert_to_openai_input()
+        template.add_assistant("Reply")
+        second = template.convert_to_openai_input()
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 3)
+        self.assertIs(second[0], first[0])
+        self.assertIs(second[1], first[1])
+        self.assertEqual(second[2]["role"], "assistant")
+
+    def test_messages_view_is_read_only(self):
+        """Verify `messages` reflects the history but cannot change it."""
+        template = PromptTemplate()
+        template.add_system("System prompt")
+        messages = template.messages
+
+        with self.assertRaises(TypeError):
+            messages[0] = messages[0]
+        self.assertFalse(hasattr(messages, "append"))
+
+        template.add_user("User prompt")
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[-1].role, "user")
+        self.assertEqual(messages[:1], [template.messages[0]])
+
+    def test_copy_shares_serialized_prefix(self):
+        """Verify copies share serialized messages but not history."""
+        template = PromptTemplate()
+        template.add_system("System prompt")
+        prefix = template.convert_to_openai_input()
+
+        clone = template.copy()
+        clone.add_user("Only in the clone")
+
+        self.assertEqual(len(template), 1)
+        self.assertEqual(len(clone), 2)
+        self.assertIs(clone.convert_to_openai_input()[0], prefix[0])
+
 
 if __name__ == "__main__":
     unittest.main()
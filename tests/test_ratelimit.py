@@ -0,0 +1,246 @@
+import sys
+import os
+import time
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseFailedEvent,
+    ResponseTextDeltaEvent,
+)
+
+from literun import ChatOpenAI, RateLimiter, ResponseCache
+
+
+def make_response(total_tokens):
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "status": "completed",
+            "output": [],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": total_tokens,
+                "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+                "output_tokens": 0,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": total_tokens,
+            },
+        }
+    )
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Unit tests for the token-bucket rate limiter.
+    """
+
+    def test_requires_a_limit(self):
+        """Verify a limiter needs at least one positive limit."""
+        with self.assertRaises(ValueError):
+            RateLimiter()
+        with self.assertRaises(ValueError):
+            RateLimiter(rpm=0)
+
+    def test_waits_when_budget_is_exhausted(self):
+        """Verify requests beyond the budget wait for the bucket to refill."""
+        limiter = RateLimiter(tpm=6000)  # 100 tokens per second
+
+        self.assertEqual(limiter.acquire(6000), 0.0)
+        start = time.perf_counter()
+        waited = limiter.acquire(10)
+        elapsed = time.perf_counter() - start
+
+        self.assertGreater(waited, 0.05)
+        self.assertGreaterEqual(elapsed, waited * 0.9)
+
+    def test_reconcile_returns_unused_tokens(self):
+        """Verify over-estimates are given back to the budget."""
+        limiter = RateLimiter(tpm=6000)
+        limiter.acquire(6000)
+        limiter.reconcile(6000, 100)
+
+        self.assertEqual(limiter.acquire(1000), 0.0)
+
+    def test_reconcile_is_capped_at_the_reservation(self):
+        """Verify an estimate above the limit only gives back what was reserved."""
+        limiter = RateLimiter(tpm=6000)
+        limiter.acquire(50_000)
+        limiter.reconcile(50_000, 1000)
+
+        self.assertAlmostEqual(limiter.available_tokens, 5000, delta=50)
+
+    def test_estimate_tokens(self):
+        """Verify the estimate covers the serialized input and max output."""
+        limiter = RateLimiter(tpm=1000, chars_per_token=4)
+        self.assertEqual(limiter.estimate_tokens({"input": "x" * 40}), 10)
+        self.assertEqual(
+            limiter.estimate_tokens({"input": "x" * 40, "max_output_tokens": 5}), 15
+        )
+
+    def test_shared_by_key(self):
+        """Verify the same key returns the same limiter."""
+        a = RateLimiter.shared("test-shared", rpm=100)
+        b = RateLimiter.shared("test-shared", rpm=100)
+        self.assertIs(a, b)
+        with self.assertRaises(ValueError):
+            RateLimiter.shared("test-shared", rpm=200)
+
+
+class TestChatOpenAIRateLimit(unittest.TestCase):
+    """
+    Unit tests for rate limiting in ChatOpenAI.
+    """
+
+    def test_usage_is_reconciled(self):
+        """Verify the reservation is corrected to the reported usage."""
+        limiter = RateLimiter(tpm=100_000)
+        llm = ChatOpenAI(api_key="fake", max_output_tokens=5000, rate_limiter=limiter)
+        llm.client.responses.create = lambda **params: make_response(100)
+
+        llm.invoke([{"role": "user", "content": "Hi"}])
+
+        self.assertAlmostEqual(limiter.available_tokens, 99_900, delta=5)
+
+    def test_stream_is_reconciled_on_completion(self):
+        """Verify streams reconcile when the completed event arrives."""
+        limiter = RateLimiter(tpm=100_000)
+        llm = ChatOpenAI(api_key="fake", max_output_tokens=5000, rate_limiter=limiter)
+        llm.client.responses.create = lambda **params: iter(
+            [
+                ResponseCompletedEvent(
+                    type="response.completed",
+                    response=make_response(300),
+                    sequence_number=0,
+                )
+            ]
+        )
+
+        stream = llm.chat(messages=[{"role": "user", "content": "Hi"}], stream=True)
+        self.assertLess(limiter.available_tokens, 97_000)
+        list(stream)
+
+        self.assertAlmostEqual(limiter.available_tokens, 99_700, delta=50)
+
+    def test_unfinished_streams_release_their_reservation(self):
+        """Verify failed, abandoned and broken streams give back their estimate."""
+        delta = ResponseTextDeltaEvent(
+            type="response.output_text.delta",
+            content_index=0,
+            delta="Hel",
+            item_id="msg_1",
+            logprobs=[],
+            output_index=0,
+            sequence_number=0,
+        )
+        failed = ResponseFailedEvent(
+            type="response.failed", response=make_response(200), sequence_number=1
+        )
+
+        def broken():
+            yield delta
+            raise RuntimeError("connection reset")
+
+        def abandon(stream):
+            next(stream)
+            stream.close()
+
+        cases = [
+            ("failed", lambda: iter([delta, failed]), list, 99_800),
+            ("abandoned", lambda: iter([delta, delta]), abandon, 100_000),
+            ("broken", broken, list, 100_000),
+        ]
+        for name, events, consume, expected in cases:
+            with self.subTest(name):
+                limiter = RateLimiter(tpm=100_000)
+                llm = ChatOpenAI(api_key="fake", max_output_tokens=5000, rate_limiter=limiter)
+                llm.client.responses.create = lambda **params: events()
+
+                stream = llm.chat(messages=[{"role": "user", "content": "Hi"}], stream=True)
+                try:
+                    consume(stream)
+                except RuntimeError:
+                    pass
+
+                self.assertAlmostEqual(limiter.available_tokens, expected, delta=50)
+
+    def test_cache_hits_are_free(self):
+        """Verify cached responses do not consume the budget."""
+        limiter = RateLimiter(rpm=60)
+        llm = ChatOpenAI(api_key="fake", cache=ResponseCache(), rate_limiter=limiter)
+        llm.client.responses.create = lambda **params: make_response(1)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        llm.invoke(messages)
+        llm.invoke(messages)
+
+        self.assertAlmostEqual(limiter.available_requests, 59, delta=0.1)
+
+    def test_failed_request_refunds_tokens(self):
+        """Verify tokens reserved for a failed request are given back."""
+        limiter = RateLimiter(tpm=100_000)
+        llm = ChatOpenAI(api_key="fake", max_output_tokens=5000, rate_limiter=limiter)
+
+        def fail(**params):
+            raise RuntimeError("network down")
+
+        llm.client.responses.create = fail
+        with self.assertRaises(RuntimeError):
+            llm.invoke([{"role": "user", "content": "Hi"}])
+
+        self.assertAlmostEqual(limiter.available_tokens, 100_000, delta=5)
+
+
+class TestAsyncRateLimit(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the asynchronous rate limiting path.
+    """
+
+    async def test_aacquire_waits(self):
+        """Verify async callers wait without blocking the loop."""
+        limiter = RateLimiter(rpm=600)  # 10 requests per second
+        llm = ChatOpenAI(api_key="fake", rate_limiter=limiter)
+
+        async def create(**params):
+            return make_response(1)
+
+        llm.async_client.responses.create = create
+        for _ in range(600):
+            limiter.acquire()
+
+        start = time.perf_counter()
+        await llm.ainvoke([{"role": "user", "content": "Hi"}])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.08)
+
+    async def test_broken_stream_releases_its_reservation(self):
+        """Verify an async stream that raises gives back its estimate."""
+        limiter = RateLimiter(tpm=100_000)
+        llm = ChatOpenAI(api_key="fake", max_output_tokens=5000, rate_limiter=limiter)
+
+        async def events():
+            raise RuntimeError("connection reset")
+            yield
+
+        async def create(**params):
+            return events()
+
+        llm.async_client.responses.create = create
+        stream = await llm.achat(messages=[{"role": "user", "content": "Hi"}], stream=True)
+        with self.assertRaises(RuntimeError):
+            async for _ in stream:
+                pass
+
+        self.assertAlmostEqual(limiter.available_tokens, 100_000, delta=50)
+
+
+if __name__ == "__main__":
+    unittest.main()
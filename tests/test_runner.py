@@ -0,0 +1,579 @@
+import sys
+import os
+import time
+import threading
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx
+from pydantic import PrivateAttr
+from openai import NotFoundError
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseOutputItemDoneEvent,
+)
+
+from literun import (
+    Agent,
+    Tool,
+    ArgsSchema,
+    ChatOpenAI,
+    PromptTemplate,
+    RunResultStreaming,
+    StreamChunk,
+)
+
+
+def function_call(call_id, name, arguments):
+    return {
+        "type": "function_call",
+        "id": f"fc_{call_id}",
+        "call_id": call_id,
+        "name": name,
+        "arguments": arguments,
+        "status": "completed",
+    }
+
+
+def message(text):
+    return {
+        "type": "message",
+        "id": "msg_1",
+        "role": "assistant",
+        "status": "completed",
+        "content": [{"type": "output_text", "text": text, "annotations": []}],
+    }
+
+
+def make_response(output, response_id="resp_1", usage=None):
+    return Response.model_validate(
+        {
+            "id": response_id,
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": usage,
+        }
+    )
+
+
+def usage(input_tokens, output_tokens, cached_tokens=0):
+    return {
+        "input_tokens": input_tokens,
+        "input_tokens_details": {"cached_tokens": cached_tokens, "cache_write_tokens": 0},
+        "output_tokens": output_tokens,
+        "output_tokens_details": {"reasoning_tokens": 0},
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+class ScriptedLLM(ChatOpenAI):
+    """A ChatOpenAI stand-in that replays scripted responses offline."""
+
+    _script: list[Response] = PrivateAttr(default_factory=list)
+    _requests: list[list] = PrivateAttr(default_factory=list)
+    _kwargs: list[dict] = PrivateAttr(default_factory=list)
+    _expired: set[str] = PrivateAttr(default_factory=set)
+
+    def script(self, *outputs) -> "ScriptedLLM":
+        self._script = [
+            make_response(output, f"resp_{index}")
+            for index, output in enumerate(outputs, start=1)
+        ]
+        return self
+
+    def _next(self, messages, stream, kwargs):
+        previous_response_id = kwargs.get("previous_response_id")
+        if previous_response_id in self._expired:
+            raise NotFoundError(
+                "Previous response not found",
+                response=httpx.Response(
+                    404, request=httpx.Request("POST", "https://api.openai.com")
+                ),
+                body=None,
+            )
+        if isinstance(messages, PromptTemplate):
+            messages = messages.convert_to_openai_input()
+        self._requests.append(messages)
+        self._kwargs.append(kwargs)
+        response = self._script.pop(0)
+        if not stream:
+            return response
+        events = [
+            ResponseOutputItemDoneEvent(
+                type="response.output_item.done",
+                item=item,
+                output_index=index,
+                sequence_number=index,
+            )
+            for index, item in enumerate(response.output)
+        ]
+        events.append(
+            ResponseCompletedEvent(
+                type="response.completed",
+                response=response,
+                sequence_number=len(events),
+            )
+        )
+        return events
+
+    def chat(self, *, messages, stream=False, **kwargs):
+        result = self._next(messages, stream, kwargs)
+        return iter(result) if stream else result
+
+    async def achat(self, *, messages, stream=False, **kwargs):
+        result = self._next(messages, stream, kwargs)
+        if not stream:
+            return result
+
+        async def events():
+            for event in result:
+                yield event
+
+        return events()
+
+
+def slow_tool(name, delay):
+    async def run(x: str) -> str:
+        await asyncio.sleep(delay)
+        return f"{name}:{x}"
+
+    return Tool(
+        name=name,
+        description=name,
+        coroutine=run,
+        args_schema=[ArgsSchema(name="x", type=str)],
+    )
+
+
+def blocking_tool(name, delay, **kwargs):
+    def run(x: str) -> str:
+        time.sleep(delay)
+        if x == "boom":
+            raise RuntimeError("boom")
+        return f"{name}:{x}"
+
+    return Tool(
+        name=name,
+        description=name,
+        func=run,
+        args_schema=[ArgsSchema(name="x", type=str)],
+        **kwargs,
+    )
+
+
+class TestThreadPoolTools(unittest.TestCase):
+    """
+    Unit tests for executor-backed tool execution in the sync runners.
+    """
+
+    def make_agent(self, third_arg="3", slow_mode="thread", **kwargs):
+        llm = ScriptedLLM(api_key="fake").script(
+            [
+                function_call("c1", "slow", '{"x": "1"}'),
+                function_call("c2", "fast", '{"x": "2"}'),
+                function_call("c3", "slow", '{"x": "%s"}' % third_arg),
+            ],
+            [message("done")],
+        )
+        tools = [
+            blocking_tool("slow", 0.2, execution_mode=slow_mode),
+            blocking_tool("fast", 0.05),
+        ]
+        return Agent(llm=llm, tools=tools, **kwargs)
+
+    def test_sequential_by_default(self):
+        """Verify the sync runner keeps running tools inline by default."""
+        agent = self.make_agent()
+
+        start = time.perf_counter()
+        agent.invoke(user_input="go")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.45)
+        self.assertIsNone(agent._owned_executor)
+
+    def test_inline_tools_stay_in_the_caller_thread(self):
+        """Verify `inline` tools are not dispatched to the pool."""
+        threads = {}
+
+        def record(name, mode):
+            def run(x: str) -> str:
+                threads[x] = threading.current_thread()
+                return x
+
+            return Tool(
+                name=name,
+                func=run,
+                args_schema=[ArgsSchema(name="x", type=str)],
+                execution_mode=mode,
+            )
+
+        llm = ScriptedLLM(api_key="fake").script(
+            [
+                function_call("c1", "inline", '{"x": "1"}'),
+                function_call("c2", "pooled", '{"x": "2"}'),
+            ],
+            [message("done")],
+        )
+        agent = Agent(
+            llm=llm,
+            tools=[record("inline", "inline"), record("pooled", "thread")],
+            tool_execution="thread",
+        )
+        agent.invoke(user_input="go")
+        agent.close()
+
+        self.assertIs(threads["1"], threading.current_thread())
+        self.assertIsNot(threads["2"], threading.current_thread())
+
+    def test_invoke_thread_mode(self):
+        """Verify thread mode overlaps tools and keeps outputs in call order."""
+        agent = self.make_agent(tool_execution="thread")
+
+        start = time.perf_counter()
+        result = agent.invoke(user_input="go")
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(result.final_output, "done")
+
+        second_request = agent.llm._requests[1]
+        outputs = [m["output"] for m in second_request if m.get("type") == "function_call_output"]
+        self.assertEqual(outputs, ["slow:1", "fast:2", "slow:3"])
+        agent.close()
+        self.assertIsNone(agent._owned_executor)
+
+    def test_shared_executor_and_errors(self):
+        """Verify a shared executor is used and tool errors become strings."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            agent = self.make_agent(
+                third_arg="boom", tool_execution="thread", tool_executor=executor
+            )
+            self.assertIs(agent.get_tool_executor(), executor)
+
+            result = agent.invoke(user_input="go")
+
+        outputs = [
+            item.content for item in result.new_items if item.type == "tool_call_output_item"
+        ]
+        self.assertEqual(outputs[:2], ["slow:1", "fast:2"])
+        self.assertEqual(outputs[2], "Error executing tool 'slow': boom")
+
+    def test_stream_thread_mode(self):
+        """Verify streaming events in thread mode report each tool's progress."""
+        agent = self.make_agent(tool_execution="thread")
+
+        events = []
+        for result in agent.stream(user_input="go"):
+            event = result.event
+            if event.type == "response.function_call_output_item.done":
+                events.append(event.item.call_id)
+
+        self.assertEqual(events[0], "c2")
+        self.assertEqual(sorted(events), ["c1", "c2", "c3"])
+        agent.close()
+
+
+class TestAsyncParallelTools(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for concurrent tool execution in the async runners.
+    """
+
+    def make_agent(self, **kwargs):
+        llm = ScriptedLLM(api_key="fake").script(
+            [
+                function_call("c1", "slow", '{"x": "1"}'),
+                function_call("c2", "fast", '{"x": "2"}'),
+                function_call("c3", "slow", '{"x": "3"}'),
+            ],
+            [message("done")],
+        )
+        tools = [slow_tool("slow", 0.2), slow_tool("fast", 0.05)]
+        return Agent(llm=llm, tools=tools, **kwargs)
+
+    async def test_ainvoke_runs_tools_concurrently(self):
+        """Verify a turn's tool calls overlap instead of running back to back."""
+        agent = self.make_agent()
+
+        start = time.perf_counter()
+        result = await agent.ainvoke(user_input="go")
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(result.final_output, "done")
+        self.assertLess(elapsed, 0.4)
+
+        # Outputs are appended in call order, not completion order
+        second_request = agent.llm._requests[1]
+        outputs = [m["output"] for m in second_request if m.get("type") == "function_call_output"]
+        self.assertEqual(outputs, ["slow:1", "fast:2", "slow:3"])
+
+    async def test_concurrency_limit(self):
+        """Verify `max_concurrent_tool_calls` bounds the number of tools in flight."""
+        agent = self.make_agent(max_concurrent_tool_calls=1)
+
+        start = time.perf_counter()
+        await agent.ainvoke(user_input="go")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.45)
+
+    async def test_sequential_when_parallel_disabled(self):
+        """Verify tools run one at a time when `parallel_tool_calls` is False."""
+        agent = self.make_agent(parallel_tool_calls=False)
+
+        start = time.perf_counter()
+        await agent.ainvoke(user_input="go")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.45)
+
+    async def test_astream_emits_events_as_tools_progress(self):
+        """Verify added/done events fire as each tool starts and finishes."""
+        agent = self.make_agent()
+
+        events = []
+        async for result in agent.astream(user_input="go"):
+            event = result.event
+            if event.type.startswith("response.function_call_output_item"):
+                events.append((event.type.rsplit(".", 1)[-1], event.item.call_id))
+
+        self.assertEqual(
+            events[:3], [("added", "c1"), ("added", "c2"), ("added", "c3")]
+        )
+        self.assertEqual(events[3], ("done", "c2"))
+
+        second_request = agent.llm._requests[1]
+        call_ids = [m["call_id"] for m in second_request if "call_id" in m]
+        self.assertEqual(call_ids, ["c1", "c1", "c2", "c2", "c3", "c3"])
+
+
+class TestResponseChaining(unittest.TestCase):
+    """
+    Unit tests for `chain_responses` mode.
+    """
+
+    def make_agent(self, **kwargs):
+        llm = ScriptedLLM(api_key="fake").script(
+            [function_call("c1", "fast", '{"x": "1"}')],
+            [function_call("c2", "fast", '{"x": "2"}')],
+            [message("done")],
+        )
+        return Agent(
+            llm=llm,
+            system_prompt="System",
+            tools=[blocking_tool("fast", 0)],
+            chain_responses=True,
+            **kwargs,
+        )
+
+    def test_only_new_items_are_sent(self):
+        """Verify chained iterations send only tool outputs after the first."""
+        agent = self.make_agent()
+
+        result = agent.invoke(user_input="go")
+
+        self.assertEqual(result.final_output, "done")
+        requests, kwargs = agent.llm._requests, agent.llm._kwargs
+        self.assertEqual(len(requests[0]), 2)
+        self.assertTrue(all(k["store"] for k in kwargs))
+        self.assertNotIn("previous_response_id", kwargs[0])
+
+        self.assertEqual(kwargs[1]["previous_response_id"], "resp_1")
+        self.assertEqual(
+            requests[1],
+            [{"type": "function_call_output", "call_id": "c1", "output": "fast:1"}],
+        )
+        self.assertEqual(kwargs[2]["previous_response_id"], "resp_2")
+        self.assertEqual([m["call_id"] for m in requests[2]], ["c2"])
+
+    def test_stream_chains_from_completed_event(self):
+        """Verify streaming runs pick up the response ID from `response.completed`."""
+        agent = self.make_agent()
+
+        list(agent.stream(user_input="go"))
+
+        self.assertEqual(agent.llm._kwargs[1]["previous_response_id"], "resp_1")
+        self.assertEqual(len(agent.llm._requests[1]), 1)
+
+    def test_falls_back_to_full_replay(self):
+        """Verify an expired chain replays the full history."""
+        agent = self.make_agent()
+        agent.llm._expired.add("resp_1")
+
+        result = agent.invoke(user_input="go")
+
+        self.assertEqual(result.final_output, "done")
+        requests, kwargs = agent.llm._requests, agent.llm._kwargs
+        self.assertNotIn("previous_response_id", kwargs[1])
+        self.assertEqual(len(requests[1]), 4)
+        # The chain restarts from the replayed response
+        self.assertEqual(kwargs[2]["previous_response_id"], "resp_2")
+        self.assertEqual(len(requests[2]), 1)
+
+
+class GappedLLM(ScriptedLLM):
+    """Streams scripted events with a pause between output items."""
+
+    _gap: float = PrivateAttr(default=0.1)
+
+    async def achat(self, *, messages, stream=False, **kwargs):
+        result = self._next(messages, stream, kwargs)
+
+        async def events():
+            for event in result:
+                if event.type == "response.output_item.done" and event.output_index:
+                    await asyncio.sleep(self._gap)
+                yield event
+
+        return events()
+
+
+class TestEagerToolExecution(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for `eager_tool_execution` in async streaming.
+    """
+
+    def make_agent(self, eager):
+        llm = GappedLLM(api_key="fake").script(
+            [
+                function_call("c1", "slow", '{"x": "1"}'),
+                function_call("c2", "fast", '{"x": "2"}'),
+                message("working"),
+            ],
+            [message("done")],
+        )
+        return Agent(
+            llm=llm,
+            tools=[slow_tool("slow", 0.2), slow_tool("fast", 0.01)],
+            eager_tool_execution=eager,
+        )
+
+    async def test_tools_overlap_with_generation(self):
+        """Verify tools start before the response stream ends."""
+        agent = self.make_agent(eager=True)
+
+        start = time.perf_counter()
+        types = [r.event.type async for r in agent.astream(user_input="go")]
+        elapsed = time.perf_counter() - start
+
+        # Stream gaps (0.2s) and the slow tool (0.2s) overlap
+        self.assertLess(elapsed, 0.35)
+        first_tool = types.index("response.function_call_output_item.added")
+        self.assertLess(first_tool, types.index("response.completed"))
+        self.assertEqual(types.count("response.function_call_output_item.done"), 2)
+
+    async def test_prompt_order_is_deterministic(self):
+        """Verify tool outputs are appended in call order, not completion order."""
+        agent = self.make_agent(eager=True)
+
+        results = [r async for r in agent.astream(user_input="go")]
+
+        self.assertEqual(results[-1].final_output, "done")
+        second_request = agent.llm._requests[1]
+        self.assertEqual(
+            [m.get("type") or m.get("role") for m in second_request],
+            [
+                "user",
+                "assistant",
+                "function_call",
+                "function_call_output",
+                "function_call",
+                "function_call_output",
+            ],
+        )
+        self.assertEqual(second_request[3]["output"], "slow:1")
+        self.assertEqual(second_request[5]["output"], "fast:2")
+
+    async def test_lazy_by_default(self):
+        """Verify tools wait for the stream to end unless eager mode is enabled."""
+        agent = self.make_agent(eager=False)
+
+        types = [r.event.type async for r in agent.astream(user_input="go")]
+
+        first_tool = types.index("response.function_call_output_item.added")
+        self.assertGreater(first_tool, types.index("response.completed"))
+
+
+class TestRunUsage(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for usage and timing accounting on run results.
+    """
+
+    def make_agent(self):
+        llm = ScriptedLLM(api_key="fake")
+        llm._script = [
+            make_response(
+                [function_call("c1", "slow", '{"x": "1"}')], "resp_1", usage(100, 10, 80)
+            ),
+            make_response([message("done")], "resp_2", usage(150, 5)),
+        ]
+        return Agent(llm=llm, tools=[blocking_tool("slow", 0.05)])
+
+    def test_invoke_aggregates_usage_and_timings(self):
+        """Verify usage is summed over iterations and each step is timed."""
+        result = self.make_agent().invoke(user_input="go")
+
+        self.assertEqual(result.usage.requests, 2)
+        self.assertEqual(result.usage.input_tokens, 250)
+        self.assertEqual(result.usage.cached_tokens, 80)
+        self.assertEqual(result.usage.output_tokens, 15)
+        self.assertEqual(result.usage.total_tokens, 265)
+
+        timings = result.timings
+        self.assertEqual([call.iteration for call in timings.llm_calls], [0, 1])
+        self.assertIsNone(timings.time_to_first_token)
+        self.assertEqual(timings.tool_calls[0].name, "slow")
+        self.assertGreaterEqual(timings.tool_calls[0].duration, 0.05)
+        self.assertGreaterEqual(timings.total, timings.tool_time)
+
+    async def test_stream_ends_with_summary_event(self):
+        """Verify streaming runs finish with a `run.completed` summary."""
+        results = [r async for r in self.make_agent().astream(user_input="go")]
+
+        summary = results[-1].event
+        self.assertEqual(summary.type, "run.completed")
+        self.assertEqual(summary.final_output, "done")
+        self.assertEqual(summary.usage.total_tokens, 265)
+        self.assertEqual(len(summary.timings.llm_calls), 2)
+        self.assertEqual(len(summary.timings.tool_calls), 1)
+
+
+class TestFastStreaming(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the lightweight `fast` streaming mode.
+    """
+
+    def make_agent(self):
+        llm = ScriptedLLM(api_key="fake").script(
+            [function_call("c1", "fast", '{"x": "1"}')],
+            [message("done")],
+        )
+        return Agent(llm=llm, tools=[blocking_tool("fast", 0)])
+
+    def test_same_events_as_validated_mode(self):
+        """Verify fast mode yields the same events and outputs as the default."""
+        validated = list(self.make_agent().stream(user_input="go"))
+        fast = list(self.make_agent().stream(user_input="go", fast=True))
+
+        self.assertTrue(all(isinstance(r, RunResultStreaming) for r in validated))
+        self.assertTrue(all(isinstance(r, StreamChunk) for r in fast))
+        self.assertEqual([r.event.type for r in fast], [r.event.type for r in validated])
+        self.assertEqual(
+            [r.final_output for r in fast], [r.final_output for r in validated]
+        )
+
+    async def test_async_fast_mode(self):
+        """Verify the async runner supports fast mode."""
+        results = [
+            r async for r in self.make_agent().astream(user_input="go", fast=True)
+        ]
+
+        self.assertTrue(all(isinstance(r, StreamChunk) for r in results))
+        self.assertEqual(results[-1].input, "go")
+        self.assertEqual(results[-3].event.item.content[0].text, "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,10 @@ import unittest
 # Add the project root to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from literun import Tool, ArgsSchema, ToolRuntime, Agent, ChatOpenAI
+import time
+import asyncio
+
+from literun import Tool, ArgsSchema, ToolRuntime, ToolCachePolicy, Agent, ChatOpenAI
 from literun.runner import Runner
 
 
@@ -43,6 +46,69 @@ class TestToolDefinition(unittest.TestCase):
         self.assertIn("b", props)
         self.assertEqual(props["a"]["type"], "integer")
 
+    def test_openai_tool_definition_is_cached(self):
+        """Verify the tool definition is built once and rebuilt on change."""
+        tool = Tool(
+            func=lambda a: a,
+            name="cached",
+            description="Before",
+            args_schema=[ArgsSchema(name="a", type=int, description="Argument a")],
+        )
+
+        first = tool.convert_to_openai_tool()
+        self.assertIs(tool.convert_to_openai_tool(), first)
+
+        tool.description = "After"
+        second = tool.convert_to_openai_tool()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["description"], "After")
+
+    def test_compiled_tool_list_is_reused(self):
+        """Verify agents and bound LLMs compile their tool list once."""
+        tools = [
+            Tool(func=lambda: "a", name="a", description="A"),
+            Tool(func=lambda: "b", name="b", description="B"),
+        ]
+        llm = ChatOpenAI(api_key="fake")
+        agent = Agent(llm=llm, tools=tools)
+
+        compiled = agent._tool_set.definitions()
+        self.assertEqual([d["name"] for d in compiled], ["a", "b"])
+        params = llm._prepare_request_params(
+            messages=[], stream=False, tools=agent._tool_set, tool_choice="auto", parallel_tool_calls=True
+        )
+        self.assertIs(params["tools"], compiled)
+
+        llm.bind_tools(tools=tools)
+        bound = llm._prepare_request_params(
+            messages=[], stream=False, tools=None, tool_choice=None, parallel_tool_calls=None
+        )["tools"]
+        self.assertIs(llm._prepare_request_params(
+            messages=[], stream=False, tools=None, tool_choice=None, parallel_tool_calls=None
+        )["tools"], bound)
+
+        # Changing an unrelated tool keeps the list; changing one of ours rebuilds it
+        Tool(func=lambda: "c", name="c").description = "C"
+        self.assertIs(agent._tool_set.definitions(), compiled)
+        tools[1].name = "renamed"
+        recompiled = agent._tool_set.definitions()
+        self.assertIsNot(recompiled, compiled)
+        self.assertEqual(recompiled[1]["name"], "renamed")
+        self.assertEqual(llm._prepare_request_params(
+            messages=[], stream=False, tools=None, tool_choice=None, parallel_tool_calls=None
+        )["tools"][1]["name"], "renamed")
+
+        # In-place schema edits are picked up after refresh_openai_tool
+        tools[0].args_schema = [ArgsSchema(name="x", type=int)]
+        tools[0].args_schema[0].description = "An x"
+        tools[0].refresh_openai_tool()
+        props = agent._tool_set.definitions()[0]["parameters"]["properties"]
+        self.assertEqual(props["x"]["description"], "An x")
+
+        # Copies rebuild their own definition
+        copy = tools[0].model_copy()
+        self.assertEqual(copy.convert_to_openai_tool()["name"], "a")
+
     def test_argument_resolution_and_coercion(self):
         """Verify that the tool correctly validates and converts argument types."""
 
@@ -154,6 +220,75 @@ class TestRuntimeContext(unittest.TestCase):
         self.assertEqual(result, "Not found")
 
 
+class TestToolResultCache(unittest.TestCase):
+    """
+    Unit tests for tool result memoization.
+    """
+
+    def make_tool(self, calls, policy):
+        def geocode(city: str) -> str:
+            calls.append(city)
+            return f"coords({city})"
+
+        return Tool(
+            name="geocode",
+            description="Geocode a city",
+            func=geocode,
+            args_schema=[ArgsSchema(name="city", type=str, description="City")],
+            cache_policy=policy,
+        )
+
+    def test_repeated_calls_hit_cache(self):
+        """Verify repeated calls return the cached result without running the tool."""
+        calls = []
+        tool = self.make_tool(calls, ToolCachePolicy())
+
+        self.assertEqual(tool.run({"city": "Paris"}), "coords(Paris)")
+        self.assertEqual(tool.run({"city": "Paris"}), "coords(Paris)")
+        tool.run({"city": "Rome"})
+
+        self.assertEqual(calls, ["Paris", "Rome"])
+        info = tool.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_cache_shared_across_agents(self):
+        """Verify agents sharing a tool share its cache, including async runs."""
+        calls = []
+        tool = self.make_tool(calls, ToolCachePolicy())
+        first = Agent(llm=ChatOpenAI(api_key="fake"), tools=[tool])
+        second = Agent(llm=ChatOpenAI(api_key="fake"), tools=[tool])
+
+        Runner._run_tool(first, "geocode", '{"city": "Oslo"}')
+        output = asyncio.run(Runner._arun_tool(second, "geocode", '{"city": "Oslo"}'))
+
+        self.assertEqual(output, "coords(Oslo)")
+        self.assertEqual(calls, ["Oslo"])
+
+    def test_ttl_and_key_func(self):
+        """Verify results expire after the TTL and key_func controls the key."""
+        calls = []
+        policy = ToolCachePolicy(ttl=0.05, key_func=lambda args: args["city"].lower())
+        tool = self.make_tool(calls, policy)
+
+        tool.run({"city": "Paris"})
+        tool.run({"city": "PARIS"})
+        time.sleep(0.06)
+        tool.run({"city": "paris"})
+
+        self.assertEqual(calls, ["Paris", "paris"])
+
+    def test_opt_out(self):
+        """Verify side-effecting tools can opt out of caching."""
+        calls = []
+        tool = self.make_tool(calls, ToolCachePolicy(enabled=False))
+
+        tool.run({"city": "Paris"})
+        tool.run({"city": "Paris"})
+
+        self.assertEqual(calls, ["Paris", "Paris"])
+        self.assertEqual(tool.cache_info().hits, 0)
+
+
 class TestFutureAnnotations(unittest.TestCase):
     """
     Verify compatibility with 'from __future__ import annotations'.
@@ -0,0 +1,304 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import unittest
+import itertools
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.responses import Response
+
+from literun import Agent, Tool, ArgsSchema, ChatOpenAI, ScriptedBackend
+from literun import tracing
+from literun.tracing import ChromeTraceExporter, Tracer
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    HAS_OTEL = True
+except ImportError:
+    HAS_OTEL = False
+
+
+def make_response(output, response_id):
+    return Response.model_validate(
+        {
+            "id": response_id,
+            "created_at": 0,
+            "model": "gpt-4o",
+            "object": "response",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": 10,
+                "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+                "output_tokens": 2,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": 12,
+            },
+        }
+    )
+
+
+def tool_calls(*names):
+    return [
+        {
+            "type": "function_call",
+            "id": f"fc_{index}",
+            "call_id": f"call_{index}",
+            "name": name,
+            "arguments": '{"x": "1"}',
+            "status": "completed",
+        }
+        for index, name in enumerate(names)
+    ]
+
+
+FINAL = [
+    {
+        "type": "message",
+        "id": "msg_1",
+        "role": "assistant",
+        "status": "completed",
+        "content": [{"type": "output_text", "text": "done", "annotations": []}],
+    }
+]
+
+
+def make_tool(name, delay=0.0, fail=False):
+    async def run(x: str) -> str:
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError("tool failed")
+        return x
+
+    def run_sync(x: str) -> str:
+        if fail:
+            raise ValueError("tool failed")
+        return x
+
+    return Tool(
+        name=name,
+        description=name,
+        func=run_sync,
+        coroutine=run,
+        args_schema=[ArgsSchema(name="x", type=str)],
+    )
+
+
+def make_agent(first_output, tools):
+    llm = ChatOpenAI(api_key="fake")
+    agent = Agent(llm=llm, tools=tools)
+    script = [make_response(first_output, "resp_1"), make_response(FINAL, "resp_2")]
+
+    def create(**params):
+        return script.pop(0)
+
+    async def acreate(**params):
+        return script.pop(0)
+
+    agent.llm.client.responses.create = create
+    agent.llm.async_client.responses.create = acreate
+    return agent
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+class TestTracing(unittest.TestCase):
+    """
+    Unit tests for tracing hooks.
+    """
+
+    def setUp(self):
+        self.tracer = RecordingTracer()
+        self.previous = tracing.set_tracer(self.tracer)
+
+    def tearDown(self):
+        tracing.set_tracer(self.previous)
+
+    def test_disabled_is_noop(self):
+        """Verify no spans are created without a tracer."""
+        tracing.set_tracer(None)
+        self.assertIsNone(tracing.start_span("x", lambda: self.fail("called")))
+        with tracing.span("x") as span:
+            self.assertIsNone(span)
+
+    def test_spans_for_run_llm_and_tools(self):
+        """Verify runs, model calls and tool calls are traced and nested."""
+        agent = make_agent(
+            tool_calls("echo", "boom"), [make_tool("echo"), make_tool("boom", fail=True)]
+        )
+
+        agent.invoke(user_input="go")
+
+        names = [span.name for span in self.tracer.ended]
+        self.assertEqual(
+            names, ["llm.chat", "tool.run", "tool.run", "llm.chat", "agent.run"]
+        )
+        run = self.tracer.ended[-1]
+        self.assertIsNone(run.parent)
+        self.assertTrue(all(span.parent is run for span in self.tracer.ended[:-1]))
+
+        self.assertEqual(run.attributes["agent.iterations"], 2)
+        self.assertEqual(run.attributes["usage.total_tokens"], 24)
+        llm = self.tracer.ended[0]
+        self.assertEqual(llm.attributes["llm.response_id"], "resp_1")
+        self.assertEqual(llm.attributes["usage.output_tokens"], 2)
+
+        echo, boom = self.tracer.ended[1:3]
+        self.assertEqual(echo.attributes["tool.name"], "echo")
+        self.assertIsNone(echo.error)
+        self.assertIsInstance(boom.error, ValueError)
+
+    def test_run_error_is_recorded(self):
+        """Verify a failing run ends its span with the error."""
+        agent = make_agent(FINAL, [])
+
+        def fail(**params):
+            raise RuntimeError("api down")
+
+        agent.llm.client.responses.create = fail
+        with self.assertRaises(RuntimeError):
+            agent.invoke(user_input="go")
+
+        spans = self.tracer.ended
+        self.assertEqual([span.name for span in spans], ["llm.chat", "agent.run"])
+        self.assertTrue(all(isinstance(span.error, RuntimeError) for span in spans))
+        self.assertIsNone(tracing.current_span())
+
+    def make_streaming_agent(self):
+        backend = ScriptedBackend(
+            [[ScriptedBackend.tool_call("echo", {"x": "1"})], "done"], chars_per_delta=1
+        )
+        return Agent(llm=backend, tools=[make_tool("echo")])
+
+    def assert_runs_nested(self, consumer, runs=2):
+        spans = self.tracer.ended
+        run_spans = [span for span in spans if span.name == "agent.run"]
+        self.assertEqual(len(run_spans), runs)
+        self.assertTrue(all(span.parent is consumer for span in run_spans))
+        for run in run_spans:
+            # ScriptedBackend does not trace its calls
+            children = [span.name for span in spans if span.parent is run]
+            self.assertEqual(children, ["tool.run"])
+
+    def test_stream_span_is_current_only_inside_the_run(self):
+        """Verify interleaved streams keep their spans out of the consumer's context."""
+        first = self.make_streaming_agent().stream(user_input="go")
+        second = self.make_streaming_agent().stream(user_input="go")
+
+        with tracing.span("consumer") as consumer:
+            for pair in itertools.zip_longest(first, second):
+                self.assertIs(tracing.current_span(), consumer)
+                with tracing.span("between") as between:
+                    self.assertIs(between.parent, consumer)
+        self.assert_runs_nested(consumer)
+
+    def test_abandoned_stream_ends_its_span(self):
+        """Verify closing a stream early ends its span without leaking it."""
+        stream = self.make_streaming_agent().stream(user_input="go")
+        next(stream)
+        self.assertIsNone(tracing.current_span())
+        stream.close()
+        self.assertEqual([span.name for span in self.tracer.ended], ["agent.run"])
+        self.assertIsNone(tracing.current_span())
+
+    def test_async_streams_are_isolated(self):
+        """Verify interleaved async streams keep their spans out of the consumer's context."""
+
+        async def main():
+            first = self.make_streaming_agent().astream(user_input="go")
+            second = self.make_streaming_agent().astream(user_input="go")
+            with tracing.span("consumer") as consumer:
+                pending = [first, second]
+                while pending:
+                    for stream in list(pending):
+                        try:
+                            await stream.__anext__()
+                        except StopAsyncIteration:
+                            pending.remove(stream)
+                        self.assertIs(tracing.current_span(), consumer)
+            return consumer
+
+        self.assert_runs_nested(asyncio.run(main()))
+
+
+class TestChromeTraceExporter(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the Chrome trace-event exporter.
+    """
+
+    async def test_parallel_tools_get_separate_lanes(self):
+        """Verify concurrent tool calls show up as overlapping events on separate lanes."""
+        exporter = ChromeTraceExporter()
+        previous = tracing.set_tracer(exporter)
+        try:
+            agent = make_agent(
+                tool_calls("a", "b"), [make_tool("a", 0.05), make_tool("b", 0.05)]
+            )
+            await agent.ainvoke(user_input="go")
+        finally:
+            tracing.set_tracer(previous)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            exporter.export(path)
+            with open(path) as f:
+                events = json.load(f)["traceEvents"]
+
+        tools = [e for e in events if e["ph"] == "X" and e["name"] == "tool.run"]
+        self.assertEqual(len(tools), 2)
+        first, second = sorted(tools, key=lambda e: e["ts"])
+        self.assertNotEqual(first["tid"], second["tid"])
+        self.assertLess(second["ts"], first["ts"] + first["dur"])
+        self.assertEqual(first["cat"], "tool")
+
+
+@unittest.skipUnless(HAS_OTEL, "opentelemetry-sdk not installed")
+class TestOpenTelemetryTracer(unittest.TestCase):
+    """
+    Unit tests for the OpenTelemetry adapter.
+    """
+
+    def test_spans_are_exported_with_parents(self):
+        """Verify spans are forwarded to OpenTelemetry with their hierarchy."""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        previous = tracing.set_tracer(
+            tracing.OpenTelemetryTracer(provider.get_tracer("test"))
+        )
+        try:
+            make_agent(tool_calls("echo"), [make_tool("echo")]).invoke(user_input="go")
+        finally:
+            tracing.set_tracer(previous)
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        run = spans["agent.run"]
+        self.assertEqual(spans["tool.run"].parent.span_id, run.context.span_id)
+        self.assertEqual(spans["tool.run"].attributes["tool.name"], "echo")
+        self.assertEqual(run.attributes["usage.total_tokens"], 24)
+        self.assertNotIn("llm.previous_response_id", spans["llm.chat"].attributes)
+
+
+if __name__ == "__main__":
+    unittest.main()